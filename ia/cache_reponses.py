@@ -0,0 +1,82 @@
+# Cache LRU des réponses du mode démo
+# Une grande partie du trafic est faite de quelques centaines de messages presque
+# identiques ("bonjour", "c'est quoi un verbe ?") : la réponse est mémorisée par
+# message normalisé, dans une limite en nombre d'entrées et en octets.
+
+import threading
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """Cache LRU borné en nombre d'entrées et en octets, avec compteurs de succès/échecs/évictions"""
+
+    def __init__(self, max_entrees=512, max_octets=4 * 1024 * 1024):
+        self.max_entrees = max_entrees
+        self.max_octets = max_octets
+        self.entrees = OrderedDict()
+        self.octets = 0
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.contournements = 0
+        self.verrou = threading.Lock()
+
+    @staticmethod
+    def taille(cle, valeur):
+        """Taille approximative d'une entrée en octets (chaînes de la clé et de la valeur en UTF-8)"""
+        parties = valeur if isinstance(valeur, tuple) else (valeur,)
+        return len(cle.encode('utf-8')) + sum(len(p.encode('utf-8')) for p in parties if isinstance(p, str))
+
+    def obtenir(self, cle):
+        """Retourne la valeur mémorisée (et la marque comme récente) ou None"""
+        with self.verrou:
+            entree = self.entrees.get(cle)
+            if entree is None:
+                self.echecs += 1
+                return None
+            self.entrees.move_to_end(cle)
+            self.succes += 1
+            return entree[0]
+
+    def stocker(self, cle, valeur):
+        """Mémorise une valeur puis évince les entrées les plus anciennes si les limites sont dépassées"""
+        taille = self.taille(cle, valeur)
+        if taille > self.max_octets:
+            return
+        with self.verrou:
+            ancienne = self.entrees.pop(cle, None)
+            if ancienne is not None:
+                self.octets -= ancienne[1]
+            self.entrees[cle] = (valeur, taille)
+            self.octets += taille
+            while len(self.entrees) > self.max_entrees or self.octets > self.max_octets:
+                _, (_, taille_evincee) = self.entrees.popitem(last=False)
+                self.octets -= taille_evincee
+                self.evictions += 1
+
+    def contourner(self):
+        """Compte une requête servie sans passer par le cache (réponse personnalisée)"""
+        with self.verrou:
+            self.contournements += 1
+
+    def vider(self):
+        """Supprime toutes les entrées (les compteurs sont conservés)"""
+        with self.verrou:
+            self.entrees.clear()
+            self.octets = 0
+
+    def statistiques(self):
+        """Retourne l'état du cache et ses compteurs"""
+        with self.verrou:
+            total = self.succes + self.echecs
+            return {
+                'entrees': len(self.entrees),
+                'octets': self.octets,
+                'max_entrees': self.max_entrees,
+                'max_octets': self.max_octets,
+                'succes': self.succes,
+                'echecs': self.echecs,
+                'evictions': self.evictions,
+                'contournements': self.contournements,
+                'taux_succes': round(self.succes / total, 4) if total else 0.0,
+            }
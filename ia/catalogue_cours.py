@@ -0,0 +1,107 @@
+# Catalogue des cours pour l'API REST (/courses, /courses/<niveau>, /courses/<niveau>/<sujet>)
+# Le frontend et l'application mobile hors ligne lisent les cours directement, sans passer
+# par /chat et son routage. Chaque réponse de l'API est construite une seule fois à partir
+# des index de cours (index_cours.py) : encodée en JSON, compressée en gzip et en brotli,
+# avec un ETag fort tiré de son contenu (preserialisation.py). Une requête n'a plus qu'à
+# choisir la variante, ou à répondre 304 si le client a déjà cette version.
+# Seules les variantes compressées restent en mémoire (CorpsPreserialise.compacter).
+# Après un rechargement à chaud des cours, le catalogue est reconstruit : les corps dont
+# les octets JSON n'ont pas changé sont repris tels quels, sans être recompressés.
+
+from preserialisation import BROTLI_DISPONIBLE, CorpsPreserialise, empreinte, serialiser
+from sections_cours import lien_cours
+
+URL_NIVEAU = '/courses/{niveau}'
+
+
+def lien_niveau(niveau):
+    """Lien de la liste des cours d'un niveau"""
+    return URL_NIVEAU.format(niveau=niveau)
+
+
+def donnees_cours(matiere, index, document):
+    """Corps JSON d'un cours complet : contenu, sections et cours liés"""
+    return {
+        'matiere': matiere,
+        'niveau': document.niveau,
+        'sujet': document.sujet,
+        'cours': document.cours,
+        'sections': [section.resume() for section in document.sections],
+        'cours_lies': [
+            {'niveau': lie['niveau'], 'sujet': lie['sujet'], 'titre': lie['cours']['titre'],
+             'score': lie['score'], 'lien': lien_cours(lie['niveau'], lie['sujet'])}
+            for lie in index.cours_lies(document.niveau, document.sujet)
+        ],
+        'success': True
+    }
+
+
+def donnees_niveau(matiere, niveau, documents):
+    """Corps JSON de la liste des cours d'un niveau"""
+    return {
+        'matiere': matiere,
+        'niveau': niveau,
+        'cours': [
+            {'sujet': document.sujet, 'titre': document.cours['titre'],
+             'sections': len(document.sections), 'lien': lien_cours(document.niveau, document.sujet)}
+            for document in documents
+        ],
+        'success': True
+    }
+
+
+class CatalogueCours:
+    """Corps pré-sérialisés de l'API des cours, par chemin : (), (niveau,) ou (niveau, sujet)"""
+
+    def __init__(self, index_par_matiere, precedent=None):
+        # index_par_matiere : {matiere: IndexCours} ; precedent : catalogue à reprendre (rechargement)
+        anciens = precedent.corps if precedent is not None else {}
+        self.corps = {}
+        self.reutilises = 0
+        sommaire = {}
+        for matiere, index in index_par_matiere.items():
+            par_niveau = {}
+            for document in index.documents:
+                par_niveau.setdefault(document.niveau, []).append(document)
+                self.ajouter((document.niveau, document.sujet), donnees_cours(matiere, index, document), anciens)
+            for niveau, documents in par_niveau.items():
+                self.ajouter((niveau,), donnees_niveau(matiere, niveau, documents), anciens)
+            sommaire[matiere] = [
+                {'niveau': niveau, 'cours': len(documents), 'lien': lien_niveau(niveau)}
+                for niveau, documents in par_niveau.items()
+            ]
+        self.ajouter((), {'matieres': sommaire, 'success': True}, anciens)
+
+    def ajouter(self, chemin, donnees, anciens):
+        identite = serialiser(donnees)
+        ancien = anciens.get(chemin)
+        if ancien is not None and ancien.taille == len(identite) and ancien.empreinte == empreinte(identite):
+            self.corps[chemin] = ancien
+            self.reutilises += 1
+        else:
+            self.corps[chemin] = CorpsPreserialise.depuis_octets(identite).compacter()
+
+    def get(self, *chemin):
+        """CorpsPreserialise du chemin, ou None s'il n'existe pas"""
+        return self.corps.get(chemin)
+
+    def __len__(self):
+        return len(self.corps)
+
+    def tailles(self):
+        """Octets de toutes les réponses, par variante"""
+        totaux = {'identite': 0, 'gzip': 0, 'br': 0}
+        for corps in self.corps.values():
+            for variante, taille in corps.tailles().items():
+                if taille is not None:
+                    totaux[variante] += taille
+        if not BROTLI_DISPONIBLE:
+            totaux['br'] = None
+        return totaux
+
+    def rapport(self):
+        """Octets économisés en ne gardant que les variantes compressées"""
+        tailles = self.tailles()
+        return {'corps': len(self.corps), 'octets_bruts': tailles['identite'],
+                'octets_compresses': tailles['gzip'] + (tailles['br'] or 0),
+                'octets_economises': tailles['identite']}
@@ -0,0 +1,254 @@
+# Classifieur statistique des intentions du mode démo (backend optionnel du routeur)
+# Naive Bayes complémentaire sur des n-grammes hachés (mots, paires de mots, trigrammes
+# de caractères), entraîné hors ligne à partir des mots-clés de get_response_demo,
+# de MOTS_CLES_MATHS et des titres/contenus des cours. Toutes les intentions sont
+# notées en une seule opération matricielle. Le classifieur ne fait que départager
+# les intentions que la chaîne de priorités a touchées (non exclues, gardes acceptées) ;
+# en dessous du seuil de confiance, le routeur revient à la chaîne de priorités.
+# Les confiances sont calibrées sur des documents tenus à l'écart de l'entraînement.
+# Le modèle enregistré porte la signature de ses documents : s'il ne correspond plus
+# aux intentions ou aux cours, il est ré-entraîné au démarrage.
+#
+# Entraînement hors ligne :  python classifieur_intentions.py
+# Activation :               ROUTEUR_DEMO_BACKEND=classifieur
+
+import hashlib
+import os
+import sys
+import zlib
+
+from normalisation import normaliser_message, tokeniser
+
+# NumPy est optionnel : sans lui, le routeur garde la chaîne de priorités
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:
+    NUMPY_DISPONIBLE = False
+
+DIMENSION_PAR_DEFAUT = 2 ** 15
+PLIS_CALIBRATION = 5
+# À incrémenter quand les n-grammes ou l'entraînement changent : les modèles enregistrés sont alors périmés
+VERSION_MODELE = 2
+CHEMIN_MODELE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'modele_intentions.npz')
+
+
+def extraire_ngrammes(tokens):
+    """Retourne les n-grammes d'un message : mots, paires de mots et trigrammes de caractères"""
+    ngrammes = ['m:' + mot for mot in tokens]
+    ngrammes += ['b:' + a + ' ' + b for a, b in zip(tokens, tokens[1:])]
+    for mot in tokens:
+        borde = f'#{mot}#'
+        ngrammes += ['c:' + borde[i:i + 3] for i in range(len(borde) - 2)]
+    return ngrammes
+
+
+def poids_complementaires(documents, intentions, dimension, alpha):
+    """Matrice (dimension × nb_intentions) des poids Naive Bayes complémentaires, non calibrés"""
+    colonnes = {intention: i for i, intention in enumerate(intentions)}
+    comptes = np.zeros((dimension, len(intentions)), dtype=np.float64)
+    for intention, texte in documents:
+        # Présence (et non fréquence), pondérée par 1/√n : un long cours ne doit pas écraser un mot-clé
+        indices = sorted({hacher(n, dimension) for n in extraire_ngrammes(tokeniser(texte))})
+        if indices:
+            comptes[indices, colonnes[intention]] += 1.0 / len(indices) ** 0.5
+
+    # Complémentaire : chaque intention est apprise contre toutes les autres, ce qui évite
+    # que les intentions riches en documents (maths, bases...) attirent toutes les prédictions
+    complements = comptes.sum(axis=1, keepdims=True) - comptes + alpha
+    log_complements = np.log(complements / complements.sum(axis=0, keepdims=True))
+    return (-log_complements / np.abs(log_complements).sum(axis=0, keepdims=True)).astype(np.float32)
+
+
+def hacher(ngramme, dimension):
+    """Hachage stable (indépendant de PYTHONHASHSEED) d'un n-gramme vers une colonne"""
+    return zlib.crc32(ngramme.encode('utf-8')) % dimension
+
+
+def softmax(scores):
+    """Softmax ligne par ligne d'une matrice de scores"""
+    scores = scores - scores.max(axis=1, keepdims=True)
+    exp_scores = np.exp(scores)
+    return exp_scores / exp_scores.sum(axis=1, keepdims=True)
+
+
+class ClassifieurIntentions:
+    """Naive Bayes complémentaire sur n-grammes hachés ; une ligne de poids par caractéristique"""
+
+    def __init__(self, intentions, poids, dimension=DIMENSION_PAR_DEFAUT):
+        self.intentions = list(intentions)
+        self.poids = poids            # matrice (dimension × nb_intentions) des poids calibrés de chaque intention
+        self.dimension = dimension
+
+    @classmethod
+    def entrainer(cls, documents, dimension=DIMENSION_PAR_DEFAUT, alpha=0.1, plis=PLIS_CALIBRATION):
+        """Entraîne le modèle sur une liste de (intention, texte)"""
+        intentions = sorted({intention for intention, _ in documents})
+        modele = cls(intentions, poids_complementaires(documents, intentions, dimension, alpha), dimension)
+        modele.calibrer(documents, plis, alpha)
+        return modele
+
+    def calibrer(self, documents, plis=PLIS_CALIBRATION, alpha=0.1):
+        """Met les poids à l'échelle (température) qui maximise la vraisemblance des documents tenus à l'écart
+        Chaque pli est noté par un modèle entraîné sur les autres : calibrées sur leurs propres documents
+        d'entraînement, les confiances seraient bien trop hautes (0,9 et plus sur des phrases jamais vues)."""
+        colonnes = {intention: i for i, intention in enumerate(self.intentions)}
+        scores, attendues = [], []
+        for pli in range(plis):
+            entrainement = [d for j, d in enumerate(documents) if j % plis != pli]
+            ecartes = [d for j, d in enumerate(documents) if j % plis == pli]
+            if not entrainement or not ecartes:
+                continue
+            partiel = ClassifieurIntentions(self.intentions, poids_complementaires(
+                entrainement, self.intentions, self.dimension, alpha), self.dimension)
+            scores.append(partiel.scores_lot([texte for _, texte in ecartes]))
+            attendues += [colonnes[intention] for intention, _ in ecartes]
+        if not attendues:
+            return
+        scores = np.concatenate(scores).astype(np.float64)
+        lignes = np.arange(len(attendues))
+
+        def log_vraisemblance(log_echelle):
+            echelles = scores * 10 ** log_echelle
+            echelles -= echelles.max(axis=1, keepdims=True)
+            return (echelles[lignes, attendues] - np.log(np.exp(echelles).sum(axis=1))).mean()
+
+        # La vraisemblance est concave en l'échelle : recherche ternaire sur log10(échelle)
+        bas, haut = 0.0, 12.0
+        for _ in range(60):
+            premier, second = bas + (haut - bas) / 3, haut - (haut - bas) / 3
+            if log_vraisemblance(premier) < log_vraisemblance(second):
+                bas = premier
+            else:
+                haut = second
+        self.poids = self.poids * np.float32(10 ** ((bas + haut) / 2))
+
+    def caracteristiques(self, message):
+        """Indices hachés (avec répétitions) des n-grammes d'un message"""
+        ngrammes = extraire_ngrammes(normaliser_message(message).tokens)
+        return np.fromiter((hacher(n, self.dimension) for n in ngrammes), dtype=np.int64, count=len(ngrammes))
+
+    def scores_lot(self, messages):
+        """Matrice (nb_messages × nb_intentions) des scores, calculée en un seul produit creux"""
+        indices = [self.caracteristiques(message) for message in messages]
+        longueurs = np.array([len(i) for i in indices], dtype=np.int64)
+        scores = np.zeros((len(messages), len(self.intentions)), dtype=np.float32)
+        non_vides = longueurs > 0
+        if non_vides.any():
+            # Produit matrice creuse (format CSR implicite) × poids : rassemblement des lignes puis somme par message
+            tous = np.concatenate([i for i in indices if len(i)])
+            debuts = np.concatenate(([0], np.cumsum(longueurs[non_vides])[:-1]))
+            scores[non_vides] = np.add.reduceat(self.poids[tous], debuts, axis=0)
+        return scores
+
+    def probabilites_lot(self, messages):
+        """Matrice (nb_messages × nb_intentions) des probabilités a posteriori"""
+        return softmax(self.scores_lot(messages))
+
+    def predire_lot(self, messages, seuil=0.0, parmi=None):
+        """Retourne [(intention ou None, confiance)] pour un lot de messages
+        parmi : pour chaque message, les intentions admises (celles que la chaîne de priorités a touchées) ;
+        les probabilités sont alors renormalisées sur ces seules intentions"""
+        if not messages:
+            return []
+        probabilites = self.probabilites_lot(messages)
+        if parmi is not None:
+            colonnes = {intention: i for i, intention in enumerate(self.intentions)}
+            masque = np.zeros_like(probabilites, dtype=bool)
+            for ligne, admises in enumerate(parmi):
+                masque[ligne, [colonnes[i] for i in admises if i in colonnes]] = True
+            probabilites = np.where(masque, probabilites, 0.0)
+            totaux = probabilites.sum(axis=1, keepdims=True)
+            probabilites = np.divide(probabilites, totaux, out=np.zeros_like(probabilites), where=totaux > 0)
+        meilleures = probabilites.argmax(axis=1)
+        resultats = []
+        for ligne, colonne in enumerate(meilleures):
+            confiance = float(probabilites[ligne, colonne])
+            intention = self.intentions[colonne] if confiance > 0 and confiance >= seuil else None
+            resultats.append((intention, confiance))
+        return resultats
+
+    def predire(self, message, seuil=0.0, parmi=None):
+        """Retourne (intention ou None si la confiance est sous le seuil, confiance)"""
+        return self.predire_lot([message], seuil, None if parmi is None else [parmi])[0]
+
+    def sauvegarder(self, chemin=CHEMIN_MODELE, signature=''):
+        """Enregistre le modèle au format .npz, avec la signature de ses documents d'entraînement"""
+        np.savez_compressed(chemin, poids=self.poids, intentions=np.array(self.intentions),
+                            dimension=np.array(self.dimension), signature=np.array(signature))
+
+    @classmethod
+    def charger(cls, chemin=CHEMIN_MODELE):
+        """Charge un modèle enregistré par sauvegarder() ; retourne (modèle, signature)"""
+        with np.load(chemin) as donnees:
+            signature = str(donnees['signature']) if 'signature' in donnees.files else ''
+            modele = cls([str(i) for i in donnees['intentions']], donnees['poids'], int(donnees['dimension']))
+        return modele, signature
+
+
+def documents_entrainement(intentions, cours_francais=None, cours_maths=None, mots_cles_maths=None, routeur=None):
+    """Construit les documents d'entraînement (intention, texte) à partir des bases existantes"""
+    documents = []
+    for intention in intentions:
+        for mot in intention.get('mots', []):
+            documents.append((intention['id'], mot))
+
+    for mot in mots_cles_maths or []:
+        documents.append(('maths', mot))
+    for cours in (cours_maths or {}).values():
+        for contenu in cours.values():
+            documents.append(('maths', contenu['titre']))
+            documents.append(('maths', contenu['contenu']))
+
+    # Chaque cours de français est rattaché à l'intention que la chaîne choisit pour son titre
+    if routeur is not None:
+        identifiants = {intention['id'] for intention in intentions}
+        for cours in (cours_francais or {}).values():
+            for sujet, contenu in cours.items():
+                intention = routeur.choisir(contenu['titre'] + ' ' + sujet.replace('_', ' '))
+                if intention in identifiants and intention != 'maths':
+                    documents.append((intention, contenu['titre']))
+                    documents.append((intention, contenu['contenu']))
+    return documents
+
+
+def signature_documents(documents, dimension=DIMENSION_PAR_DEFAUT):
+    """Empreinte des documents d'entraînement et des paramètres du modèle"""
+    empreinte = hashlib.blake2b(digest_size=16)
+    empreinte.update(f'{VERSION_MODELE}|{dimension}|{PLIS_CALIBRATION}'.encode('utf-8'))
+    for intention, texte in documents:
+        empreinte.update(f'\0{intention}\0{texte}'.encode('utf-8'))
+    return empreinte.hexdigest()
+
+
+def charger_ou_entrainer(intentions, chemin=CHEMIN_MODELE, **sources):
+    """Charge le modèle entraîné hors ligne s'il correspond aux intentions et aux cours actuels,
+    sinon l'entraîne au démarrage"""
+    documents = documents_entrainement(intentions, **sources)
+    signature = signature_documents(documents)
+    if os.path.exists(chemin):
+        modele, signature_modele = ClassifieurIntentions.charger(chemin)
+        if signature_modele == signature:
+            return modele
+        print(f"⚠️ Modèle {os.path.basename(chemin)} périmé (intentions ou cours modifiés) : entraînement au démarrage")
+    else:
+        print(f"⚠️ Modèle {os.path.basename(chemin)} absent : entraînement au démarrage")
+    return ClassifieurIntentions.entrainer(documents)
+
+
+if __name__ == '__main__':
+    if not NUMPY_DISPONIBLE:
+        print("❌ NumPy n'est pas installé (pip install numpy)")
+        sys.exit(1)
+
+    from app import INTENTIONS_DEMO, ROUTEUR_DEMO, COURS_DISPONIBLES
+    sources = {'routeur': ROUTEUR_DEMO}
+    if COURS_DISPONIBLES:
+        from cours_francais import COURS_FRANCAIS
+        from cours_mathematiques import COURS_MATHEMATIQUES, MOTS_CLES_MATHS
+        sources.update(cours_francais=COURS_FRANCAIS, cours_maths=COURS_MATHEMATIQUES, mots_cles_maths=MOTS_CLES_MATHS)
+
+    documents = documents_entrainement([i for i in INTENTIONS_DEMO if 'mots' in i], **sources)
+    modele = ClassifieurIntentions.entrainer(documents)
+    modele.sauvegarder(signature=signature_documents(documents))
+    print(f"✅ Modèle entraîné sur {len(documents)} documents, {len(modele.intentions)} intentions → {CHEMIN_MODELE}")
@@ -0,0 +1,71 @@
+# Contexte des cours pour les prompts OpenAI (génération augmentée par la recherche)
+# Au lieu d'envoyer tout le programme (PROFESSEUR_PROMPT) à chaque appel, on cherche
+# dans les bases de cours les leçons les plus pertinentes pour la question, on garde
+# leurs paragraphes qui contiennent les mots de la question, et on les joint à un
+# prompt système court. Le modèle répond à partir du texte exact des leçons.
+
+from index_cours import MOTS_VIDES
+from normalisation import tokeniser
+
+MATIERES = ('francais', 'mathematiques')
+EXTRAITS = 3
+TAILLE_EXTRAIT = 1200        # caractères par leçon retenue
+
+# Approximation sans tokenizer : environ 4 caractères par token pour du français
+CARACTERES_PAR_TOKEN = 4
+
+
+def estimer_tokens(texte):
+    """Nombre approximatif de tokens d'un texte"""
+    return (len(texte) + CARACTERES_PAR_TOKEN - 1) // CARACTERES_PAR_TOKEN
+
+
+def estimer_tokens_messages(messages):
+    """Nombre approximatif de tokens d'une liste de messages chat (4 tokens de structure par message)"""
+    return sum(estimer_tokens(message['content']) + 4 for message in messages)
+
+
+def meilleurs_paragraphes(contenu, mots, taille=TAILLE_EXTRAIT):
+    """Paragraphes du contenu qui partagent le plus de mots avec la question, dans l'ordre du cours"""
+    paragraphes = [p.strip() for p in contenu.split('\n\n') if p.strip()]
+    scores = [len(mots & set(tokeniser(paragraphe))) for paragraphe in paragraphes]
+    retenus = set()
+    longueur = 0
+    for i in sorted(range(len(paragraphes)), key=lambda i: (-scores[i], i)):
+        if retenus and (scores[i] == 0 or longueur + len(paragraphes[i]) > taille):
+            continue
+        retenus.add(i)
+        longueur += len(paragraphes[i])
+    texte = '\n\n'.join(paragraphes[i] for i in sorted(retenus))
+    return texte[:taille]
+
+
+def extraits_pertinents(question, moteur, k=EXTRAITS, niveau=None):
+    """Les k leçons (toutes matières) les plus pertinentes, réduites à leurs paragraphes utiles
+    niveau : classe de l'élève, pour ne retenir que les leçons de sa classe et des classes voisines"""
+    mots = set(tokeniser(question)) - MOTS_VIDES
+    if not mots:
+        return []
+    candidats = []
+    for matiere in MATIERES:
+        for resultat in moteur.classer(matiere, question, k, niveau=niveau):
+            candidats.append((resultat['score'], matiere, resultat))
+    candidats.sort(key=lambda candidat: -candidat[0])
+    extraits = []
+    for score, matiere, resultat in candidats[:k]:
+        cours = resultat['cours']
+        extraits.append({
+            'matiere': matiere,
+            'niveau': resultat['niveau'],
+            'sujet': resultat['sujet'],
+            'titre': cours['titre'],
+            'texte': meilleurs_paragraphes(cours['contenu'], mots),
+            'score': score,
+        })
+    return extraits
+
+
+def formater_contexte(extraits):
+    """Bloc de contexte ajouté au prompt système"""
+    blocs = [f"### {extrait['titre']}\n{extrait['texte']}" for extrait in extraits]
+    return "EXTRAITS DES COURS DE RÉFÉRENCE (utilise-les s'ils répondent à la question) :\n\n" + '\n\n'.join(blocs)
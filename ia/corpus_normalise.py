@@ -0,0 +1,100 @@
+# Corpus « ombre » des bases de cours : textes normalisés une seule fois
+# Pour chaque cours de COURS_FRANCAIS et COURS_MATHEMATIQUES, on garde à côté de
+# l'original ses champs en minuscules sans accents (recherche de sous-chaîne), ses
+# mots normalisés (normalisation.tokeniser : élisions, pluriels), leurs fréquences,
+# la longueur de chaque champ et les sections du contenu (sections_cours.py). Les
+# moteurs de recherche et de classement lisent ces données au lieu de retravailler le
+# texte des cours à chaque requête.
+# Au rechargement des cours, les documents inchangés sont repris tels quels du corpus
+# précédent : seuls les cours ajoutés ou modifiés sont normalisés à nouveau.
+
+import re
+from collections import Counter
+
+from normalisation import replier_accents, tokeniser
+from sections_cours import decouper
+
+CHAMPS = ('sujet', 'titre', 'exemples', 'contenu')
+
+# Mots de la recherche par sous-chaîne (index_cours.py) : suites alphanumériques des champs repliés
+MOTIF_MOT = re.compile(r'\w+')
+CHAMPS_RECHERCHE = ('sujet', 'titre', 'contenu')
+
+
+class DocumentNormalise:
+    """Un cours et son ombre normalisée"""
+
+    __slots__ = ('numero', 'niveau', 'sujet', 'cours', 'replie', 'frequences', 'longueurs', 'mots_recherche',
+                 'sections')
+
+    def __init__(self, numero, niveau, sujet, cours):
+        self.numero = numero
+        self.niveau = niveau
+        self.sujet = sujet
+        self.cours = cours
+        textes = {
+            'sujet': sujet,
+            'titre': cours['titre'],
+            'exemples': '\n'.join(cours.get('exemples', ())),
+            'contenu': cours['contenu'],
+        }
+        # Champs en minuscules, accents et ligatures repliés
+        self.replie = {champ: replier_accents(texte) for champ, texte in textes.items()}
+        # champ → {mot normalisé: fréquence}, champ → nombre de mots
+        self.frequences = {}
+        self.longueurs = {}
+        for champ, texte in self.replie.items():
+            mots = tokeniser(texte)
+            self.frequences[champ] = Counter(mots)
+            self.longueurs[champ] = len(mots)
+        self.mots_recherche = frozenset(
+            mot for champ in CHAMPS_RECHERCHE for mot in MOTIF_MOT.findall(self.replie[champ]))
+        self.sections = decouper(niveau, sujet, cours)
+
+    @property
+    def cle(self):
+        return (self.niveau, self.sujet)
+
+    def renumeroter(self, numero):
+        """Même document à une autre position du corpus (données normalisées partagées)"""
+        if numero == self.numero:
+            return self
+        copie = object.__new__(DocumentNormalise)
+        for attribut in self.__slots__:
+            setattr(copie, attribut, getattr(self, attribut))
+        copie.numero = numero
+        return copie
+
+
+class CorpusNormalise:
+    """Ombre normalisée d'une base {niveau: {sujet: {"titre", "contenu", "exemples"}}}"""
+
+    def __init__(self, base, precedent=None):
+        # precedent : corpus de la version précédente de la base, dont on reprend les documents inchangés
+        anciens = {document.cle: document for document in precedent} if precedent is not None else {}
+        self.documents = []
+        self.reutilises = 0
+        for niveau, cours in base.items():
+            for sujet, contenu in cours.items():
+                numero = len(self.documents)
+                ancien = anciens.get((niveau, sujet))
+                if ancien is not None and ancien.cours == contenu:
+                    self.documents.append(ancien.renumeroter(numero))
+                    self.reutilises += 1
+                else:
+                    self.documents.append(DocumentNormalise(numero, niveau, sujet, contenu))
+        # Nombre de documents contenant chaque mot (tous champs confondus)
+        self.documents_par_mot = Counter()
+        for document in self.documents:
+            self.documents_par_mot.update(set().union(*document.frequences.values()))
+        nombre = len(self.documents) or 1
+        self.longueurs_moyennes = {
+            champ: sum(document.longueurs[champ] for document in self.documents) / nombre
+            for champ in CHAMPS
+        }
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __iter__(self):
+        return iter(self.documents)
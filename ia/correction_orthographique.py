@@ -0,0 +1,140 @@
+# Correction orthographique des mots du message (à la SymSpell)
+# Toutes les suppressions de 1 ou 2 lettres des mots du vocabulaire du routeur sont
+# précalculées au démarrage. Pour un mot inconnu, on génère ses propres suppressions
+# et on cherche les mots du vocabulaire qui partagent une suppression : les candidats
+# sont ensuite vérifiés par distance de Damerau-Levenshtein. Aucune comparaison avec
+# tout le vocabulaire : une correction coûte quelques dizaines de recherches de dictionnaire.
+#
+# "conjuguaison" → "conjugaison", "pluriele" → "pluriel", "derive" → "derivee"
+# Les mots de 4 lettres ne sont pas corrigés : à une lettre près, ce sont presque
+# toujours d'autres mots français (vent/vert, rose/robe, mari/mardi, fils/ils).
+
+import threading
+
+from normalisation import tokeniser
+
+DISTANCE_MAX = 2
+
+
+def distance_maximale(mot):
+    """Distance d'édition tolérée selon la longueur du mot (les mots courts ne sont pas corrigés)"""
+    if len(mot) <= 4:
+        return 0
+    if len(mot) <= 7:
+        return 1
+    return DISTANCE_MAX
+
+
+def suppressions(mot, distance):
+    """Ensemble des chaînes obtenues en supprimant jusqu'à `distance` lettres du mot"""
+    resultat = {mot}
+    courantes = {mot}
+    for _ in range(distance):
+        suivantes = set()
+        for chaine in courantes:
+            if len(chaine) <= 1:
+                continue
+            for i in range(len(chaine)):
+                suivantes.add(chaine[:i] + chaine[i + 1:])
+        resultat |= suivantes
+        courantes = suivantes
+    return resultat
+
+
+def distance_damerau(a, b, maximum):
+    """Distance de Damerau-Levenshtein (transpositions adjacentes) ; maximum + 1 dès que la borne est dépassée"""
+    if abs(len(a) - len(b)) > maximum:
+        return maximum + 1
+    precedente = None
+    ligne = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        courante = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cout = 0 if a[i - 1] == b[j - 1] else 1
+            courante[j] = min(ligne[j] + 1, courante[j - 1] + 1, ligne[j - 1] + cout)
+            if (precedente is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                courante[j] = min(courante[j], precedente[j - 2] + 1)
+        if min(courante) > maximum:
+            return maximum + 1
+        precedente, ligne = ligne, courante
+    return ligne[-1]
+
+
+def mots_des_textes(textes):
+    """Ensemble des mots normalisés d'une suite de textes (pour construire les mots connus)"""
+    mots = set()
+    for texte in textes:
+        mots.update(tokeniser(texte))
+    return mots
+
+
+def lire_lexique(chemin):
+    """Mots normalisés d'une liste de mots (un par ligne, ex. /usr/share/dict/french) ; vide si le fichier manque"""
+    try:
+        with open(chemin, encoding='utf-8', errors='replace') as fichier:
+            return mots_des_textes(fichier)
+    except OSError:
+        return set()
+
+
+class IndexSymSpell:
+    """Index de suppressions précalculées d'un vocabulaire, pour corriger un mot en temps constant"""
+
+    def __init__(self, vocabulaire, mots_connus=(), distance_max=DISTANCE_MAX, max_corrections=4096):
+        # vocabulaire : {mot: fréquence} (la fréquence départage les candidats à égale distance)
+        # mots_connus : mots corrects hors vocabulaire, jamais corrigés ("construire" n'est pas "contraire")
+        self.vocabulaire = dict(vocabulaire)
+        self.mots_connus = frozenset(mots_connus)
+        self.distance_max = distance_max
+        self.index = {}
+        for mot in self.vocabulaire:
+            for suppression in suppressions(mot, distance_max):
+                self.index.setdefault(suppression, []).append(mot)
+        # Mémoire des mots déjà corrigés (les mêmes fautes reviennent souvent)
+        self.max_corrections = max_corrections
+        self.corrections = {}
+        self.verrou = threading.Lock()
+
+    def __len__(self):
+        return len(self.index)
+
+    def corriger(self, mot):
+        """Retourne le mot du vocabulaire le plus proche, ou le mot lui-même s'il est connu ou trop éloigné"""
+        if mot in self.vocabulaire or mot in self.mots_connus:
+            return mot
+        correction = self.corrections.get(mot)
+        if correction is None:
+            correction = self.chercher(mot)
+            with self.verrou:
+                if len(self.corrections) >= self.max_corrections:
+                    self.corrections.clear()
+                self.corrections[mot] = correction
+        return correction
+
+    def chercher(self, mot):
+        maximum = min(distance_maximale(mot), self.distance_max)
+        if maximum == 0 or mot.isdigit():
+            return mot
+        meilleur = None
+        meilleure_cle = None
+        verifies = set()
+        for suppression in suppressions(mot, maximum):
+            for candidat in self.index.get(suppression, ()):
+                if candidat in verifies:
+                    continue
+                verifies.add(candidat)
+                distance = distance_damerau(mot, candidat, maximum)
+                if distance > maximum:
+                    continue
+                cle = (distance, -self.vocabulaire[candidat], candidat)
+                if meilleure_cle is None or cle < meilleure_cle:
+                    meilleur, meilleure_cle = candidat, cle
+        return meilleur if meilleur is not None else mot
+
+    def corriger_tokens(self, tokens):
+        """Corrige chaque mot inconnu d'une suite de mots normalisés (tuple)"""
+        vocabulaire = self.vocabulaire
+        if all(mot in vocabulaire for mot in tokens):
+            return tokens
+        return tuple(self.corriger(mot) for mot in tokens)
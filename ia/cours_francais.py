@@ -1,6 +1,10 @@
 # Base de données complète de cours de français professionnels
 # Organisée par niveaux : DÉBUTANT, INTERMÉDIAIRE, AVANCÉ + LYCÉE (Seconde → Terminale STPL)
 
+from corpus_normalise import CorpusNormalise
+from index_cours import IndexCours, PartitionsNiveaux, SEUIL_PERTINENCE
+from niveaux import normaliser_niveau
+
 COURS_FRANCAIS = {
     "niveau_debutant": {
         "alphabet": {
@@ -378,8 +382,7 @@ En français, l'ordre est généralement : Sujet + Verbe + Compléments""",
                 "Que je mange (subjonctif)"
             ]
         }
-    }
-}
+    },
 
     # =========================================================
     # NIVEAU SECONDE (2nde) — Première année du lycée
@@ -924,6 +927,11 @@ Métaphore, comparaison, hyperbole, anaphore, antithèse, oxymore, litote, euph
 }
 
 
+# Ombre normalisée des cours (minuscules, sans accents, fréquences des mots), construite une fois à l'import
+CORPUS_COURS = CorpusNormalise(COURS_FRANCAIS)
+# Index inversé mot → cours (utilisé par rechercher_cours et classer_cours)
+INDEX_COURS = IndexCours(CORPUS_COURS)
+
 # Fonction pour obtenir un cours par niveau et sujet
 def obtenir_cours(niveau, sujet):
     """Retourne le cours correspondant au niveau et au sujet"""
@@ -941,18 +949,16 @@ def lister_cours_niveau(niveau):
 # Fonction pour rechercher un cours par mot-clé
 def rechercher_cours(mot_cle):
     """Recherche un cours contenant le mot-clé"""
-    resultats = []
-    mot_cle_lower = mot_cle.lower()
-    
-    for niveau, cours in COURS_FRANCAIS.items():
-        for sujet, contenu in cours.items():
-            if (mot_cle_lower in sujet.lower() or 
-                mot_cle_lower in contenu["titre"].lower() or
-                mot_cle_lower in contenu["contenu"].lower()):
-                resultats.append({
-                    "niveau": niveau,
-                    "sujet": sujet,
-                    "cours": contenu
-                })
-    
-    return resultats
+    return INDEX_COURS.rechercher(mot_cle)
+
+# Fonction pour classer les cours par pertinence (BM25, titre et exemples favorisés)
+def classer_cours(question, k=3, seuil=SEUIL_PERTINENCE, niveau=None):
+    """Retourne les k cours les plus pertinents pour la question, avec leur score (score ≥ seuil)
+    niveau : classe de l'élève ("seconde", "4e"...) pour ne chercher que dans sa partition"""
+    niveau = normaliser_niveau(niveau)
+    index = PARTITIONS_COURS.get(niveau) if niveau else INDEX_COURS
+    return index.classer(question, k, seuil)
+
+
+# Index par classe (taxonomie de niveaux.py), construits avec lister_cours_niveau / obtenir_cours
+PARTITIONS_COURS = PartitionsNiveaux('francais', list(COURS_FRANCAIS), lister_cours_niveau, obtenir_cours, CORPUS_COURS)
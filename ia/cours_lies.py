@@ -0,0 +1,71 @@
+# Graphe des cours liés (« après le discriminant, voir la factorisation »)
+# Calculé une fois, à la construction de l'index d'une base (index_cours.py) : chaque
+# cours est un vecteur TF-IDF de ses mots normalisés (titre, exemples, contenu), et on
+# garde pour chacun ses N voisins les plus proches au sens du cosinus, au-dessus d'un
+# seuil. Toutes les similarités sont obtenues d'un seul produit matriciel (NumPy) ; sans
+# NumPy, le même calcul est fait sur des vecteurs creux en Python.
+# À la requête, les cours liés d'un cours sont une simple lecture de dictionnaire.
+
+import math
+
+# NumPy est optionnel : sans lui, le graphe est calculé en Python (quelques dizaines de cours)
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:
+    NUMPY_DISPONIBLE = False
+
+VOISINS = 3
+SEUIL_SIMILARITE_LIEN = 0.1
+
+
+def vecteurs_tfidf(documents, mots_vides=frozenset()):
+    """Vecteurs creux {mot: poids} normalisés (tf logarithmique × idf) des documents d'un corpus"""
+    comptes = []
+    presence = {}
+    for document in documents:
+        compte = {}
+        for frequences in document.frequences.values():
+            for mot, nombre in frequences.items():
+                if mot not in mots_vides and not mot.isdigit():
+                    compte[mot] = compte.get(mot, 0) + nombre
+        comptes.append(compte)
+        for mot in compte:
+            presence[mot] = presence.get(mot, 0) + 1
+    nombre = len(documents)
+    vecteurs = []
+    for compte in comptes:
+        vecteur = {mot: (1 + math.log(n)) * math.log(nombre / presence[mot]) for mot, n in compte.items()}
+        norme = math.sqrt(sum(poids * poids for poids in vecteur.values())) or 1.0
+        vecteurs.append({mot: poids / norme for mot, poids in vecteur.items() if poids})
+    return vecteurs
+
+
+def similarites(vecteurs):
+    """Matrice (liste de listes) des cosinus entre tous les documents"""
+    if NUMPY_DISPONIBLE:
+        colonnes = {}
+        for vecteur in vecteurs:
+            for mot in vecteur:
+                colonnes.setdefault(mot, len(colonnes))
+        matrice = np.zeros((len(vecteurs), len(colonnes)), dtype=np.float32)
+        for ligne, vecteur in enumerate(vecteurs):
+            matrice[ligne, [colonnes[mot] for mot in vecteur]] = list(vecteur.values())
+        return (matrice @ matrice.T).tolist()
+    return [[sum(poids * autre.get(mot, 0.0) for mot, poids in vecteur.items()) for autre in vecteurs]
+            for vecteur in vecteurs]
+
+
+def graphe_cours_lies(documents, voisins=VOISINS, seuil=SEUIL_SIMILARITE_LIEN, mots_vides=frozenset()):
+    """{(niveau, sujet): ((niveau, sujet, score), ...)} : les voisins les plus proches de chaque cours"""
+    documents = list(documents)
+    if len(documents) < 2:
+        return {document.cle: () for document in documents}
+    scores = similarites(vecteurs_tfidf(documents, mots_vides))
+    graphe = {}
+    for i, document in enumerate(documents):
+        proches = sorted((j for j in range(len(documents)) if j != i), key=lambda j: (-scores[i][j], j))
+        graphe[document.cle] = tuple(
+            (documents[j].niveau, documents[j].sujet, round(scores[i][j], 3))
+            for j in proches[:voisins] if scores[i][j] >= seuil)
+    return graphe
@@ -2,6 +2,10 @@
 # Couvre : Seconde → Première STPL → Terminale STPL
 # Conforme au programme officiel du baccalauréat STL/STPL
 
+from corpus_normalise import CorpusNormalise
+from index_cours import IndexCours, PartitionsNiveaux, SEUIL_PERTINENCE
+from niveaux import normaliser_niveau
+
 COURS_MATHEMATIQUES = {
 
     # =========================================================
@@ -735,6 +739,12 @@ Quand x → +∞ :
 
 # ===================== FONCTIONS UTILITAIRES =====================
 
+# Ombre normalisée des cours (minuscules, sans accents, fréquences des mots), construite une fois à l'import
+CORPUS_COURS_MATHS = CorpusNormalise(COURS_MATHEMATIQUES)
+# Index inversé mot → cours (utilisé par rechercher_cours_maths et classer_cours_maths)
+INDEX_COURS_MATHS = IndexCours(CORPUS_COURS_MATHS)
+
+
 def obtenir_cours_maths(niveau, sujet):
     """Retourne le cours de maths pour le niveau et le sujet donnés"""
     if niveau in COURS_MATHEMATIQUES and sujet in COURS_MATHEMATIQUES[niveau]:
@@ -751,53 +761,53 @@ def lister_cours_maths(niveau):
 
 def rechercher_cours_maths(mot_cle):
     """Recherche un cours de maths contenant le mot-clé"""
-    resultats = []
-    mot_cle_lower = mot_cle.lower()
+    return INDEX_COURS_MATHS.rechercher(mot_cle)
 
-    for niveau, cours in COURS_MATHEMATIQUES.items():
-        for sujet, contenu in cours.items():
-            if (mot_cle_lower in sujet.lower() or
-                    mot_cle_lower in contenu["titre"].lower() or
-                    mot_cle_lower in contenu["contenu"].lower()):
-                resultats.append({
-                    "niveau": niveau,
-                    "sujet": sujet,
-                    "cours": contenu
-                })
 
-    return resultats
+def classer_cours_maths(question, k=3, seuil=SEUIL_PERTINENCE, niveau=None):
+    """Retourne les k cours de maths les plus pertinents pour la question, avec leur score (score ≥ seuil)
+    niveau : classe de l'élève ("seconde", "4e"...) pour ne chercher que dans sa partition"""
+    niveau = normaliser_niveau(niveau)
+    index = PARTITIONS_COURS_MATHS.get(niveau) if niveau else INDEX_COURS_MATHS
+    return index.classer(question, k, seuil)
 
 
-# Mots-clés pour détecter une question de maths
+# Mots-clés des questions de maths : ajoutés aux mots des cours pour construire le lexique
+# pondéré qui détecte une question de maths (lexique_maths.py), et utilisés pour
+# l'entraînement du classifieur d'intentions
+# (comparés mot à mot après normalisation : accents et pluriels en -s sont repliés)
 MOTS_CLES_MATHS = [
     # Général
-    "calcul", "calcule", "calculer", "calculs", "maths", "mathématiques", "math",
-    "exercice", "problème", "probleme",
+    "calcul", "calcule", "calculer", "maths", "mathématiques",
+    "exercice", "problème",
     # Algèbre
-    "équation", "equation", "inéquation", "inequation", "polynôme", "polynome",
-    "discriminant", "delta", "racine", "factoriser", "développer", "developper",
-    "système", "systeme",
+    "équation", "inéquation", "polynôme",
+    "discriminant", "delta", "racine", "factoriser", "développer",
+    "système",
     # Fonctions
-    "fonction", "dérivée", "derivee", "primitive", "intégrale", "integrale",
+    "fonction", "dérivée", "primitive", "intégrale",
     "variation", "extremum", "maximum", "minimum", "croissante", "décroissante",
     "tangente", "limite",
     # Nombres
     "exponentielle", "logarithme", "ln", "log", "puissance", "exposant",
-    "racine carrée", "racine carre",
     # Géométrie
     "vecteur", "coordonnée", "distance", "milieu", "droite", "pente",
-    "triangle", "cercle", "géométrie", "geometrie",
+    "triangle", "cercle", "géométrie",
     # Trigonométrie
-    "sinus", "cosinus", "tangente", "sin", "cos", "tan", "trigonométrie",
+    "sinus", "cosinus", "sin", "cos", "tan", "trigonométrie",
     "radian", "degré",
     # Suites
     "suite", "arithmétique", "géométrique", "raison", "terme", "récurrence",
     # Statistiques/Probabilités
-    "probabilité", "probabilite", "statistique", "moyenne", "médiane", "mediane",
-    "variance", "écart-type", "ecart-type", "loi normale", "binomiale",
+    "probabilité", "statistique", "moyenne", "médiane",
+    "variance", "écart-type", "loi normale", "binomiale",
     "intervalle de confiance", "histogramme",
     # Matrices
-    "matrice", "déterminant", "determinant", "inverse",
+    "matrice", "déterminant", "inverse",
     # Équations diff.
-    "différentielle", "differentielle",
+    "différentielle",
 ]
+
+
+# Index par classe (taxonomie de niveaux.py), construits avec lister_cours_maths / obtenir_cours_maths
+PARTITIONS_COURS_MATHS = PartitionsNiveaux('mathematiques', list(COURS_MATHEMATIQUES), lister_cours_maths, obtenir_cours_maths, CORPUS_COURS_MATHS)
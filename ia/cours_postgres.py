@@ -0,0 +1,234 @@
+# Cours dans PostgreSQL (recherche plein texte partagée par tous les serveurs)
+# Les deux bases de cours sont chargées dans la table cours_ia de la base qui contient
+# déjà sessions et messages. La colonne document (tsvector, configuration "french")
+# pondère le titre (A), les exemples (B) et le contenu (C) ; elle est indexée en GIN
+# et les résultats sont classés par ts_rank. Les textes indexés sont ceux du corpus
+# normalisé (minuscules, sans accents), comme les questions.
+# La table est la source de vérité des cours quand COURS_MOTEUR=postgres : elle n'est
+# écrite que par python cours_postgres.py (un seul écrivain, qui incrémente la version
+# de cours_ia_version dans la même transaction). Les workers de tous les serveurs ne
+# l'écrivent jamais : ils relisent les cours dans la table quand la version change
+# (rechargement_cours.py, source=MoteurPostgres), sans redéployer les fichiers.
+#
+# Charger ou mettre à jour les cours :   python cours_postgres.py
+
+import json
+import threading
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+from corpus_normalise import CorpusNormalise
+from index_cours import MOTS_VIDES
+from moteurs_cours import signature
+from niveaux import cles_exclues
+from normalisation import replier_accents, tokeniser
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS cours_ia (
+    id SERIAL PRIMARY KEY,
+    matiere VARCHAR(50) NOT NULL,
+    niveau VARCHAR(100) NOT NULL,
+    sujet VARCHAR(255) NOT NULL,
+    ordre INTEGER NOT NULL,
+    titre TEXT NOT NULL,
+    contenu TEXT NOT NULL,
+    exemples JSONB NOT NULL DEFAULT '[]',
+    sujet_replie TEXT NOT NULL,
+    titre_replie TEXT NOT NULL,
+    contenu_replie TEXT NOT NULL,
+    document TSVECTOR NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (matiere, niveau, sujet)
+);
+CREATE INDEX IF NOT EXISTS idx_cours_ia_document ON cours_ia USING GIN (document);
+CREATE INDEX IF NOT EXISTS idx_cours_ia_matiere ON cours_ia (matiere, ordre);
+CREATE TABLE IF NOT EXISTS cours_ia_version (
+    id INTEGER PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version INTEGER NOT NULL,
+    signature VARCHAR(8) NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+UPSERT_SQL = """
+INSERT INTO cours_ia (matiere, niveau, sujet, ordre, titre, contenu, exemples,
+                      sujet_replie, titre_replie, contenu_replie, document)
+VALUES (%(matiere)s, %(niveau)s, %(sujet)s, %(ordre)s, %(titre)s, %(contenu)s, %(exemples)s,
+        %(sujet_replie)s, %(titre_replie)s, %(contenu_replie)s,
+        setweight(to_tsvector('french', %(index_titre)s), 'A')
+        || setweight(to_tsvector('french', %(index_exemples)s), 'B')
+        || setweight(to_tsvector('french', %(index_contenu)s), 'C'))
+ON CONFLICT (matiere, niveau, sujet) DO UPDATE SET
+    ordre = EXCLUDED.ordre, titre = EXCLUDED.titre, contenu = EXCLUDED.contenu,
+    exemples = EXCLUDED.exemples, sujet_replie = EXCLUDED.sujet_replie,
+    titre_replie = EXCLUDED.titre_replie, contenu_replie = EXCLUDED.contenu_replie,
+    document = EXCLUDED.document, updated_at = CURRENT_TIMESTAMP
+"""
+
+# Nouvelle version seulement si les cours ont changé (les workers ne relisent pas la table pour rien)
+VERSION_SQL = """
+INSERT INTO cours_ia_version (id, version, signature) VALUES (1, 1, %s)
+ON CONFLICT (id) DO UPDATE SET
+    version = cours_ia_version.version + 1, signature = EXCLUDED.signature, updated_at = CURRENT_TIMESTAMP
+WHERE cours_ia_version.signature <> EXCLUDED.signature
+"""
+
+# Poids de ts_rank pour {D, C, B, A} : contenu 1, exemples 2, titre 3 (comme index_cours)
+POIDS_TS_RANK = '{0.1, 0.33, 0.67, 1.0}'
+SEUIL_PERTINENCE_POSTGRES = 0.1
+
+
+def charger(connexion, bases):
+    """Charge (ou met à jour) les bases {matière: {niveau: {sujet: cours}}} dans cours_ia, en une transaction
+    Seul écrivain de la table (python cours_postgres.py) : les bases sont les cours complets de chaque matière"""
+    cur = connexion.cursor()
+    cur.execute(CREATE_TABLE_SQL)
+    # Deux chargements simultanés s'exécutent l'un après l'autre
+    cur.execute("LOCK TABLE cours_ia_version IN EXCLUSIVE MODE")
+    nombre = 0
+    for matiere, base in bases.items():
+        cles = []
+        for document in CorpusNormalise(base):
+            cours = document.cours
+            replie = document.replie
+            cur.execute(UPSERT_SQL, {
+                'matiere': matiere, 'niveau': document.niveau, 'sujet': document.sujet,
+                'ordre': document.numero, 'titre': cours['titre'], 'contenu': cours['contenu'],
+                'exemples': json.dumps(cours.get('exemples', []), ensure_ascii=False),
+                'sujet_replie': replie['sujet'], 'titre_replie': replie['titre'],
+                'contenu_replie': replie['contenu'],
+                'index_titre': replie['sujet'].replace('_', ' ') + '\n' + replie['titre'],
+                'index_exemples': replie['exemples'], 'index_contenu': replie['contenu'],
+            })
+            cles.append(f'{document.niveau}/{document.sujet}')
+            nombre += 1
+        # Les cours retirés des fichiers Python disparaissent aussi de la base
+        cur.execute("DELETE FROM cours_ia WHERE matiere = %s AND NOT (niveau || '/' || sujet = ANY(%s))",
+                    (matiere, cles))
+    cur.execute(VERSION_SQL, (signature(bases),))
+    connexion.commit()
+    cur.close()
+    return nombre
+
+
+class MoteurPostgres:
+    """Recherche dans la table cours_ia (pool de connexions partagé par les threads du worker) ;
+    sert aussi de source des cours au rechargement à chaud (version() et lire())"""
+
+    def __init__(self, url, connexions_max=4):
+        self.url = url
+        self.connexions_max = connexions_max
+        self.pool = None
+        self.verrou = threading.Lock()
+        # Vérifie dès la création que la table est chargée (sinon retour au moteur en mémoire)
+        if not self.executer("SELECT count(*) FROM cours_ia", ())[0][0] or self.version() is None:
+            raise RuntimeError("table cours_ia vide (lancer python cours_postgres.py)")
+
+    def executer(self, sql, parametres):
+        if self.pool is None:
+            with self.verrou:
+                if self.pool is None:
+                    self.pool = ThreadedConnectionPool(1, self.connexions_max, self.url)
+        conn = self.pool.getconn()
+        try:
+            cur = conn.cursor()
+            cur.execute(sql, parametres)
+            lignes = cur.fetchall()
+            cur.close()
+            conn.rollback()
+            return lignes
+        except psycopg2.Error:
+            conn.rollback()
+            raise
+        finally:
+            # Une connexion coupée n'est pas remise dans le pool
+            self.pool.putconn(conn, close=bool(conn.closed))
+
+    def recharger(self, bases):
+        """Rien à reconstruire après un rechargement à chaud : les recherches lisent la table, que seul
+        python cours_postgres.py écrit (les bases relues viennent d'ailleurs de la table, voir lire())"""
+        return self
+
+    def version(self):
+        """Version des cours chargés dans la table (None s'ils n'ont jamais été chargés)"""
+        lignes = self.executer("SELECT version FROM cours_ia_version", ())
+        return lignes[0][0] if lignes else None
+
+    def lire(self):
+        """(version, {matière: {niveau: {sujet: cours}}}) : les cours de la table, dans leur ordre
+        (une seule requête, donc les cours de cette version)"""
+        lignes = self.executer("""
+            SELECT v.version, c.matiere, c.niveau, c.sujet, c.titre, c.contenu, c.exemples
+            FROM cours_ia c CROSS JOIN cours_ia_version v
+            ORDER BY c.matiere, c.ordre
+        """, ())
+        if not lignes:
+            raise RuntimeError("table cours_ia vide")
+        bases = {}
+        for _, matiere, niveau, sujet, titre, contenu, exemples in lignes:
+            bases.setdefault(matiere, {}).setdefault(niveau, {})[sujet] = {
+                "titre": titre, "contenu": contenu, "exemples": exemples}
+        return lignes[0][0], bases
+
+    @staticmethod
+    def resultat(ligne, score=None):
+        niveau, sujet, titre, contenu, exemples = ligne[:5]
+        resultat = {
+            "niveau": niveau,
+            "sujet": sujet,
+            "cours": {"titre": titre, "contenu": contenu, "exemples": exemples}
+        }
+        if score is not None:
+            resultat["score"] = round(score, 3)
+        return resultat
+
+    def rechercher(self, matiere, mot_cle):
+        """Cours dont le sujet, le titre ou le contenu contient le mot-clé (accents ignorés)"""
+        requete = replier_accents(mot_cle)
+        try:
+            lignes = self.executer("""
+                SELECT niveau, sujet, titre, contenu, exemples FROM cours_ia
+                WHERE matiere = %s AND (strpos(sujet_replie, %s) > 0 OR strpos(titre_replie, %s) > 0
+                                        OR strpos(contenu_replie, %s) > 0)
+                ORDER BY ordre
+            """, (matiere, requete, requete, requete))
+        except psycopg2.Error as e:
+            print(f"Erreur de recherche des cours: {e}")
+            return []
+        return [self.resultat(ligne) for ligne in lignes]
+
+    def classer(self, matiere, question, k=3, seuil=None, niveau=None):
+        """Les k cours les plus pertinents (ts_rank, titre et exemples favorisés), score ≥ seuil
+        niveau : classe de l'élève, pour écarter les cours des classes éloignées"""
+        if seuil is None:
+            seuil = SEUIL_PERTINENCE_POSTGRES
+        mots = tokeniser(question) if isinstance(question, str) else question
+        termes = sorted(set(mots) - MOTS_VIDES)
+        if not termes:
+            return []
+        try:
+            lignes = self.executer("""
+                SELECT niveau, sujet, titre, contenu, exemples, ts_rank(%s::float4[], document, requete) AS score
+                FROM cours_ia, to_tsquery('french', %s) AS requete
+                WHERE matiere = %s AND document @@ requete AND NOT (niveau = ANY(%s::text[]))
+                ORDER BY score DESC, ordre
+                LIMIT %s
+            """, (POIDS_TS_RANK, ' | '.join(termes), matiere, cles_exclues(matiere, niveau), k))
+        except psycopg2.Error as e:
+            print(f"Erreur de recherche des cours: {e}")
+            return []
+        return [self.resultat(ligne, ligne[5]) for ligne in lignes if ligne[5] >= seuil]
+
+
+if __name__ == '__main__':
+    from app import DATABASE_URL
+    from cours_francais import COURS_FRANCAIS
+    from cours_mathematiques import COURS_MATHEMATIQUES
+
+    connexion = psycopg2.connect(DATABASE_URL)
+    try:
+        nombre = charger(connexion, {'francais': COURS_FRANCAIS, 'mathematiques': COURS_MATHEMATIQUES})
+    finally:
+        connexion.close()
+    print(f"✅ {nombre} cours chargés dans la table cours_ia")
@@ -0,0 +1,232 @@
+# Base SQLite (FTS5) des cours de français et de mathématiques
+# Les dictionnaires de cours_francais.py et cours_mathematiques.py restent la source :
+# cette étape de construction les compile dans un seul fichier cours.sqlite, avec
+#   - cours_fts        : index plein texte (titre, exemples, contenu) classé par bm25()
+#   - cours_trigrammes : index trigrammes pour la recherche de sous-chaîne
+# Les textes indexés sont ceux du corpus normalisé (minuscules, sans accents).
+# Les workers ouvrent le fichier en lecture seule avec mmap_size : tous les processus
+# d'un serveur partagent les mêmes pages en cache et la recherche s'exécute en C.
+# Après une reconstruction (ou un rechargement à chaud des cours, voir rechargement_cours.py),
+# chaque connexion est rouverte sur le nouveau fichier à sa requête suivante.
+# Le fichier porte la signature des cours compilés (table meta) : lors d'un rechargement
+# à chaud, un seul worker du serveur le recompile (verrou de fichier), les autres
+# trouvent ensuite la même version et ne font que rouvrir leurs connexions.
+#
+# Construire la base :   python cours_sqlite.py   (à relancer après chaque modification des cours)
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+
+from corpus_normalise import CorpusNormalise
+from index_cours import MOTS_VIDES, POIDS_CHAMPS
+from moteurs_cours import signature
+from niveaux import cles_exclues
+from normalisation import replier_accents, tokeniser
+
+# fcntl (Unix) est optionnel : sans lui, deux workers peuvent compiler la même version en même temps
+try:
+    import fcntl
+    FCNTL_DISPONIBLE = True
+except ImportError:
+    FCNTL_DISPONIBLE = False
+
+CHEMIN_BASE = os.getenv('COURS_SQLITE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cours.sqlite'))
+MMAP_OCTETS = int(os.getenv('COURS_SQLITE_MMAP', str(64 * 1024 * 1024)))
+
+# bm25() de FTS5 somme les scores pondérés de chaque colonne (sans saturation commune
+# comme BM25F) : ses scores sont environ trois fois ceux de index_cours, d'où un seuil propre
+SEUIL_PERTINENCE_SQLITE = 3.0
+
+SCHEMA_SQL = """
+CREATE TABLE cours (
+    id INTEGER PRIMARY KEY,
+    matiere TEXT NOT NULL,
+    niveau TEXT NOT NULL,
+    sujet TEXT NOT NULL,
+    titre TEXT NOT NULL,
+    contenu TEXT NOT NULL,
+    exemples TEXT NOT NULL          -- liste JSON
+);
+CREATE INDEX idx_cours_matiere ON cours (matiere, id);
+CREATE TABLE meta (cle TEXT PRIMARY KEY, valeur TEXT NOT NULL);
+
+-- rowid = cours.id ; le sujet ("loi_normale") est indexé avec le titre
+CREATE VIRTUAL TABLE cours_fts USING fts5(titre, exemples, contenu, tokenize = 'unicode61 remove_diacritics 2');
+CREATE VIRTUAL TABLE cours_trigrammes USING fts5(sujet, titre, contenu, tokenize = 'trigram');
+"""
+
+
+def construire(bases, chemin=CHEMIN_BASE):
+    """Compile les bases {matière: {niveau: {sujet: cours}}} dans un nouveau fichier SQLite"""
+    # Suffixe du processus : plusieurs workers peuvent recompiler la base en même temps (rechargement à chaud)
+    temporaire = f'{chemin}.{os.getpid()}.tmp'
+    if os.path.exists(temporaire):
+        os.remove(temporaire)
+    connexion = sqlite3.connect(temporaire)
+    try:
+        connexion.executescript(SCHEMA_SQL)
+        identifiant = 0
+        for matiere, base in bases.items():
+            for document in CorpusNormalise(base):
+                identifiant += 1
+                cours = document.cours
+                connexion.execute(
+                    "INSERT INTO cours (id, matiere, niveau, sujet, titre, contenu, exemples) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (identifiant, matiere, document.niveau, document.sujet, cours['titre'], cours['contenu'],
+                     json.dumps(cours.get('exemples', []), ensure_ascii=False)))
+                replie = document.replie
+                connexion.execute(
+                    "INSERT INTO cours_fts (rowid, titre, exemples, contenu) VALUES (?, ?, ?, ?)",
+                    (identifiant, replie['sujet'].replace('_', ' ') + '\n' + replie['titre'],
+                     replie['exemples'], replie['contenu']))
+                connexion.execute(
+                    "INSERT INTO cours_trigrammes (rowid, sujet, titre, contenu) VALUES (?, ?, ?, ?)",
+                    (identifiant, replie['sujet'], replie['titre'], replie['contenu']))
+        connexion.execute("INSERT INTO meta (cle, valeur) VALUES ('signature', ?)", (signature(bases),))
+        connexion.execute("INSERT INTO cours_fts (cours_fts) VALUES ('optimize')")
+        connexion.execute("INSERT INTO cours_trigrammes (cours_trigrammes) VALUES ('optimize')")
+        connexion.commit()
+        connexion.execute("VACUUM")
+    finally:
+        connexion.close()
+    # Remplacement atomique : les connexions ouvertes lisent l'ancien fichier jusqu'à leur requête suivante
+    os.replace(temporaire, chemin)
+    return identifiant
+
+
+def signature_fichier(chemin):
+    """Signature des cours compilés dans le fichier (None s'il manque ou n'a pas de table meta)"""
+    try:
+        connexion = sqlite3.connect(f'file:{chemin}?mode=ro', uri=True)
+        try:
+            ligne = connexion.execute("SELECT valeur FROM meta WHERE cle = 'signature'").fetchone()
+        finally:
+            connexion.close()
+    except sqlite3.Error:
+        return None
+    return ligne[0] if ligne else None
+
+
+@contextlib.contextmanager
+def verrou_fichier(chemin):
+    """Verrou exclusif entre les processus du serveur (sans effet sans fcntl)"""
+    if not FCNTL_DISPONIBLE:
+        yield
+        return
+    with open(chemin, 'a') as fichier:
+        fcntl.flock(fichier, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fichier, fcntl.LOCK_UN)
+
+
+def construire_version(bases, chemin=CHEMIN_BASE):
+    """Compile les bases si le fichier ne contient pas déjà cette version des cours ;
+    retourne True si ce processus l'a compilé"""
+    version = signature(bases)
+    if signature_fichier(chemin) == version:
+        return False
+    # Les workers qui attendent le verrou trouvent ensuite le fichier à jour
+    with verrou_fichier(chemin + '.verrou'):
+        if signature_fichier(chemin) == version:
+            return False
+        construire(bases, chemin)
+        return True
+
+
+def echapper_like(texte):
+    return texte.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class MoteurSQLite:
+    """Recherche dans cours.sqlite, ouverte en lecture seule et projetée en mémoire (une connexion par thread)"""
+
+    def __init__(self, chemin=CHEMIN_BASE, mmap_octets=MMAP_OCTETS):
+        if not os.path.exists(chemin):
+            raise FileNotFoundError(chemin)
+        self.chemin = chemin
+        self.mmap_octets = mmap_octets
+        self.local = threading.local()
+
+    def connexion(self):
+        # Le fichier est remplacé (os.replace) à chaque construction : une connexion ouverte sur
+        # l'ancien fichier (autre inode ou date de modification) est fermée et rouverte
+        etat = os.stat(self.chemin)
+        signature = (etat.st_ino, etat.st_mtime_ns)
+        connexion = getattr(self.local, 'connexion', None)
+        if connexion is not None and self.local.signature != signature:
+            connexion.close()
+            connexion = None
+        if connexion is None:
+            connexion = sqlite3.connect(f'file:{self.chemin}?mode=ro', uri=True, check_same_thread=False)
+            connexion.execute(f"PRAGMA mmap_size = {int(self.mmap_octets)}")
+            connexion.execute("PRAGMA query_only = 1")
+            self.local.connexion = connexion
+            self.local.signature = signature
+        return connexion
+
+    def recharger(self, bases):
+        """Recompile le fichier après un rechargement à chaud des cours, une fois par version (même moteur :
+        chaque connexion est rouverte sur le nouveau fichier à sa requête suivante)"""
+        construire_version(bases, self.chemin)
+        return self
+
+    @staticmethod
+    def resultat(ligne, score=None):
+        niveau, sujet, titre, contenu, exemples = ligne[:5]
+        resultat = {
+            "niveau": niveau,
+            "sujet": sujet,
+            "cours": {"titre": titre, "contenu": contenu, "exemples": json.loads(exemples)}
+        }
+        if score is not None:
+            resultat["score"] = round(score, 3)
+        return resultat
+
+    def rechercher(self, matiere, mot_cle):
+        """Cours dont le sujet, le titre ou le contenu contient le mot-clé (accents ignorés)"""
+        motif = '%' + echapper_like(replier_accents(mot_cle)) + '%'
+        lignes = self.connexion().execute("""
+            SELECT c.niveau, c.sujet, c.titre, c.contenu, c.exemples
+            FROM cours_trigrammes t JOIN cours c ON c.id = t.rowid
+            WHERE c.matiere = ?
+              AND (t.sujet LIKE ? ESCAPE '\\' OR t.titre LIKE ? ESCAPE '\\' OR t.contenu LIKE ? ESCAPE '\\')
+            ORDER BY c.id
+        """, (matiere, motif, motif, motif)).fetchall()
+        return [self.resultat(ligne) for ligne in lignes]
+
+    def classer(self, matiere, question, k=3, seuil=None, niveau=None):
+        """Les k cours les plus pertinents (bm25 de FTS5, titre et exemples favorisés), score ≥ seuil
+        niveau : classe de l'élève, pour écarter les cours des classes éloignées"""
+        if seuil is None:
+            seuil = SEUIL_PERTINENCE_SQLITE
+        mots = tokeniser(question) if isinstance(question, str) else question
+        termes = sorted(set(mots) - MOTS_VIDES)
+        if not termes:
+            return []
+        # Préfixe pour les mots d'au moins 4 lettres : "derivee"* trouve aussi "derivees"
+        requete = ' OR '.join(f'"{terme}"*' if len(terme) >= 4 and not terme.isdigit() else f'"{terme}"'
+                              for terme in termes)
+        exclues = cles_exclues(matiere, niveau)
+        filtre = f" AND c.niveau NOT IN ({', '.join('?' * len(exclues))})" if exclues else ''
+        lignes = self.connexion().execute(f"""
+            SELECT c.niveau, c.sujet, c.titre, c.contenu, c.exemples, -bm25(cours_fts, ?, ?, ?) AS score
+            FROM cours_fts JOIN cours c ON c.id = cours_fts.rowid
+            WHERE cours_fts MATCH ? AND c.matiere = ?{filtre}
+            ORDER BY score DESC, c.id
+            LIMIT ?
+        """, (POIDS_CHAMPS['titre'], POIDS_CHAMPS['exemples'], POIDS_CHAMPS['contenu'],
+              requete, matiere, *exclues, k)).fetchall()
+        return [self.resultat(ligne, ligne[5]) for ligne in lignes if ligne[5] >= seuil]
+
+
+if __name__ == '__main__':
+    from cours_francais import COURS_FRANCAIS
+    from cours_mathematiques import COURS_MATHEMATIQUES
+
+    nombre = construire({'francais': COURS_FRANCAIS, 'mathematiques': COURS_MATHEMATIQUES})
+    print(f"✅ {nombre} cours compilés → {CHEMIN_BASE} ({os.path.getsize(CHEMIN_BASE) // 1024} Ko)")
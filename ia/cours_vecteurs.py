@@ -0,0 +1,244 @@
+# Recherche sémantique locale dans les cours (CPU seul, sans réseau ni modèle externe)
+# Chaque cours est découpé en passages (un paragraphe du contenu, précédé du titre) ;
+# chaque passage devient un vecteur de n-grammes de caractères hachés (3 à 5 lettres,
+# pondérés par IDF), normalisé. Une question proche par la forme des mots ("pentes",
+# "derivable", "coef directeur"...) retrouve ainsi des passages qu'une recherche par
+# mots exacts manque. Les vecteurs forment une matrice NumPy float32 enregistrée dans
+# cours_vecteurs-<signature>.npy et projetée en mémoire (np.load mmap_mode) : les workers
+# d'un serveur en partagent les pages. La similarité cosinus de tous les passages d'une
+# matière est un seul produit matrice × vecteur ; un cours prend le score de son
+# meilleur passage.
+# Chaque version des cours a sa matrice ; cours_vecteurs.npy.json (lignes, IDF et nom de
+# la matrice) est le seul fichier remplacé lors d'une reconstruction : un worker lit
+# toujours une matrice et les lignes qui vont avec.
+#
+# Construire les vecteurs :   python cours_vecteurs.py   (sinon construits au démarrage
+# s'ils manquent ou ne correspondent plus aux cours)
+# Activation :                COURS_MOTEUR=vecteurs
+
+import glob
+import json
+import os
+import sys
+import time
+import zlib
+
+from index_cours import MOTS_VIDES
+from moteurs_cours import signature
+from niveaux import cles_exclues
+from normalisation import tokeniser
+
+# NumPy est optionnel : sans lui, le moteur en mémoire reste utilisé
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:
+    NUMPY_DISPONIBLE = False
+
+DOSSIER = os.path.dirname(os.path.abspath(__file__))
+CHEMIN_VECTEURS = os.getenv('COURS_VECTEURS', os.path.join(DOSSIER, 'cours_vecteurs.npy'))
+DIMENSION = 2 ** 12
+TAILLES_NGRAMMES = (3, 4, 5)
+SEUIL_SIMILARITE = 0.25
+# Les matrices des versions précédentes sont effacées après ce délai (secondes) : un worker
+# qui vient de lire les métadonnées a eu le temps de projeter la sienne en mémoire
+DELAI_ANCIENNES_MATRICES = 60
+
+
+def ngrammes(mots):
+    """N-grammes de caractères des mots (bordés de #), toutes tailles confondues"""
+    resultat = []
+    for mot in mots:
+        borde = f'#{mot}#'
+        for taille in TAILLES_NGRAMMES:
+            resultat += [borde[i:i + taille] for i in range(len(borde) - taille + 1)]
+    return resultat
+
+
+def hacher(ngramme):
+    """Colonne d'un n-gramme (crc32 : stable d'un processus à l'autre)"""
+    return zlib.crc32(ngramme.encode('utf-8')) % DIMENSION
+
+
+def colonnes(texte):
+    """Colonnes (avec répétitions) des n-grammes des mots significatifs d'un texte"""
+    mots = tokeniser(texte) if isinstance(texte, str) else texte
+    return [hacher(n) for n in ngrammes([mot for mot in mots if mot not in MOTS_VIDES])]
+
+
+def passages(cours):
+    """Textes indexés d'un cours : un passage par paragraphe du contenu, précédé du titre"""
+    paragraphes = [p.strip() for p in cours['contenu'].split('\n\n') if p.strip()]
+    exemples = '\n'.join(cours.get('exemples', []))
+    if exemples:
+        paragraphes.append(exemples)
+    return [f"{cours['titre']}\n{paragraphe}" for paragraphe in paragraphes] or [cours['titre']]
+
+
+def chemin_matrice(chemin, version):
+    """Fichier de la matrice d'une version des cours, à côté des métadonnées"""
+    racine, extension = os.path.splitext(chemin)
+    return f'{racine}-{version}{extension}'
+
+
+def construire(bases, chemin=CHEMIN_VECTEURS):
+    """Calcule la matrice des passages de toutes les bases et l'enregistre (.npy de la version, puis .json) ;
+    retourne les métadonnées enregistrées"""
+    lignes = []              # (matière, niveau, sujet) de chaque passage, regroupés par matière
+    comptes = []
+    for matiere, base in bases.items():
+        for niveau, sujets in base.items():
+            for sujet, cours in sujets.items():
+                for texte in passages(cours):
+                    lignes.append((matiere, niveau, sujet))
+                    comptes.append(np.bincount(colonnes(texte), minlength=DIMENSION))
+    matrice = np.array(comptes, dtype=np.float32)
+    # IDF par colonne : les n-grammes présents partout ("ion#", "#la") ne pèsent presque rien
+    presence = np.count_nonzero(matrice, axis=0)
+    idf = np.log((1 + len(lignes)) / (1 + presence)).astype(np.float32) + np.float32(1)
+    matrice = np.log1p(matrice) * idf
+    normes = np.linalg.norm(matrice, axis=1, keepdims=True)
+    matrice /= np.maximum(normes, np.float32(1e-12))
+
+    version = signature(bases)
+    matrice_version = chemin_matrice(chemin, version)
+    meta = {'signature': version, 'dimension': DIMENSION, 'matrice': os.path.basename(matrice_version),
+            'lignes': lignes, 'idf': idf.tolist()}
+    # Suffixe du processus : plusieurs workers peuvent construire les vecteurs en même temps
+    temporaire = f'{matrice_version}.{os.getpid()}.tmp.npy'
+    np.save(temporaire, matrice)
+    os.replace(temporaire, matrice_version)
+    with open(f'{chemin}.{os.getpid()}.json.tmp', 'w', encoding='utf-8') as fichier:
+        json.dump(meta, fichier, ensure_ascii=False)
+    # Un seul remplacement atomique : les métadonnées désignent la matrice qui leur correspond
+    os.replace(f'{chemin}.{os.getpid()}.json.tmp', chemin + '.json')
+    effacer_anciennes_matrices(chemin, matrice_version)
+    return meta
+
+
+def effacer_anciennes_matrices(chemin, courante):
+    """Efface les matrices des versions précédentes (au-delà de DELAI_ANCIENNES_MATRICES)"""
+    racine, extension = os.path.splitext(chemin)
+    limite = time.time() - DELAI_ANCIENNES_MATRICES
+    for ancienne in glob.glob(f'{glob.escape(racine)}-*{extension}'):
+        try:
+            if ancienne != courante and os.path.getmtime(ancienne) < limite:
+                os.remove(ancienne)
+        except OSError:
+            # Déjà effacée par un autre worker, ou encore ouverte (Windows)
+            pass
+
+
+class MoteurVecteurs:
+    """Similarité cosinus entre la question et les passages de cours (matrice projetée en mémoire)"""
+
+    def __init__(self, chemin=CHEMIN_VECTEURS, seuil=SEUIL_SIMILARITE):
+        if not NUMPY_DISPONIBLE:
+            raise ImportError("NumPy n'est pas installé")
+        import cours_francais
+        import cours_mathematiques
+        self.modules = {'francais': cours_francais, 'mathematiques': cours_mathematiques}
+        self.chemin = chemin
+        self.seuil = seuil
+        bases = {matiere: self.base(matiere) for matiere in self.modules}
+        meta = self.lire_meta(chemin)
+        if meta is None or meta['signature'] != signature(bases) or meta['dimension'] != DIMENSION:
+            print(f"⚠️ Vecteurs de cours absents ou périmés : construction de {os.path.basename(chemin)}")
+            # Les métadonnées écrites par ce worker : un autre peut déjà avoir remplacé le fichier
+            meta = construire(bases, chemin)
+        self.matrice = np.load(os.path.join(os.path.dirname(chemin), meta['matrice']), mmap_mode='r')
+        self.idf = np.array(meta['idf'], dtype=np.float32)
+        self.lignes = [tuple(ligne) for ligne in meta['lignes']]
+        # Passages de chaque matière : lignes contiguës [debut, fin) de la matrice
+        self.tranches = {}
+        for numero, (matiere, _, _) in enumerate(self.lignes):
+            debut, _ = self.tranches.get(matiere, (numero, numero))
+            self.tranches[matiere] = (debut, numero + 1)
+
+    def recharger(self, bases):
+        """Nouveau moteur après un rechargement à chaud des cours : les vecteurs sont reconstruits
+        (signature changée) et les lignes de la matrice correspondent de nouveau aux bases en mémoire"""
+        return MoteurVecteurs(self.chemin, self.seuil)
+
+    @staticmethod
+    def lire_meta(chemin):
+        """Métadonnées enregistrées, ou None si elles manquent, désignent une matrice absente
+        ou datent d'avant les matrices par version"""
+        try:
+            with open(chemin + '.json', encoding='utf-8') as fichier:
+                meta = json.load(fichier)
+        except FileNotFoundError:
+            return None
+        if 'matrice' not in meta or not os.path.exists(os.path.join(os.path.dirname(chemin), meta['matrice'])):
+            return None
+        return meta
+
+    def base(self, matiere):
+        module = self.modules[matiere]
+        return module.COURS_FRANCAIS if matiere == 'francais' else module.COURS_MATHEMATIQUES
+
+    def vecteur(self, question):
+        """Vecteur normalisé de la question (mêmes n-grammes et IDF que les passages), ou None"""
+        indices = colonnes(question)
+        if not indices:
+            return None
+        vecteur = np.log1p(np.bincount(indices, minlength=DIMENSION).astype(np.float32)) * self.idf
+        return vecteur / np.linalg.norm(vecteur)
+
+    def similarites(self, matiere, question, niveau=None, seuil=None):
+        """[(score, niveau, sujet)] des cours de la matière (score ≥ seuil), triés par score décroissant"""
+        if seuil is None:
+            seuil = self.seuil
+        vecteur = self.vecteur(question)
+        if vecteur is None or matiere not in self.tranches:
+            return []
+        debut, fin = self.tranches[matiere]
+        scores = self.matrice[debut:fin] @ vecteur
+        exclues = set(cles_exclues(matiere, niveau))
+        meilleurs = {}
+        for numero in np.argsort(-scores, kind='stable'):
+            score = float(scores[numero])
+            if score < seuil:
+                break
+            _, niveau_cours, sujet = self.lignes[debut + numero]
+            if niveau_cours not in exclues and (niveau_cours, sujet) not in meilleurs:
+                meilleurs[(niveau_cours, sujet)] = score
+        return [(score, niveau_cours, sujet) for (niveau_cours, sujet), score in meilleurs.items()]
+
+    def resultat(self, matiere, niveau, sujet, score=None):
+        cours = self.base(matiere).get(niveau, {}).get(sujet)
+        if cours is None:
+            return None
+        resultat = {"niveau": niveau, "sujet": sujet, "cours": cours}
+        if score is not None:
+            resultat["score"] = round(score, 3)
+        return resultat
+
+    def rechercher(self, matiere, mot_cle):
+        """Cours proches du mot-clé (même forme de résultat que rechercher_cours_maths)"""
+        resultats = (self.resultat(matiere, niveau, sujet) for _, niveau, sujet in self.similarites(matiere, mot_cle))
+        return [resultat for resultat in resultats if resultat is not None]
+
+    def classer(self, matiere, question, k=3, seuil=None, niveau=None):
+        """Les k cours dont un passage est le plus proche de la question, score ≥ seuil"""
+        resultats = []
+        for score, niveau_cours, sujet in self.similarites(matiere, question, niveau, seuil):
+            if len(resultats) == k:
+                break
+            resultat = self.resultat(matiere, niveau_cours, sujet, score)
+            if resultat is not None:
+                resultats.append(resultat)
+        return resultats
+
+
+if __name__ == '__main__':
+    if not NUMPY_DISPONIBLE:
+        print("❌ NumPy n'est pas installé (pip install numpy)")
+        sys.exit(1)
+
+    from cours_francais import COURS_FRANCAIS
+    from cours_mathematiques import COURS_MATHEMATIQUES
+
+    meta = construire({'francais': COURS_FRANCAIS, 'mathematiques': COURS_MATHEMATIQUES})
+    matrice = os.path.join(os.path.dirname(CHEMIN_VECTEURS), meta['matrice'])
+    print(f"✅ {len(meta['lignes'])} passages vectorisés → {matrice} ({os.path.getsize(matrice) // 1024} Ko)")
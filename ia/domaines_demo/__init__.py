@@ -0,0 +1,83 @@
+# Registre des domaines du mode démo
+# Chaque domaine (salutations, grammaire, vocabulaire, situations, mathématiques,
+# général) est un module qui déclare ses intentions :
+#   INTENTIONS = [{"id": ..., "priorite": n, "mots": [...], "sauf": [...]},     → réponse constante reponses/<domaine>/<id>.md
+#                 {"id": ..., "priorite": n, "motif": regex, "gestionnaire": "nom_fonction",
+#                  "personnalisee": True}, ...]                                   → réponse construite par une fonction du module
+#   "par_niveau": True : le gestionnaire reçoit aussi la classe de l'élève (niveau=..., voir niveaux.py)
+#   "garde": "nom_fonction" : fonction du module qui confirme l'intention touchée (voir routeur_demo.py)
+#   LISTES_SECONDAIRES = {étiquette: [mots]}   (utilisées à l'intérieur des gestionnaires)
+# Le registre assemble ces déclarations, dans l'ordre des priorités, pour le routeur ;
+# les corps des réponses ne sont lus qu'à leur première utilisation (voir corps.py).
+
+import importlib
+
+MODULES_DOMAINES = ('salutations', 'general', 'grammaire', 'vocabulaire', 'situations', 'mathematiques')
+
+
+class RegistreDomaines:
+    """Déclarations de tous les domaines, indexées par intention"""
+
+    def __init__(self, modules=MODULES_DOMAINES, intention_par_defaut='defaut'):
+        self.intention_par_defaut = intention_par_defaut
+        self.domaines = {}
+        self.declarations = {}       # intention → (module du domaine, déclaration)
+        for nom in modules:
+            module = importlib.import_module(f'{__name__}.{nom}')
+            self.domaines[nom] = module
+            for declaration in module.INTENTIONS:
+                if declaration['id'] in self.declarations:
+                    raise ValueError(f"Intention {declaration['id']} déclarée deux fois")
+                self.declarations[declaration['id']] = (module, declaration)
+
+    def intentions(self):
+        """Intentions à déclencheurs (mots-clés ou regex), dans l'ordre de priorité du routeur"""
+        declarees = []
+        for module, declaration in self.declarations.values():
+            if 'mots' not in declaration and 'motif' not in declaration:
+                continue
+            if 'garde' in declaration:
+                declaration = dict(declaration, garde=getattr(module, declaration['garde']))
+            declarees.append(declaration)
+        return sorted(declarees, key=lambda declaration: declaration['priorite'])
+
+    def listes_secondaires(self):
+        """Listes secondaires de tous les domaines"""
+        listes = {}
+        for module in self.domaines.values():
+            listes.update(getattr(module, 'LISTES_SECONDAIRES', {}))
+        return listes
+
+    def personnalisees(self):
+        """Intentions dont la réponse reprend le texte de l'élève (jamais mises en cache)"""
+        return {intention for intention, (_, d) in self.declarations.items() if d.get('personnalisee')}
+
+    def par_niveau(self):
+        """Intentions dont la réponse dépend de la classe de l'élève"""
+        return {intention for intention, (_, d) in self.declarations.items() if d.get('par_niveau')}
+
+    def est_constante(self, intention):
+        """Vrai si la réponse de l'intention ne dépend pas du message (corps servi tel quel)"""
+        entree = self.declarations.get(intention)
+        return entree is not None and 'gestionnaire' not in entree[1]
+
+    def reponse_constante(self, intention):
+        """Texte de la réponse constante d'une intention, ou None"""
+        if not self.est_constante(intention):
+            return None
+        module, _ = self.declarations[intention]
+        return module.CORPS.texte(intention)
+
+    def repondre(self, intention, message_normalise, touches, routeur, niveau=None):
+        """Construit la réponse de l'intention choisie par le routeur (niveau : classe de l'élève)"""
+        module, declaration = self.declarations.get(intention) or self.declarations[self.intention_par_defaut]
+        if 'gestionnaire' in declaration:
+            gestionnaire = getattr(module, declaration['gestionnaire'])
+            if declaration.get('par_niveau'):
+                return gestionnaire(message_normalise, touches, routeur, niveau=niveau)
+            return gestionnaire(message_normalise, touches, routeur)
+        return module.CORPS.texte(declaration['id'])
+
+    def statistiques(self):
+        """Corps déjà chargés en mémoire, par domaine"""
+        return {nom: module.CORPS.charges() for nom, module in self.domaines.items()}
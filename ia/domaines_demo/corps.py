@@ -0,0 +1,58 @@
+# Corps des réponses d'un domaine, chargés à la demande
+# Les textes (Markdown) sont rangés dans reponses/<domaine>/<nom>.md et ne sont lus
+# qu'à leur première utilisation : un worker ne garde en mémoire que les réponses
+# réellement servies. Les corps personnalisés utilisent les marqueurs ${...} de
+# string.Template.
+
+import os
+import threading
+from string import Template
+
+DOSSIER_REPONSES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reponses')
+
+
+class CorpsReponses:
+    """Corps de réponse d'un domaine, lus sur disque à la première utilisation puis gardés en mémoire"""
+
+    def __init__(self, domaine, dossier=DOSSIER_REPONSES):
+        self.domaine = domaine
+        self.dossier = os.path.join(dossier, domaine)
+        self.textes = {}
+        self.verrou = threading.Lock()
+
+    def chemin(self, nom):
+        return os.path.join(self.dossier, nom + '.md')
+
+    def texte(self, nom):
+        """Retourne le corps tel quel (chargé au premier appel)"""
+        texte = self.textes.get(nom)
+        if texte is None:
+            with self.verrou:
+                texte = self.textes.get(nom)
+                if texte is None:
+                    with open(self.chemin(nom), encoding='utf-8', newline='') as fichier:
+                        texte = fichier.read()
+                    # Le saut de ligne final du fichier ne fait pas partie de la réponse
+                    if texte.endswith('\n'):
+                        texte = texte[:-1]
+                    self.textes[nom] = texte
+        return texte
+
+    def remplir(self, nom, **valeurs):
+        """Retourne le corps avec ses marqueurs ${...} remplacés"""
+        return Template(self.texte(nom)).substitute(valeurs)
+
+    def charges(self):
+        """Noms des corps déjà chargés en mémoire"""
+        return sorted(self.textes)
+
+
+def parcourir_reponses(domaines_exclus=(), dossier=DOSSIER_REPONSES):
+    """Textes de toutes les réponses des domaines (lus sans être gardés en mémoire), hors domaines exclus"""
+    for domaine in sorted(os.listdir(dossier)):
+        if domaine in domaines_exclus or not os.path.isdir(os.path.join(dossier, domaine)):
+            continue
+        for nom in sorted(os.listdir(os.path.join(dossier, domaine))):
+            if nom.endswith('.md'):
+                with open(os.path.join(dossier, domaine, nom), encoding='utf-8') as fichier:
+                    yield fichier.read()
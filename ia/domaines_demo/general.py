@@ -0,0 +1,88 @@
+# Domaine « général » du mode démo
+# Présentation du professeur (français, bases, compétences, programmation) et
+# réponse par défaut quand aucune intention n'est touchée.
+# Les déclencheurs sont déclarés ici ; les corps des réponses sont dans
+# reponses/general/ et ne sont lus qu'à leur première utilisation.
+
+from domaines_demo.corps import CorpsReponses
+
+CORPS = CorpsReponses('general')
+
+INTENTIONS = [
+    # Détection de questions sur le français - RÉPONSE SIMPLE ET PRÉCISE
+    {'id': 'francais', 'priorite': 40, 'mots': ['français', 'france', 'langue française']},
+    # Détection de questions sur les BASES du français
+    {'id': 'bases', 'priorite': 50, 'mots': ['base', 'débutant', 'commencer', 'premier', 'première']},
+    # Détection de questions sur la compétence en français
+    {'id': 'competence', 'priorite': 60, 'mots': ['compétent', 'compétence', 'prêt', 'prête']},
+    # Détection de questions sur enseigner / apprendre
+    {'id': 'enseigner', 'priorite': 70, 'mots': ['enseigner', 'apprendre', 'apprends', 'enseigne']},
+    # Détection de questions sur la programmation - RÉPONSE SIMPLE ET PRÉCISE
+    {'id': 'programmation', 'priorite': 100, 'mots': ['programmation', 'code', 'python', 'javascript', 'algorithme', 'coder', 'programmer']},
+    # Réponse par défaut - RÉPONSE PÉDAGOGIQUE MÊME SANS API (aucune intention touchée)
+    {'id': 'defaut', 'gestionnaire': 'repondre_defaut', 'personnalisee': True},
+]
+
+# Mots qui signalent une question sur le français : réponse par défaut, et questions de définition
+# du domaine grammaire (importée par grammaire.py)
+MOTS_FRANCAIS = [
+        'français', 'france', 'langue', 'française',
+        'verbe', 'conjugaison', 'conjuguer', 'conjugue', 'conjuguée',
+        'grammaire', 'orthographe', 'vocabulaire', 'syntaxe', 'prononciation', 'phonétique',
+        'accent', 'cédille',
+        'pluriel', 'singulier', 'genres', 'masculin', 'féminin',
+        'article', 'le', 'la', 'les', 'un', 'une', 'des',
+        'pronom', 'je', 'tu', 'il', 'elle', 'nous', 'vous', 'ils',
+        'adjectif', 'grand', 'petit', 'beau', 'joli',
+        'synonyme', 'antonyme', 'contraire', 'opposé',
+        'phrase', 'structure',
+        'temps', 'présent', 'passé', 'futur', 'imparfait', 'conditionnel', 'subjonctif',
+        'plus-que-parfait',
+        'être', 'avoir', 'faire', 'aller', 'venir', 'pouvoir', 'vouloir', 'savoir',
+        'irrégulier', 'régulier',
+        'préposition', 'de', 'dans', 'sur', 'sous', 'avec', 'sans', 'pour', 'par',
+        'nombre', 'chiffre', 'compter', 'deux', 'trois',
+        'écrire', 'lire', 'parler', 'écouter', 'comprendre', 'apprendre',
+        'mot', 'mots', 'lettre', 'alphabet', 'abc',
+        'règle', 'exception',
+        'accord', 'accorder',
+        'complément', 'sujet',
+        'déclaration', 'interrogation', 'exclamation', 'impératif',
+        'voyelle', 'consonne',
+        'son', 'sons', 'prononcer', 'dire',
+        'expression',
+        'famille', 'mère', 'père', 'frère', 'sœur', 'parents',
+        'corps', 'tête', 'main', 'pied', 'bras', 'jambe', 'yeux', 'nez', 'bouche',
+        'nourriture', 'manger', 'aliment', 'repas', 'pain', 'eau', 'viande', 'légume', 'fruit',
+        'restaurant', 'commander', 'menu', 'addition', 'serveur',
+        'magasin', 'acheter', 'vendre', 'prix', 'coûter', 'payer',
+        'couleur', 'rouge', 'bleu', 'vert', 'jaune', 'noir', 'blanc',
+        'jour', 'semaine', 'mois', 'lundi', 'mardi', 'janvier', 'février', 'date',
+        'vêtement', 'habits', 'chemise', 'pantalon', 'robe', 'chaussures',
+        'maison', 'appartement', 'chambre', 'cuisine', 'salon',
+        'transport', 'voiture', 'bus', 'train', 'avion', 'vélo',
+        'métier', 'travail', 'profession', 'médecin', 'ingénieur', 'cuisinier',
+        'école', 'classe', 'élève', 'cours', 'devoir', 'examen',
+        'négation', 'ne pas', 'jamais', 'rien', 'personne',
+        'question', 'interrogatif', 'qui', 'quoi', 'où', 'quand', 'pourquoi', 'comment',
+        'objet direct', 'objet indirect', 'cod', 'coi',
+        'adverbe', 'bien', 'mal', 'vite', 'lentement', 'beaucoup', 'peu',
+        'conjonction', 'et', 'mais', 'donc', 'car', 'parce que'
+]
+
+LISTES_SECONDAIRES = {
+    'defaut:francais': MOTS_FRANCAIS,
+    'defaut:question': ['quoi', 'qu\'est', 'c\'est', 'explique', 'définis', 'comment', 'pourquoi'],
+}
+
+
+def repondre_defaut(message_normalise, touches, routeur):
+    """Réponse par défaut : pédagogique même sans API, selon que la question porte sur le français ou non"""
+    message = message_normalise.original
+    # Si c'est une question sur le français, répondre directement
+    if 'defaut:francais' in touches:
+        return CORPS.remplir('defaut_francais', message=message)
+    # Si la question contient des mots-clés simples, donner une réponse de base
+    if 'defaut:question' in touches:
+        return CORPS.remplir('defaut_question', message=message)
+    return CORPS.remplir('defaut_generique', extrait=message[:200] + ('...' if len(message) > 200 else ''))
@@ -0,0 +1,253 @@
+# Domaine « grammaire » du mode démo
+# Alphabet, verbes et conjugaison, genres, pluriels, accords, accents, syntaxe,
+# prononciation, temps verbaux, classes de mots, négation, questions... ainsi que
+# la conjugaison d'un verbe précis et les questions de définition.
+# Les déclencheurs sont déclarés ici ; les corps des réponses sont dans
+# reponses/grammaire/ et ne sont lus qu'à leur première utilisation.
+
+import re
+
+from domaines_demo.corps import CorpsReponses
+from domaines_demo.general import MOTS_FRANCAIS
+
+CORPS = CorpsReponses('grammaire')
+
+MOTIF_CONJUGAISON = re.compile(r'conjug(?:ue|uer|aison)\s+(?:le\s+)?(?:verbe\s+)?([a-zàâäéèêëïîôùûüÿç]+)')
+
+INTENTIONS = [
+    # Détection de questions sur l'alphabet - RÉPONSE COMPLÈTE AVEC LES 26 LETTRES
+    {'id': 'alphabet', 'priorite': 30, 'mots': ['alphabet', 'lettres', 'abc']},
+    # CONJUGAISON SPÉCIFIQUE - Détecter "conjugue [verbe]" ou "conjuguer [verbe]"
+    {'id': 'conjugaison_verbe', 'priorite': 110, 'motif': MOTIF_CONJUGAISON,
+     'gestionnaire': 'repondre_conjugaison', 'personnalisee': True},
+    # GRAMMAIRE - VERBES ET CONJUGAISON (100% COMPLET)
+    {'id': 'verbe', 'priorite': 120, 'mots': ['verbe', 'conjugaison', 'conjuguer', 'conjugue']},
+    # GRAMMAIRE - GENRES (MASCULIN/FÉMININ) (100% COMPLET)
+    {'id': 'genre', 'priorite': 130, 'mots': ['genre', 'masculin', 'féminin', 'le ou la']},
+    # GRAMMAIRE - PLURIELS (100% COMPLET)
+    {'id': 'pluriel', 'priorite': 140, 'mots': ['pluriel', 'singulier']},
+    # GRAMMAIRE - ACCORDS (100% COMPLET)
+    {'id': 'accord', 'priorite': 150, 'mots': ['accord', 'accorder']},
+    # ORTHOGRAPHE - ACCENTS (100% COMPLET)
+    {'id': 'accents', 'priorite': 160, 'mots': ['accent', 'cédille']},
+    # SYNTAXE - PHRASES
+    {'id': 'phrase', 'priorite': 190, 'mots': ['phrase', 'syntaxe']},
+    # PRONONCIATION - PHONÉTIQUE
+    {'id': 'prononciation', 'priorite': 200, 'mots': ['prononciation', 'prononcer', 'son', 'sons', 'phonétique']},
+    # TEMPS VERBAUX - PRÉSENT (100% COMPLET)
+    {'id': 'present', 'priorite': 210, 'mots': ['présent']},
+    # TEMPS VERBAUX - PASSÉ COMPOSÉ (100% COMPLET)
+    {'id': 'passe_compose', 'priorite': 220, 'mots': ['passé', 'j\'ai mangé']},
+    # TEMPS VERBAUX - FUTUR (100% COMPLET)
+    {'id': 'futur', 'priorite': 230, 'mots': ['futur', 'demain', 'plus tard']},
+    # TEMPS VERBAUX - IMPARFAIT (100% COMPLET)
+    {'id': 'imparfait', 'priorite': 240, 'mots': ['imparfait', 'j\'étais', 'je mangeais']},
+    # GRAMMAIRE - ARTICLES (100% COMPLET)
+    {'id': 'article', 'priorite': 250, 'mots': ['article', 'le la les', 'un une des', 'défini', 'indéfini']},
+    # GRAMMAIRE - PRONOMS
+    {'id': 'pronom', 'priorite': 260, 'mots': ['pronom', 'je tu il', 'moi toi lui', 'me te le']},
+    # GRAMMAIRE - ADJECTIFS
+    {'id': 'adjectif', 'priorite': 270, 'mots': ['adjectif', 'grand petit', 'beau joli', 'qualificatif']},
+    # GRAMMAIRE - VERBES IRRÉGULIERS
+    {'id': 'verbes_irreguliers', 'priorite': 280, 'mots': ['irrégulier', 'être avoir faire', 'aller venir']},
+    # GRAMMAIRE - CONDITIONNEL
+    {'id': 'conditionnel', 'priorite': 290, 'mots': ['conditionnel', 'je voudrais', 'je pourrais', 'je ferais']},
+    # GRAMMAIRE - PRÉPOSITIONS
+    {'id': 'preposition', 'priorite': 300, 'mots': ['préposition', 'à de dans', 'sur sous', 'avec sans']},
+    # GRAMMAIRE - NOMBRES
+    {'id': 'nombres', 'priorite': 310, 'mots': ['nombre', 'chiffre', 'compter', 'un deux trois']},
+    # GRAMMAIRE - NÉGATION
+    {'id': 'negation', 'priorite': 450, 'mots': ['négation', 'ne pas', 'pas de', 'jamais', 'rien', 'personne']},
+    # GRAMMAIRE - QUESTIONS
+    {'id': 'question', 'priorite': 460, 'mots': ['question', 'interrogatif', 'qui', 'quoi', 'où', 'quand', 'pourquoi', 'comment']},
+    # GRAMMAIRE - COMPLÉMENTS D'OBJET
+    {'id': 'complement', 'priorite': 470, 'mots': ['complément', 'objet direct', 'objet indirect', 'cod', 'coi']},
+    # GRAMMAIRE - ADVERBES
+    {'id': 'adverbe', 'priorite': 480, 'mots': ['adverbe', 'bien', 'mal', 'vite', 'lentement', 'beaucoup', 'peu']},
+    # GRAMMAIRE - CONJONCTIONS
+    {'id': 'conjonction', 'priorite': 490, 'mots': ['conjonction', 'et', 'ou', 'mais', 'donc', 'car', 'parce que']},
+    # Détection de questions générales "c'est quoi", "qu'est-ce que"
+    {'id': 'definition', 'priorite': 500, 'mots': ['c\'est quoi', 'qu\'est-ce que', 'explique', 'définition'],
+     'gestionnaire': 'repondre_definition', 'personnalisee': True},
+]
+
+LISTES_SECONDAIRES = {
+    'conjugaison:passe_compose': ['passé', 'j\'ai'],
+    'conjugaison:futur': ['futur', 'demain'],
+    'conjugaison:imparfait': ['imparfait', 'j\'étais', 'je mangeais'],
+    'conjugaison:conditionnel': ['conditionnel'],
+    'definition:francais': MOTS_FRANCAIS,
+    'definition:verbe': ['verbe', 'conjugaison', 'conjuguer'],
+    'definition:pluriel': ['pluriel'],
+}
+
+# Temps reconnus dans une demande de conjugaison (le présent par défaut)
+TEMPS_CONJUGAISON = (
+    ('conjugaison:passe_compose', 'passé composé'),
+    ('conjugaison:futur', 'futur'),
+    ('conjugaison:imparfait', 'imparfait'),
+    ('conjugaison:conditionnel', 'conditionnel'),
+)
+
+PRONOMS = ['Je', 'Tu', 'Il/Elle', 'Nous', 'Vous', 'Ils/Elles']
+
+# Verbes irréguliers principaux
+VERBES_IRREGULIERS = {
+    'être': {
+        'présent': ['je suis', 'tu es', 'il/elle est', 'nous sommes', 'vous êtes', 'ils/elles sont'],
+        'passé composé': ['j\'ai été', 'tu as été', 'il/elle a été', 'nous avons été', 'vous avez été', 'ils/elles ont été'],
+        'futur': ['je serai', 'tu seras', 'il/elle sera', 'nous serons', 'vous serez', 'ils/elles seront'],
+        'imparfait': ['j\'étais', 'tu étais', 'il/elle était', 'nous étions', 'vous étiez', 'ils/elles étaient'],
+        'conditionnel': ['je serais', 'tu serais', 'il/elle serait', 'nous serions', 'vous seriez', 'ils/elles seraient']
+    },
+    'avoir': {
+        'présent': ['j\'ai', 'tu as', 'il/elle a', 'nous avons', 'vous avez', 'ils/elles ont'],
+        'passé composé': ['j\'ai eu', 'tu as eu', 'il/elle a eu', 'nous avons eu', 'vous avez eu', 'ils/elles ont eu'],
+        'futur': ['j\'aurai', 'tu auras', 'il/elle aura', 'nous aurons', 'vous aurez', 'ils/elles auront'],
+        'imparfait': ['j\'avais', 'tu avais', 'il/elle avait', 'nous avions', 'vous aviez', 'ils/elles avaient'],
+        'conditionnel': ['j\'aurais', 'tu aurais', 'il/elle aurait', 'nous aurions', 'vous auriez', 'ils/elles auraient']
+    },
+    'faire': {
+        'présent': ['je fais', 'tu fais', 'il/elle fait', 'nous faisons', 'vous faites', 'ils/elles font'],
+        'passé composé': ['j\'ai fait', 'tu as fait', 'il/elle a fait', 'nous avons fait', 'vous avez fait', 'ils/elles ont fait'],
+        'futur': ['je ferai', 'tu feras', 'il/elle fera', 'nous ferons', 'vous ferez', 'ils/elles feront'],
+        'imparfait': ['je faisais', 'tu faisais', 'il/elle faisait', 'nous faisions', 'vous faisiez', 'ils/elles faisaient'],
+        'conditionnel': ['je ferais', 'tu ferais', 'il/elle ferait', 'nous ferions', 'vous feriez', 'ils/elles feraient']
+    },
+    'aller': {
+        'présent': ['je vais', 'tu vas', 'il/elle va', 'nous allons', 'vous allez', 'ils/elles vont'],
+        'passé composé': ['je suis allé(e)', 'tu es allé(e)', 'il/elle est allé(e)', 'nous sommes allé(e)s', 'vous êtes allé(e)s', 'ils/elles sont allé(e)s'],
+        'futur': ['j\'irai', 'tu iras', 'il/elle ira', 'nous irons', 'vous irez', 'ils/elles iront'],
+        'imparfait': ['j\'allais', 'tu allais', 'il/elle allait', 'nous allions', 'vous alliez', 'ils/elles allaient'],
+        'conditionnel': ['j\'irais', 'tu irais', 'il/elle irait', 'nous irions', 'vous iriez', 'ils/elles iraient']
+    },
+    'venir': {
+        'présent': ['je viens', 'tu viens', 'il/elle vient', 'nous venons', 'vous venez', 'ils/elles viennent'],
+        'passé composé': ['je suis venu(e)', 'tu es venu(e)', 'il/elle est venu(e)', 'nous sommes venu(e)s', 'vous êtes venu(e)s', 'ils/elles sont venu(e)s'],
+        'futur': ['je viendrai', 'tu viendras', 'il/elle viendra', 'nous viendrons', 'vous viendrez', 'ils/elles viendront'],
+        'imparfait': ['je venais', 'tu venais', 'il/elle venait', 'nous venions', 'vous veniez', 'ils/elles venaient'],
+        'conditionnel': ['je viendrais', 'tu viendrais', 'il/elle viendrait', 'nous viendrions', 'vous viendriez', 'ils/elles viendraient']
+    },
+    'pouvoir': {
+        'présent': ['je peux', 'tu peux', 'il/elle peut', 'nous pouvons', 'vous pouvez', 'ils/elles peuvent'],
+        'passé composé': ['j\'ai pu', 'tu as pu', 'il/elle a pu', 'nous avons pu', 'vous avez pu', 'ils/elles ont pu'],
+        'futur': ['je pourrai', 'tu pourras', 'il/elle pourra', 'nous pourrons', 'vous pourrez', 'ils/elles pourront'],
+        'imparfait': ['je pouvais', 'tu pouvais', 'il/elle pouvait', 'nous pouvions', 'vous pouviez', 'ils/elles pouvaient'],
+        'conditionnel': ['je pourrais', 'tu pourrais', 'il/elle pourrait', 'nous pourrions', 'vous pourriez', 'ils/elles pourraient']
+    },
+    'vouloir': {
+        'présent': ['je veux', 'tu veux', 'il/elle veut', 'nous voulons', 'vous voulez', 'ils/elles veulent'],
+        'passé composé': ['j\'ai voulu', 'tu as voulu', 'il/elle a voulu', 'nous avons voulu', 'vous avez voulu', 'ils/elles ont voulu'],
+        'futur': ['je voudrai', 'tu voudras', 'il/elle voudra', 'nous voudrons', 'vous voudrez', 'ils/elles voudront'],
+        'imparfait': ['je voulais', 'tu voulais', 'il/elle voulait', 'nous voulions', 'vous vouliez', 'ils/elles voulaient'],
+        'conditionnel': ['je voudrais', 'tu voudrais', 'il/elle voudrait', 'nous voudrions', 'vous voudriez', 'ils/elles voudraient']
+    },
+    'savoir': {
+        'présent': ['je sais', 'tu sais', 'il/elle sait', 'nous savons', 'vous savez', 'ils/elles savent'],
+        'passé composé': ['j\'ai su', 'tu as su', 'il/elle a su', 'nous avons su', 'vous avez su', 'ils/elles ont su'],
+        'futur': ['je saurai', 'tu sauras', 'il/elle saura', 'nous saurons', 'vous saurez', 'ils/elles sauront'],
+        'imparfait': ['je savais', 'tu savais', 'il/elle savait', 'nous savions', 'vous saviez', 'ils/elles savaient'],
+        'conditionnel': ['je saurais', 'tu saurais', 'il/elle saurait', 'nous saurions', 'vous sauriez', 'ils/elles sauraient']
+    }
+}
+
+
+def conjuguer_verbe(verbe, temps='présent'):
+    """Retourne les 6 formes du verbe au temps demandé, ou None si le verbe n'est pas connu"""
+    verbe = verbe.lower().strip()
+
+    # Vérifier si c'est un verbe irrégulier
+    if verbe in VERBES_IRREGULIERS and temps in VERBES_IRREGULIERS[verbe]:
+        return VERBES_IRREGULIERS[verbe][temps]
+
+    # Verbes réguliers du 1er groupe (en -er)
+    if verbe.endswith('er') and len(verbe) > 2:
+        radical = verbe[:-2]
+        terminaisons = {
+            'présent': ['e', 'es', 'e', 'ons', 'ez', 'ent'],
+            'passé composé': [f'ai {verbe[:-2]}é', f'as {verbe[:-2]}é', f'a {verbe[:-2]}é', f'avons {verbe[:-2]}é', f'avez {verbe[:-2]}é', f'ont {verbe[:-2]}é'],
+            'futur': ['ai', 'as', 'a', 'ons', 'ez', 'ont'],
+            'imparfait': ['ais', 'ais', 'ait', 'ions', 'iez', 'aient'],
+            'conditionnel': ['ais', 'ais', 'ait', 'ions', 'iez', 'aient']
+        }
+        if temps == 'futur' or temps == 'conditionnel':
+            radical_futur = radical + 'er'
+            if temps == 'futur':
+                return [f'je {radical_futur}ai', f'tu {radical_futur}as', f'il/elle {radical_futur}a', f'nous {radical_futur}ons', f'vous {radical_futur}ez', f'ils/elles {radical_futur}ont']
+            else:
+                return [f'je {radical_futur}ais', f'tu {radical_futur}ais', f'il/elle {radical_futur}ait', f'nous {radical_futur}ions', f'vous {radical_futur}iez', f'ils/elles {radical_futur}aient']
+        elif temps in terminaisons:
+            if temps == 'passé composé':
+                return terminaisons[temps]
+            else:
+                return [f'je {radical}{terminaisons[temps][0]}', f'tu {radical}{terminaisons[temps][1]}', f'il/elle {radical}{terminaisons[temps][2]}', f'nous {radical}{terminaisons[temps][3]}', f'vous {radical}{terminaisons[temps][4]}', f'ils/elles {radical}{terminaisons[temps][5]}']
+
+    # Verbes du 2e groupe (en -ir comme finir)
+    if verbe.endswith('ir') and len(verbe) > 2:
+        radical = verbe[:-2]
+        if temps == 'présent':
+            return [f'je {radical}is', f'tu {radical}is', f'il/elle {radical}it', f'nous {radical}issons', f'vous {radical}issez', f'ils/elles {radical}issent']
+        elif temps == 'passé composé':
+            return [f'j\'ai {radical}i', f'tu as {radical}i', f'il/elle a {radical}i', f'nous avons {radical}i', f'vous avez {radical}i', f'ils/elles ont {radical}i']
+        elif temps == 'futur':
+            return [f'je {radical}irai', f'tu {radical}iras', f'il/elle {radical}ira', f'nous {radical}irons', f'vous {radical}irez', f'ils/elles {radical}iront']
+        elif temps == 'imparfait':
+            return [f'je {radical}issais', f'tu {radical}issais', f'il/elle {radical}issait', f'nous {radical}issions', f'vous {radical}issiez', f'ils/elles {radical}issaient']
+        elif temps == 'conditionnel':
+            return [f'je {radical}irais', f'tu {radical}irais', f'il/elle {radical}irait', f'nous {radical}irions', f'vous {radical}iriez', f'ils/elles {radical}iraient']
+
+    # Si on ne connaît pas le verbe, donner une réponse générique
+    return None
+
+
+def repondre_conjugaison(message_normalise, touches, routeur):
+    """Conjugaison complète du verbe demandé, avec exemples et exercices"""
+    verbe_demande = MOTIF_CONJUGAISON.search(message_normalise.brut).group(1).strip()
+    # Détecter le temps demandé
+    temps_demande = next((temps for etiquette, temps in TEMPS_CONJUGAISON if etiquette in touches), 'présent')
+
+    conjugaison = conjuguer_verbe(verbe_demande, temps_demande)
+    if not conjugaison:
+        return CORPS.remplir('conjugaison_inconnue', verbe=verbe_demande, temps=temps_demande)
+
+    # Extraire le verbe conjugué pour les exemples
+    verbes_conjugues = [forme.split()[-1] if len(forme.split()) > 1 else forme for forme in conjugaison[:3]]
+    return CORPS.remplir(
+        'conjugaison_tableau',
+        verbe=verbe_demande,
+        temps=temps_demande,
+        temps_majuscules=temps_demande.upper(),
+        conjugaison='\n'.join(f"- **{PRONOMS[i]}** : {conjugaison[i]}" for i in range(6)),
+        verbe_je=verbes_conjugues[0],
+        verbe_tu=verbes_conjugues[1],
+        verbe_il=verbes_conjugues[2],
+        forme_je=conjugaison[0],
+        forme_tu=conjugaison[1],
+        forme_il=conjugaison[2],
+        forme_nous=conjugaison[3],
+        forme_vous=conjugaison[4],
+        forme_ils=conjugaison[5],
+    )
+
+
+def repondre_definition(message_normalise, touches, routeur):
+    """Questions « c'est quoi... » : réponse directe pour le français, sinon invitation à préciser"""
+    message = message_normalise.original
+    # Extrait le sujet de la question
+    sujet = message
+    for mot in ['c\'est quoi', 'qu\'est-ce que', 'qu\'est ce que', 'explique', 'définition', 'définis', 'définir']:
+        sujet = sujet.replace(mot, '').strip()
+    sujet = sujet.replace('?', '').strip()
+    touches_sujet = routeur.detecter(sujet.lower().strip())
+
+    # Si c'est une question sur le français, répondre directement avec une réponse complète
+    if 'definition:francais' in touches_sujet:
+        # Essayer de donner une réponse spécifique selon le sujet
+        if 'definition:verbe' in touches_sujet:
+            return CORPS.texte('definition_verbe')
+        if 'definition:pluriel' in touches_sujet:
+            return CORPS.texte('definition_pluriel')
+        return CORPS.remplir('definition_francais', message=message, sujet=sujet)
+
+    # Pour les autres sujets, donner une réponse plus utile
+    return CORPS.remplir('definition_autre', message=message, sujet=sujet)
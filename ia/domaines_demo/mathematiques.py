@@ -0,0 +1,129 @@
+# Domaine « mathématiques » du mode démo (programme STPL, Seconde → Terminale)
+# Déclenché par le lexique pondéré des maths (lexique_maths.py, tiré des cours) ; la réponse
+# est la section du cours de maths le plus pertinent
+# (classement BM25 du moteur de cours configuré, voir moteurs_cours.py) s'il dépasse
+# le seuil, sinon une fiche par thème (dérivées, intégrales...).
+# Les fiches sont dans reponses/mathematiques/ et ne sont lues qu'à leur première utilisation.
+
+import importlib
+
+from domaines_demo import MODULES_DOMAINES
+from domaines_demo.corps import CorpsReponses, parcourir_reponses
+from index_cours import MOTS_VIDES
+from lexique_maths import MOTIF_NOTATION, LexiqueMaths
+from niveaux import ALIAS, NIVEAUX
+from normalisation import tokeniser
+
+# Import de la base de cours de maths (optionnelle, comme dans app.py)
+try:
+    import cours_francais
+    import cours_mathematiques
+    from cours_mathematiques import MOTS_CLES_MATHS
+    from moteurs_cours import moteur
+    from sections_cours import lien_cours, passage
+    COURS_DISPONIBLES = True
+except ImportError:
+    COURS_DISPONIBLES = False
+
+CORPS = CorpsReponses('mathematiques')
+
+# Mots outils fréquents dans la prose des cours de maths, absents de MOTS_VIDES (utile à la recherche)
+MOTS_OUTILS = frozenset(tokeniser("tout tous toute alors donc non vers entre ainsi aussi comme chaque"))
+
+
+def construire_lexique():
+    """Lexique pondéré : mots des cours de maths (et de MOTS_CLES_MATHS), IDF mesuré sur les cours
+    de français, les réponses et les mots-clés des autres domaines"""
+    documents_maths = [set().union(*document.frequences.values()) for document in cours_mathematiques.CORPUS_COURS_MATHS]
+    documents_fond = [set().union(*document.frequences.values()) for document in cours_francais.CORPUS_COURS]
+    documents_fond += [set(tokeniser(texte)) for texte in parcourir_reponses(domaines_exclus=('mathematiques',))]
+    for nom in MODULES_DOMAINES:
+        if nom == 'mathematiques':
+            continue
+        domaine = importlib.import_module(f'domaines_demo.{nom}')
+        listes = [intention.get('mots', []) for intention in domaine.INTENTIONS]
+        listes += list(getattr(domaine, 'LISTES_SECONDAIRES', {}).values())
+        documents_fond += [{mot for expression in mots for mot in tokeniser(expression)} for mots in listes if mots]
+    mots_cles = {mot for expression in MOTS_CLES_MATHS for mot in tokeniser(expression)}
+    # Les noms de classe ("seconde", "terminale STPL") et les mots outils des cours ("tout", "alors")
+    # ne disent rien de la matière
+    mots_vides = MOTS_VIDES | MOTS_OUTILS | {mot for niveau in NIVEAUX + tuple(ALIAS) for mot in tokeniser(niveau)}
+    return LexiqueMaths.construire(documents_maths, documents_fond, mots_cles, mots_vides)
+
+
+LEXIQUE_MATHS = construire_lexique() if COURS_DISPONIBLES else None
+
+
+def accepter_maths(message_normalise):
+    """Garde de l'intention maths : score pondéré du message au-dessus du seuil du lexique
+    (sans base de cours, seule une écriture mathématique compte)"""
+    if LEXIQUE_MATHS is None:
+        return MOTIF_NOTATION.search(message_normalise.brut) is not None
+    return LEXIQUE_MATHS.accepte(message_normalise)
+
+
+INTENTIONS = [
+    # ========== MATHÉMATIQUES STPL (SECONDET → TERMINALE) ==========
+    # Touchée par un mot du lexique ou une écriture mathématique, retenue si le score du message atteint le seuil
+    {'id': 'maths', 'priorite': 90, 'mots': LEXIQUE_MATHS.declencheurs() if COURS_DISPONIBLES else [],
+     'motif': MOTIF_NOTATION, 'garde': 'accepter_maths', 'gestionnaire': 'repondre_maths', 'par_niveau': True},
+]
+
+
+def reconstruire_lexique():
+    """Après un rechargement à chaud des cours : nouveau lexique (lu par accepter_maths) et nouveaux
+    déclencheurs de l'intention maths (le routeur doit être recompilé pour les prendre en compte)"""
+    global LEXIQUE_MATHS
+    LEXIQUE_MATHS = construire_lexique()
+    INTENTIONS[0]['mots'] = LEXIQUE_MATHS.declencheurs()
+    return LEXIQUE_MATHS
+
+
+LISTES_SECONDAIRES = {
+    'maths:derivees': ['dérivée', 'dériver', 'dérivation'],
+    'maths:integrales': ['intégrale', 'primitive', 'intégration', 'calcul intégral'],
+    'maths:loi_normale': ['normale', 'gaussienne', 'écart-type normal'],
+    'maths:binomiale': ['binomiale', 'bernoulli', 'b(n,p)'],
+    'maths:equations_differentielles': ["y' = ay", "différentielle"],
+    'maths:matrices': ['matrice', 'déterminant'],
+    'maths:suites': ['suite', 'arithmétique', 'géométrique', 'terme général'],
+}
+
+# Fiches par thème, dans l'ordre où elles sont essayées
+THEMES = ('derivees', 'integrales', 'loi_normale', 'binomiale', 'equations_differentielles', 'matrices', 'suites')
+
+
+def repondre_maths(message_normalise, touches, routeur, niveau=None):
+    """Section du cours le plus pertinent de la base de maths, sinon fiche du thème touché, sinon présentation du programme"""
+    # Classement des cours de maths sur les mots de la question (si la base est disponible),
+    # limité aux cours de la classe de l'élève et des classes voisines si elle est connue
+    resultats_maths = (moteur().classer('mathematiques', message_normalise.tokens, k=1, niveau=niveau)
+                       if COURS_DISPONIBLES else [])
+    if resultats_maths:
+        resultat = resultats_maths[0]
+        # Seule la section qui répond à la question est recopiée, avec le lien du cours complet
+        index = cours_mathematiques.INDEX_COURS_MATHS
+        section = index.section(message_normalise.tokens, resultat['niveau'], resultat['sujet'])
+        if section is not None:
+            texte = passage(index.document(resultat['niveau'], resultat['sujet']).sections, section)
+        else:
+            texte = resultat['cours']['contenu']
+        # Cours suivant proposé : voisin le plus proche dans le graphe précalculé des cours liés
+        lies = index.cours_lies(resultat['niveau'], resultat['sujet'])
+        suite = ''
+        if lies:
+            suite = f"➡️ Pour continuer : **{lies[0]['cours']['titre']}** ({lien_cours(lies[0]['niveau'], lies[0]['sujet'])})\n"
+        return CORPS.remplir(
+            'cours',
+            titre=resultat['cours']['titre'],
+            niveau=resultat['niveau'].replace('_', ' ').upper(),
+            section=texte,
+            lien=lien_cours(resultat['niveau'], resultat['sujet']),
+            suite=suite,
+        )
+
+    # Réponses spécifiques pour les maths STPL les plus demandées
+    for theme in THEMES:
+        if 'maths:' + theme in touches:
+            return CORPS.texte(theme)
+    return CORPS.texte('programme')
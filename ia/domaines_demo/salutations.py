@@ -0,0 +1,31 @@
+# Domaine « salutations » du mode démo
+# Saluer, politesse, remerciements et questions en « comment... ».
+# Les déclencheurs sont déclarés ici ; les corps des réponses sont dans
+# reponses/salutations/ et ne sont lus qu'à leur première utilisation.
+
+from domaines_demo.corps import CorpsReponses
+
+CORPS = CorpsReponses('salutations')
+
+INTENTIONS = [
+    # Détection de questions sur saluer / politesse - RÉPONSE PÉDAGOGIQUE COMPLÈTE (AVANT les simples salutations)
+    {'id': 'saluer', 'priorite': 0, 'mots': ['saluer', 'politesse']},
+    # Réponses pédagogiques pour questions courantes - ENSEIGNEMENT ACTIF
+    {'id': 'salutation', 'priorite': 10, 'mots': ['bonjour', 'salut', 'hello', 'bonsoir'], 'sauf': ['saluer', 'comment', 'apprendre', 'enseigner']},
+    {'id': 'remerciement', 'priorite': 20, 'mots': ['merci', 'à bientôt', 'au revoir']},
+    # Détection de questions commençant par "comment", "peux-tu", "peut tu"
+    {'id': 'comment', 'priorite': 80, 'mots': ['comment', 'peux-tu', 'peut tu'],
+     'gestionnaire': 'repondre_comment', 'personnalisee': True},
+]
+
+LISTES_SECONDAIRES = {
+    'comment:salutation': ['saluer', 'bonjour'],
+}
+
+
+def repondre_comment(message_normalise, touches, routeur):
+    """Questions en « comment... » : explication des salutations, sinon invitation à préciser"""
+    if 'comment:salutation' in touches:
+        return CORPS.texte('comment_salutation')
+    # Réponse générique pour "comment"
+    return CORPS.remplir('comment_generique', message=message_normalise.original)
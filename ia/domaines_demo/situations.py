@@ -0,0 +1,15 @@
+# Domaine « situations » du mode démo
+# Mises en situation de la vie quotidienne : au restaurant, au magasin.
+# Les déclencheurs sont déclarés ici ; les corps des réponses sont dans
+# reponses/situations/ et ne sont lus qu'à leur première utilisation.
+
+from domaines_demo.corps import CorpsReponses
+
+CORPS = CorpsReponses('situations')
+
+INTENTIONS = [
+    # SITUATIONS - AU RESTAURANT
+    {'id': 'restaurant', 'priorite': 360, 'mots': ['restaurant', 'commander', 'menu', 'addition', 'serveur']},
+    # SITUATIONS - AU MAGASIN
+    {'id': 'magasin', 'priorite': 370, 'mots': ['magasin', 'acheter', 'vendre', 'prix', 'coûter', 'payer', 'faire les courses']},
+]
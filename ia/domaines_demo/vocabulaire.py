@@ -0,0 +1,38 @@
+# Domaine « vocabulaire » du mode démo
+# Synonymes, antonymes, expressions courantes et vocabulaire thématique
+# (famille, corps, nourriture, couleurs, jours, vêtements, maison, transport, métiers, école).
+# Les déclencheurs sont déclarés ici ; les corps des réponses sont dans
+# reponses/vocabulaire/ et ne sont lus qu'à leur première utilisation.
+
+from domaines_demo.corps import CorpsReponses
+
+CORPS = CorpsReponses('vocabulaire')
+
+INTENTIONS = [
+    # VOCABULAIRE - SYNONYMES (100% COMPLET)
+    {'id': 'synonymes', 'priorite': 170, 'mots': ['synonyme', 'même sens', 'mot pareil', 'équivalent']},
+    # VOCABULAIRE - ANTONYMES
+    {'id': 'antonymes', 'priorite': 180, 'mots': ['antonyme', 'contraire', 'opposé']},
+    # EXPRESSIONS COURANTES - VIE QUOTIDIENNE
+    {'id': 'expressions', 'priorite': 320, 'mots': ['expression', 'phrase utile', 'comment dire', 'comment demander']},
+    # VOCABULAIRE - FAMILLE
+    {'id': 'famille', 'priorite': 330, 'mots': ['famille', 'mère', 'père', 'frère', 'sœur', 'parents']},
+    # VOCABULAIRE - CORPS HUMAIN
+    {'id': 'corps', 'priorite': 340, 'mots': ['corps', 'tête', 'main', 'pied', 'bras', 'jambe', 'yeux', 'nez', 'bouche']},
+    # VOCABULAIRE - NOURRITURE
+    {'id': 'nourriture', 'priorite': 350, 'mots': ['nourriture', 'manger', 'aliment', 'repas', 'pain', 'eau', 'viande', 'légume', 'fruit']},
+    # VOCABULAIRE - COULEURS
+    {'id': 'couleurs', 'priorite': 380, 'mots': ['couleur', 'rouge', 'bleu', 'vert', 'jaune', 'noir', 'blanc']},
+    # VOCABULAIRE - JOURS ET MOIS
+    {'id': 'jours', 'priorite': 390, 'mots': ['jour', 'semaine', 'mois', 'lundi', 'mardi', 'janvier', 'février', 'date']},
+    # VOCABULAIRE - VÊTEMENTS
+    {'id': 'vetements', 'priorite': 400, 'mots': ['vêtement', 'habits', 'chemise', 'pantalon', 'robe', 'chaussures', 's\'habiller']},
+    # VOCABULAIRE - MAISON
+    {'id': 'maison', 'priorite': 410, 'mots': ['maison', 'appartement', 'chambre', 'cuisine', 'salle de bain', 'salon', 'pièce']},
+    # VOCABULAIRE - TRANSPORT
+    {'id': 'transport', 'priorite': 420, 'mots': ['transport', 'voiture', 'bus', 'train', 'avion', 'vélo', 'marcher', 'aller']},
+    # VOCABULAIRE - MÉTIERS
+    {'id': 'metiers', 'priorite': 430, 'mots': ['métier', 'travail', 'profession', 'médecin', 'professeur', 'ingénieur', 'cuisinier']},
+    # VOCABULAIRE - ÉCOLE
+    {'id': 'ecole', 'priorite': 440, 'mots': ['école', 'classe', 'élève', 'professeur', 'cours', 'devoir', 'examen', 'apprendre']},
+]
@@ -0,0 +1,230 @@
+# Index inversé des bases de cours (français et mathématiques)
+# L'index est construit sur le corpus normalisé (corpus_normalise.py : champs en
+# minuscules sans accents) et chaque mot pointe vers la liste des cours qui le
+# contiennent. Une recherche ne parcourt que les listes des mots de la requête, puis
+# vérifie la sous-chaîne sur ces seuls candidats : mêmes résultats qu'un parcours
+# complet (sous-chaîne, champ par champ, accents ignorés), sans relire tout le corpus.
+#
+# classer() ordonne les cours par pertinence (BM25F) : la question est découpée en
+# mots normalisés (accents et pluriels repliés), et un mot trouvé dans le titre ou
+# les exemples compte plus qu'un mot du contenu. Seuls les k meilleurs cours dont
+# le score atteint le seuil sont retournés.
+#
+# Le graphe des cours liés (cours_lies.py) est calculé avec l'index et conservé avec lui.
+#
+# PartitionsNiveaux découpe une base par classe (niveaux.py) : un index par fenêtre
+# « classe de l'élève ± 1 », construit à partir des documents du corpus complet.
+
+import math
+
+from corpus_normalise import CHAMPS_RECHERCHE, MOTIF_MOT, CorpusNormalise
+from cours_lies import VOISINS, graphe_cours_lies
+from niveaux import NIVEAUX, cles_pour
+from normalisation import replier_accents, tokeniser
+
+# Champs classés par BM25F et leur poids (le sujet, ex. "loi_normale", compte comme le titre)
+POIDS_CHAMPS = {'titre': 3.0, 'exemples': 2.0, 'contenu': 1.0}
+K1 = 1.2
+B = 0.75
+SEUIL_PERTINENCE = 1.0
+
+# Mots des questions qui ne disent rien du cours cherché (formes normalisées)
+MOTS_VIDES = frozenset('''
+    a ai as au aux avec c ce ces cet cette comment d dans de des du en es est et il je j l la le
+    les leur ma me mes moi mon ne nous on ou par pas peux pour pourquoi qu que quel quelle quoi
+    qui sa se ses si son sont suis sur t ta te tes toi ton tu un une veux vous y
+    aide aider cours donne eleve explique expliquer faire fait montre parle svp merci
+'''.split())
+
+
+class IndexCours:
+    """Index mot → cours d'un corpus normalisé (CorpusNormalise)"""
+
+    def __init__(self, corpus, max_fragments=4096, voisins=VOISINS):
+        # voisins : nombre de cours liés gardés par cours (0 : pas de graphe)
+        self.corpus = corpus
+        self.documents = corpus.documents
+        self.postings = {}           # mot → liste croissante des numéros de documents
+        for document in self.documents:
+            for mot in document.mots_recherche:
+                self.postings.setdefault(mot, []).append(document.numero)
+        self.vocabulaire = tuple(self.postings)
+        self.par_cle = {document.cle: document for document in self.documents}
+        self.indexer_champs()
+        # Fragments de début ou de fin de requête déjà résolus en mots du vocabulaire
+        self.max_fragments = max_fragments
+        self.fragments = {}
+        self.lies = graphe_cours_lies(self.documents, voisins, mots_vides=MOTS_VIDES) if voisins else {}
+
+    def __len__(self):
+        return len(self.documents)
+
+    def indexer_champs(self):
+        """Listes mot normalisé → [(numéro, {champ: fréquence})], pour le classement BM25F"""
+        self.frequences = {}
+        for document in self.documents:
+            par_mot = {}
+            for champ, frequences in document.frequences.items():
+                # Le sujet ("loi_normale") compte comme le titre
+                champ = 'titre' if champ == 'sujet' else champ
+                for mot, nombre in frequences.items():
+                    par_mot.setdefault(mot, {})
+                    par_mot[mot][champ] = par_mot[mot].get(champ, 0) + nombre
+            for mot, frequences in par_mot.items():
+                self.frequences.setdefault(mot, []).append((document.numero, frequences))
+        self.longueurs = [
+            {'titre': d.longueurs['sujet'] + d.longueurs['titre'],
+             'exemples': d.longueurs['exemples'], 'contenu': d.longueurs['contenu']}
+            for d in self.documents
+        ]
+        nombre = len(self.documents) or 1
+        self.longueurs_moyennes = {
+            champ: (sum(longueurs[champ] for longueurs in self.longueurs) / nombre) or 1.0
+            for champ in POIDS_CHAMPS
+        }
+
+    def idf(self, mot):
+        n = self.corpus.documents_par_mot.get(mot, 0)
+        return math.log(1 + (len(self.documents) - n + 0.5) / (n + 0.5))
+
+    def classer(self, question, k=3, seuil=SEUIL_PERTINENCE):
+        """Les k cours les plus pertinents pour la question (texte ou mots normalisés), score ≥ seuil"""
+        mots = tokeniser(question) if isinstance(question, str) else question
+        scores = {}
+        for mot in set(mots) - MOTS_VIDES:
+            postings = self.frequences.get(mot)
+            if not postings:
+                continue
+            idf = self.idf(mot)
+            for numero, frequences in postings:
+                longueurs = self.longueurs[numero]
+                # BM25F : fréquences pondérées par champ, chacune normalisée par la longueur du champ
+                tf = sum(
+                    POIDS_CHAMPS[champ] * nombre
+                    / (1 - B + B * longueurs[champ] / self.longueurs_moyennes[champ])
+                    for champ, nombre in frequences.items()
+                )
+                scores[numero] = scores.get(numero, 0.0) + idf * tf / (K1 + tf)
+        meilleurs = sorted(scores.items(), key=lambda element: (-element[1], element[0]))[:k]
+        resultats = []
+        for numero, score in meilleurs:
+            if score < seuil:
+                break
+            document = self.documents[numero]
+            resultats.append({
+                "niveau": document.niveau,
+                "sujet": document.sujet,
+                "cours": document.cours,
+                "score": round(score, 3)
+            })
+        return resultats
+
+    def document(self, niveau, sujet):
+        """Document normalisé d'un cours (None s'il n'est pas dans l'index)"""
+        return self.par_cle.get((niveau, sujet))
+
+    def cours_lies(self, niveau, sujet):
+        """Cours à proposer après celui-ci (graphe précalculé), du plus proche au moins proche"""
+        return [
+            {"niveau": n, "sujet": s, "cours": self.par_cle[(n, s)].cours, "score": score}
+            for n, s, score in self.lies.get((niveau, sujet), ())
+        ]
+
+    def section(self, question, niveau, sujet):
+        """Section du cours qui correspond le mieux à la question (la première si aucune ne contient ses mots)"""
+        document = self.par_cle.get((niveau, sujet))
+        if document is None or not document.sections:
+            return None
+        mots = tokeniser(question) if isinstance(question, str) else question
+        termes = [(mot, self.idf(mot)) for mot in set(mots) - MOTS_VIDES]
+        meilleure, meilleur_score = document.sections[0], 0.0
+        for section in document.sections:
+            score = 0.0
+            for mot, idf in termes:
+                tf = section.mots.get(mot, 0)
+                if tf:
+                    score += idf * tf / (K1 + tf)
+            if score > meilleur_score:
+                meilleure, meilleur_score = section, score
+        return meilleure
+
+    def mots_pour(self, fragment, ouvert_gauche, ouvert_droite):
+        """Mots du vocabulaire compatibles avec un mot de la requête
+        (un mot en bord de requête peut n'être qu'un morceau d'un mot du cours)"""
+        if not ouvert_gauche and not ouvert_droite:
+            return (fragment,) if fragment in self.postings else ()
+        cle = (fragment, ouvert_gauche, ouvert_droite)
+        mots = self.fragments.get(cle)
+        if mots is None:
+            if ouvert_gauche and ouvert_droite:
+                mots = tuple(mot for mot in self.vocabulaire if fragment in mot)
+            elif ouvert_gauche:
+                mots = tuple(mot for mot in self.vocabulaire if mot.endswith(fragment))
+            else:
+                mots = tuple(mot for mot in self.vocabulaire if mot.startswith(fragment))
+            if len(self.fragments) >= self.max_fragments:
+                self.fragments.clear()
+            self.fragments[cle] = mots
+        return mots
+
+    def candidats(self, requete):
+        """Numéros des documents pouvant contenir la requête (None : pas de mot, tout vérifier)"""
+        correspondances = list(MOTIF_MOT.finditer(requete))
+        if not correspondances:
+            return None
+        candidats = None
+        # Les mots intérieurs (les plus sélectifs) d'abord, les morceaux de bord ensuite
+        correspondances.sort(key=lambda m: m.start() == 0 or m.end() == len(requete))
+        for correspondance in correspondances:
+            mots = self.mots_pour(correspondance.group(), correspondance.start() == 0,
+                                  correspondance.end() == len(requete))
+            documents = set()
+            for mot in mots:
+                documents.update(self.postings[mot])
+            candidats = documents if candidats is None else candidats & documents
+            if not candidats:
+                return []
+        return sorted(candidats)
+
+    def rechercher(self, mot_cle):
+        """Cours dont le sujet, le titre ou le contenu contient le mot-clé (accents ignorés)"""
+        requete = replier_accents(mot_cle)
+        numeros = self.candidats(requete)
+        if numeros is None:
+            numeros = range(len(self.documents))
+        resultats = []
+        for numero in numeros:
+            document = self.documents[numero]
+            if any(requete in document.replie[champ] for champ in CHAMPS_RECHERCHE):
+                resultats.append({
+                    "niveau": document.niveau,
+                    "sujet": document.sujet,
+                    "cours": document.cours
+                })
+        return resultats
+
+
+class PartitionsNiveaux:
+    """Un IndexCours par classe, limité aux cours de la classe et de ses voisines"""
+
+    def __init__(self, matiere, cles, lister, obtenir, corpus):
+        # cles : clés de niveau de la base ; lister(cle) → sujets ; obtenir(cle, sujet) → cours
+        # corpus : corpus normalisé complet, dont les documents sont repris sans nouveau traitement
+        self.matiere = matiere
+        self.index = {}
+        partages = {}
+        for niveau in NIVEAUX:
+            retenues = tuple(cles_pour(matiere, niveau, cles))
+            if retenues not in partages:
+                base = {cle: {sujet: obtenir(cle, sujet) for sujet in lister(cle)} for cle in retenues}
+                # Le graphe des cours liés n'est gardé que dans l'index complet de la base
+                partages[retenues] = IndexCours(CorpusNormalise(base, precedent=corpus), voisins=0)
+            self.index[niveau] = partages[retenues]
+
+    def get(self, niveau):
+        """Index de la classe (None si la classe est inconnue)"""
+        return self.index.get(niveau)
+
+    def tailles(self):
+        """Nombre de cours de chaque partition"""
+        return {niveau: len(index) for niveau, index in self.index.items()}
@@ -0,0 +1,95 @@
+# Instrumentation du routage du mode démo (optionnelle, échantillonnée)
+# Pour une fraction des requêtes, on note l'intention qui a répondu, le nombre de
+# comparaisons faites par le routeur et le temps passé (routage puis construction
+# de la réponse), en nanosecondes. Les mesures sont agrégées par intention sous
+# forme d'histogrammes en puissances de 2, exposés sur /debug/routage (en-tête
+# X-Admin-Token = IA_ADMIN_TOKEN, comme les routes d'administration).
+#
+# Activation : DEMO_INSTRUMENTATION_TAUX=0.01 (1 % des requêtes ; 0 = désactivé)
+
+import random
+import threading
+
+
+class StatistiquesIntention:
+    """Agrégats d'une intention : compteurs, totaux et histogramme des durées"""
+
+    __slots__ = ('requetes', 'comparaisons', 'ns_routage', 'ns_reponse', 'ns_max', 'histogramme', 'sources')
+
+    def __init__(self):
+        self.requetes = 0
+        self.comparaisons = 0
+        self.ns_routage = 0
+        self.ns_reponse = 0
+        self.ns_max = 0
+        self.histogramme = {}          # exposant k → nombre de requêtes ayant duré moins de 2^k ns
+        self.sources = {}              # "cache", "chaine" ou "classifieur" → nombre de requêtes
+
+    def ajouter(self, comparaisons, ns_routage, ns_reponse, source):
+        ns_total = ns_routage + ns_reponse
+        self.requetes += 1
+        self.comparaisons += comparaisons
+        self.ns_routage += ns_routage
+        self.ns_reponse += ns_reponse
+        self.ns_max = max(self.ns_max, ns_total)
+        exposant = ns_total.bit_length()
+        self.histogramme[exposant] = self.histogramme.get(exposant, 0) + 1
+        self.sources[source] = self.sources.get(source, 0) + 1
+
+    def resume(self, ns_global):
+        ns_total = self.ns_routage + self.ns_reponse
+        return {
+            'requetes': self.requetes,
+            'comparaisons_moyennes': round(self.comparaisons / self.requetes, 2),
+            'ns_routage_moyen': self.ns_routage // self.requetes,
+            'ns_reponse_moyen': self.ns_reponse // self.requetes,
+            'ns_total': ns_total,
+            'ns_max': self.ns_max,
+            'part_temps': round(ns_total / ns_global, 4) if ns_global else 0.0,
+            'histogramme_ns': {f'<{2 ** k}': n for k, n in sorted(self.histogramme.items())},
+            'sources': dict(self.sources),
+        }
+
+
+class InstrumentationRoutage:
+    """Collecte échantillonnée des traces de routage, agrégées par intention"""
+
+    def __init__(self, taux_echantillonnage=0.0):
+        self.taux = min(max(taux_echantillonnage, 0.0), 1.0)
+        self.intentions = {}
+        self.verrou = threading.Lock()
+
+    @property
+    def active(self):
+        return self.taux > 0.0
+
+    def echantillonner(self):
+        """Vrai si la requête courante doit être mesurée"""
+        return self.taux > 0.0 and (self.taux >= 1.0 or random.random() < self.taux)
+
+    def enregistrer(self, intention, comparaisons, ns_routage, ns_reponse, source):
+        """Ajoute la trace d'une requête échantillonnée"""
+        with self.verrou:
+            statistiques = self.intentions.get(intention)
+            if statistiques is None:
+                statistiques = self.intentions[intention] = StatistiquesIntention()
+            statistiques.ajouter(comparaisons, ns_routage, ns_reponse, source)
+
+    def reinitialiser(self):
+        """Efface toutes les mesures"""
+        with self.verrou:
+            self.intentions.clear()
+
+    def statistiques(self):
+        """Retourne les agrégats par intention, de la plus coûteuse (temps cumulé) à la moins coûteuse"""
+        with self.verrou:
+            ns_global = sum(s.ns_routage + s.ns_reponse for s in self.intentions.values())
+            resumes = {intention: s.resume(ns_global) for intention, s in self.intentions.items()}
+        ordre = sorted(resumes, key=lambda intention: resumes[intention]['ns_total'], reverse=True)
+        return {
+            'taux_echantillonnage': self.taux,
+            'requetes_mesurees': sum(r['requetes'] for r in resumes.values()),
+            'ns_total': ns_global,
+            'classement': ordre,
+            'intentions': {intention: resumes[intention] for intention in ordre},
+        }
@@ -0,0 +1,92 @@
+# Lexique des questions de maths, tiré des cours et pondéré par IDF
+# Remplace la liste MOTS_CLES_MATHS comme porte d'entrée de l'intention « maths » :
+# chaque mot des cours de maths reçoit le poids IDF qu'il a dans un corpus de français
+# ordinaire (cours de français, réponses des autres domaines du mode démo). Un mot
+# propre aux maths ("dérivée", "intégrale") pèse lourd ; un mot que l'on trouve aussi
+# dans des phrases courantes ("raison", "nombre", "exercice") pèse peu. Une question
+# n'est envoyée vers les cours de maths que si la somme des poids de ses mots (plus un
+# bonus pour une écriture mathématique : "3+4", "f(x)", "x²"...) atteint le seuil ;
+# seul un mot technique ("dérivée", "intégrale") y suffit seul.
+# Le score est calculé sur les mots tels que l'élève les a écrits (sans correction
+# orthographique) : "tant" corrigé en "tan" ne compte pas.
+
+import math
+import re
+
+# Écritures mathématiques : opération entre nombres, égalité, fonction appliquée, puissance, symboles
+# ("-" et "/" collés entre deux nombres sont le plus souvent des dates ou des intervalles : 12/05, 2-3 jours)
+MOTIF_NOTATION = re.compile(
+    r'\d\s*[+*×÷^]\s*[\d(a-z]'
+    r"|[\da-z)']\s*[=<>≤≥]\s*[-\d(a-z]"
+    r'|\d\s+[-/x]\s+[\d(]'
+    r'|\b[a-z]{1,3}\(\s*[-a-z0-9]'
+    r'|[a-z0-9)]\s*[²³ⁿ]'
+    r'|[√∫∑π∞]'
+)
+
+SEUIL_MATHS = 4.5
+# Une écriture mathématique suffit seule ("combien fait 12 × 7")
+POIDS_NOTATION = SEUIL_MATHS
+# Mots trop courants dans le corpus de référence ("nombre", "exercice") : ignorés
+POIDS_MIN = 3.0
+LONGUEUR_MIN = 2
+# Mots des cours présents dans au moins PRESENCE_MIN cours de maths (ou dans MOTS_CLES_MATHS)
+PRESENCE_MIN = 2
+# Les mots courts du lexique sont souvent aussi des mots courants ou des abréviations
+# ("terme", "suite", "raison", "loi", "sin", "ln") : leur poids est plafonné à la moitié
+# du seuil, il en faut deux, ou un mot technique, ou une écriture mathématique
+LONGUEUR_TECHNIQUE = 7
+POIDS_MAX_COURT = SEUIL_MATHS / 2
+
+
+class LexiqueMaths:
+    """Poids IDF des mots de maths et score d'une question"""
+
+    def __init__(self, poids, seuil=SEUIL_MATHS, poids_notation=POIDS_NOTATION):
+        self.poids = poids              # mot normalisé → poids IDF dans le corpus de référence
+        self.seuil = seuil
+        self.poids_notation = poids_notation
+
+    @classmethod
+    def construire(cls, documents_maths, documents_fond, mots_cles=(), mots_vides=frozenset(), **options):
+        """Lexique des mots des cours de maths (ensembles de mots normalisés) et des mots-clés donnés,
+        pondérés par leur IDF dans les documents de français ordinaire (mots courts plafonnés)"""
+        documents_fond = list(documents_fond)
+        presence = {}
+        for mots in documents_fond:
+            for mot in mots:
+                presence[mot] = presence.get(mot, 0) + 1
+        # Un mot écrit dans un seul cours de maths ("impossible", "conseil") vient de la prose du cours
+        presence_maths = {}
+        for mots in documents_maths:
+            for mot in mots:
+                presence_maths[mot] = presence_maths.get(mot, 0) + 1
+        candidats = set(mots_cles) | {mot for mot, nombre in presence_maths.items() if nombre >= PRESENCE_MIN}
+        nombre = len(documents_fond)
+        poids = {}
+        for mot in candidats:
+            if len(mot) < LONGUEUR_MIN or mot.isdigit() or mot in mots_vides:
+                continue
+            idf = math.log((nombre + 1) / (presence.get(mot, 0) + 1))
+            if idf >= POIDS_MIN:
+                poids[mot] = idf if len(mot) >= LONGUEUR_TECHNIQUE else min(idf, POIDS_MAX_COURT)
+        return cls(poids, **options)
+
+    def __len__(self):
+        return len(self.poids)
+
+    def declencheurs(self):
+        """Tous les mots du lexique (motifs de l'intention « maths » du routeur) : le message est
+        ensuite accepté ou refusé sur la somme des poids de ses mots (accepte)"""
+        return sorted(self.poids)
+
+    def score(self, message):
+        """Somme des poids des mots distincts du message (MessageNormalise), bonus d'écriture mathématique compris"""
+        score = sum(self.poids.get(mot, 0.0) for mot in message.ensemble)
+        if MOTIF_NOTATION.search(message.brut):
+            score += self.poids_notation
+        return score
+
+    def accepte(self, message):
+        """Vrai si le message est une question de maths"""
+        return self.score(message) >= self.seuil
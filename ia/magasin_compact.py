@@ -0,0 +1,61 @@
+# Magasin compact de textes de cours
+# Plusieurs workers par serveur gardent chacun tous les cours en mémoire, sous plusieurs
+# formes (fragments des paquets hors ligne...). Les textes qui ne servent qu'à quelques
+# requêtes sont rangés ici compressés (zlib), bout à bout dans un seul bloc d'octets,
+# avec l'index (début, fin) de chacun. Un texte n'est décompressé qu'à la demande, et
+# les derniers textes lus restent dans un petit cache LRU (cache_reponses.py) : les
+# cours les plus consultés ne sont pas décompressés à chaque requête.
+# Un magasin est construit en une fois et n'est jamais complété : une nouvelle version
+# des cours a son propre magasin, et l'ancien est libéré avec l'ancienne version.
+
+import os
+import zlib
+
+from cache_reponses import CacheLRU
+
+NIVEAU_ZLIB = 9
+LRU_ENTREES = int(os.getenv('COURS_COMPACTS_LRU', '16'))
+LRU_OCTETS = int(os.getenv('COURS_COMPACTS_LRU_OCTETS', str(256 * 1024)))
+
+
+class MagasinCompact:
+    """Textes compressés dans un bloc unique, décompressés à la demande derrière un cache LRU"""
+
+    def __init__(self, textes, lru_entrees=LRU_ENTREES, lru_octets=LRU_OCTETS):
+        # textes : itérable de (clé, texte)
+        morceaux = []
+        self.positions = {}          # clé → (début, fin) dans le bloc
+        self.octets_bruts = 0
+        debut = 0
+        for cle, texte in textes:
+            octets = texte.encode('utf-8')
+            compresse = zlib.compress(octets, NIVEAU_ZLIB)
+            morceaux.append(compresse)
+            self.positions[cle] = (debut, debut + len(compresse))
+            self.octets_bruts += len(octets)
+            debut += len(compresse)
+        self.bloc = b''.join(morceaux)
+        self.chauds = CacheLRU(max_entrees=lru_entrees, max_octets=lru_octets)
+
+    def lire(self, cle):
+        """Texte de la clé (KeyError si elle n'est pas dans le magasin)"""
+        texte = self.chauds.obtenir(cle)
+        if texte is None:
+            debut, fin = self.positions[cle]
+            texte = zlib.decompress(self.bloc[debut:fin]).decode('utf-8')
+            self.chauds.stocker(cle, texte)
+        return texte
+
+    def __len__(self):
+        return len(self.positions)
+
+    def rapport(self):
+        """Octets des textes, octets compressés et copies décompressées gardés en mémoire, octets économisés"""
+        lru = self.chauds.statistiques()
+        return {
+            'textes': len(self.positions),
+            'octets_bruts': self.octets_bruts,
+            'octets_compresses': len(self.bloc),
+            'octets_economises': self.octets_bruts - len(self.bloc) - lru['octets'],
+            'lru': lru,
+        }
@@ -0,0 +1,131 @@
+# Moteurs de recherche des cours
+# Même interface pour chaque moteur : rechercher(matiere, mot_cle) et
+# classer(matiere, question, k, seuil, niveau) avec matiere = "francais" ou "mathematiques"
+# et niveau = classe de l'élève (niveaux.py) pour ne garder que les cours de sa classe
+# et des classes voisines (None : tous les cours).
+#   memoire : index inversé en mémoire de chaque worker (index_cours.py, défaut)
+#   sqlite  : fichier cours.sqlite partagé par les workers (cours_sqlite.py)
+#   postgres: table cours_ia partagée par tous les serveurs (cours_postgres.py)
+#   vecteurs: similarité de n-grammes de caractères, matrice NumPy projetée en mémoire (cours_vecteurs.py)
+# app.py choisit le moteur (variable d'environnement COURS_MOTEUR) avec configurer() ;
+# si le moteur demandé n'est pas utilisable, on revient au moteur en mémoire.
+# Après un rechargement à chaud des cours, recharger(bases) met le moteur à jour
+# (chaque moteur a une méthode recharger(bases) qui retourne le moteur à utiliser ensuite).
+# signature(bases) identifie une version des cours : les moteurs qui enregistrent un
+# fichier (vecteurs, sqlite) n'en construisent qu'un par version.
+
+import json
+import zlib
+
+from niveaux import normaliser_niveau
+
+MOTEUR_PAR_DEFAUT = 'memoire'
+
+
+def signature(bases):
+    """Empreinte des bases de cours ({matière: base}), stable d'un processus à l'autre"""
+    octets = json.dumps(bases, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return f'{zlib.crc32(octets):08x}'
+
+
+class MoteurMemoire:
+    """Index inversés construits à l'import des modules de cours"""
+
+    def __init__(self):
+        import cours_francais
+        import cours_mathematiques
+        self.modules = {'francais': cours_francais, 'mathematiques': cours_mathematiques}
+
+    def index(self, matiere, niveau=None):
+        # Relu à chaque appel : un rechargement des cours (rechargement_cours.py) remplace l'index
+        module = self.modules[matiere]
+        niveau = normaliser_niveau(niveau)
+        if niveau is not None:
+            partitions = module.PARTITIONS_COURS if matiere == 'francais' else module.PARTITIONS_COURS_MATHS
+            return partitions.get(niveau)
+        if matiere == 'francais':
+            return module.INDEX_COURS
+        return module.INDEX_COURS_MATHS
+
+    def rechercher(self, matiere, mot_cle):
+        return self.index(matiere).rechercher(mot_cle)
+
+    def classer(self, matiere, question, k=3, seuil=None, niveau=None):
+        if seuil is None:
+            return self.index(matiere, niveau).classer(question, k)
+        return self.index(matiere, niveau).classer(question, k, seuil)
+
+    def recharger(self, bases):
+        # Les index remplacés par le rechargement sont relus à chaque appel : rien à reconstruire
+        return self
+
+
+def creer_moteur_memoire(**options):
+    return MoteurMemoire()
+
+
+def creer_moteur_sqlite(**options):
+    from cours_sqlite import MoteurSQLite
+    return MoteurSQLite()
+
+
+def creer_moteur_postgres(url_postgres=None, **options):
+    from cours_postgres import MoteurPostgres
+    return MoteurPostgres(url_postgres)
+
+
+def creer_moteur_vecteurs(**options):
+    from cours_vecteurs import MoteurVecteurs
+    return MoteurVecteurs()
+
+
+MOTEURS = {
+    'memoire': creer_moteur_memoire,
+    'sqlite': creer_moteur_sqlite,
+    'postgres': creer_moteur_postgres,
+    'vecteurs': creer_moteur_vecteurs,
+}
+
+_moteur = None
+
+
+def creer_moteur(nom, **options):
+    """Instancie le moteur demandé, ou le moteur en mémoire s'il est inconnu ou indisponible"""
+    fabrique = MOTEURS.get(nom)
+    if fabrique is None:
+        print(f"⚠️ Moteur de cours inconnu : {nom} (moteurs : {', '.join(MOTEURS)})")
+    else:
+        try:
+            return fabrique(**options)
+        except Exception as e:
+            print(f"⚠️ Moteur de cours {nom} indisponible ({e}) : recherche en mémoire")
+    return MoteurMemoire()
+
+
+def configurer(nom=MOTEUR_PAR_DEFAUT, **options):
+    """Choisit le moteur utilisé par moteur() (options : url_postgres pour le moteur postgres)"""
+    global _moteur
+    _moteur = creer_moteur(nom, **options)
+    return _moteur
+
+
+def moteur():
+    """Moteur de recherche configuré (moteur en mémoire si configurer() n'a pas été appelé)"""
+    global _moteur
+    if _moteur is None:
+        _moteur = MoteurMemoire()
+    return _moteur
+
+
+def recharger(bases):
+    """Met le moteur configuré à jour après un rechargement à chaud des cours ({matière: base}) ;
+    s'il ne peut pas l'être, retour au moteur en mémoire plutôt que de servir les anciens cours"""
+    global _moteur
+    if _moteur is None:
+        return moteur()
+    try:
+        _moteur = _moteur.recharger(bases)
+    except Exception as e:
+        print(f"⚠️ Moteur de cours {type(_moteur).__name__} non mis à jour ({e}) : recherche en mémoire")
+        _moteur = MoteurMemoire()
+    return _moteur
@@ -0,0 +1,84 @@
+# Taxonomie unique des niveaux scolaires (CP → Terminale)
+# Les deux bases de cours utilisent des clés de niveau différentes (niveau_debutant...
+# niveau_terminale pour le français, seconde/premiere_stpl/terminale_stpl pour les
+# maths) : chaque clé est rattachée ici à une plage de classes. Une question étiquetée
+# avec la classe de l'élève ne cherche que dans les cours de sa classe et des classes
+# voisines (voir PartitionsNiveaux dans index_cours.py).
+
+from normalisation import replier_accents
+
+NIVEAUX = ('cp', 'ce1', 'ce2', 'cm1', 'cm2', '6e', '5e', '4e', '3e', 'seconde', 'premiere', 'terminale')
+RANGS = {niveau: rang for rang, niveau in enumerate(NIVEAUX)}
+
+CYCLES = {
+    'primaire': ('cp', 'cm2'),
+    'college': ('6e', '3e'),
+    'lycee': ('seconde', 'terminale'),
+}
+
+# Clé de niveau des bases de cours → (première classe, dernière classe)
+NIVEAUX_COURS = {
+    'francais': {
+        'niveau_debutant': ('cp', 'ce2'),
+        'niveau_intermediaire': ('cm1', '5e'),
+        'niveau_avance': ('4e', '3e'),
+        'niveau_seconde': ('seconde', 'seconde'),
+        'niveau_premiere': ('premiere', 'premiere'),
+        'niveau_terminale': ('terminale', 'terminale'),
+    },
+    'mathematiques': {
+        'seconde': ('seconde', 'seconde'),
+        'premiere_stpl': ('premiere', 'premiere'),
+        'terminale_stpl': ('terminale', 'terminale'),
+    },
+}
+
+# Écritures courantes des classes (après repli des accents et des majuscules)
+ALIAS = {
+    'cours preparatoire': 'cp', 'cm 1': 'cm1', 'cm 2': 'cm2', 'ce 1': 'ce1', 'ce 2': 'ce2',
+    '6eme': '6e', 'sixieme': '6e', '5eme': '5e', 'cinquieme': '5e',
+    '4eme': '4e', 'quatrieme': '4e', '3eme': '3e', 'troisieme': '3e',
+    '2nde': 'seconde', '2de': 'seconde', 'seconde generale': 'seconde',
+    '1ere': 'premiere', '1re': 'premiere', 'premiere stpl': 'premiere', 'premiere stl': 'premiere',
+    'tle': 'terminale', 'term': 'terminale', 'terminale stpl': 'terminale', 'terminale stl': 'terminale',
+}
+
+
+def normaliser_niveau(texte):
+    """Classe de la taxonomie pour un niveau saisi ("2nde", "Première STPL", "6ème"...), ou None"""
+    if not texte:
+        return None
+    niveau = ' '.join(replier_accents(str(texte)).replace('_', ' ').split())
+    niveau = ALIAS.get(niveau, niveau)
+    return niveau if niveau in RANGS else None
+
+
+def voisins(niveau, ecart=1):
+    """Classes à au plus `ecart` rangs de la classe donnée"""
+    rang = RANGS[niveau]
+    return NIVEAUX[max(0, rang - ecart):rang + ecart + 1]
+
+
+def classes_du_cours(matiere, cle):
+    """Classes couvertes par une clé de niveau d'une base (toutes si la clé n'est pas rattachée)"""
+    plage = NIVEAUX_COURS.get(matiere, {}).get(cle)
+    if plage is None:
+        return NIVEAUX
+    return NIVEAUX[RANGS[plage[0]]:RANGS[plage[1]] + 1]
+
+
+def cles_pour(matiere, niveau, cles, ecart=1):
+    """Clés de niveau de la base dont les cours concernent la classe ou ses voisines"""
+    fenetre = set(voisins(niveau, ecart))
+    return [cle for cle in cles if fenetre.intersection(classes_du_cours(matiere, cle))]
+
+
+def cles_exclues(matiere, niveau, ecart=1):
+    """Clés de niveau rattachées dont aucune classe n'est voisine de la classe de l'élève
+    (filtre NOT IN des moteurs SQL : les clés non rattachées ne sont jamais exclues)"""
+    niveau = normaliser_niveau(niveau)
+    if niveau is None:
+        return []
+    cles = list(NIVEAUX_COURS.get(matiere, {}))
+    gardees = set(cles_pour(matiere, niveau, cles, ecart))
+    return [cle for cle in cles if cle not in gardees]
@@ -0,0 +1,84 @@
+# Normalisation des messages et des mots-clés
+# Chaque message est normalisé une seule fois : minuscules, accents repliés (é → e),
+# élisions séparées (l'alphabet → l alphabet, qu'est → qu est), découpage en mots
+# et pluriel en -s ramené au singulier. Tous les gestionnaires du mode démo et
+# MOTS_CLES_MATHS travaillent ensuite sur ces mots, avec des recherches par ensemble.
+
+import re
+import unicodedata
+
+# Un mot = une suite de lettres ou de chiffres ; l'apostrophe, le tiret et la ponctuation
+# séparent les mots, ce qui découpe aussi les élisions (l', d', j', qu', s'...)
+MOTIF_MOT = re.compile(r'[a-z0-9]+')
+
+# Table de repli des caractères courants du français (chemin rapide sans décomposition Unicode)
+REPLI_ACCENTS = str.maketrans({
+    **{c: 'a' for c in 'àâäáãå'}, **{c: 'e' for c in 'éèêë'}, **{c: 'i' for c in 'îïíì'},
+    **{c: 'o' for c in 'ôöóòõ'}, **{c: 'u' for c in 'ùûüú'}, 'ç': 'c', 'ÿ': 'y', 'ñ': 'n',
+    'œ': 'oe', 'æ': 'ae', '’': "'", 'ʼ': "'",
+})
+
+
+def replier_accents(texte):
+    """Retourne le texte en minuscules sans accents ni ligatures"""
+    texte = texte.lower().translate(REPLI_ACCENTS)
+    if texte.isascii():
+        return texte
+    decompose = unicodedata.normalize('NFD', texte)
+    return ''.join(c for c in decompose if not unicodedata.combining(c))
+
+
+def forme_canonique(mot):
+    """Ramène un mot replié à sa forme de référence (pluriel en -s → singulier)"""
+    if len(mot) >= 5 and mot.endswith('s') and not mot.endswith('ss'):
+        return mot[:-1]
+    return mot
+
+
+def tokeniser(texte):
+    """Découpe un texte en mots normalisés (tuple)"""
+    return tuple(forme_canonique(mot) for mot in MOTIF_MOT.findall(replier_accents(texte)))
+
+
+class MessageNormalise:
+    """Message prétraité une seule fois et partagé par tous les gestionnaires"""
+
+    __slots__ = ('original', 'brut', 'tokens', 'ensemble', 'texte')
+
+    def __init__(self, message):
+        self.original = message
+        self.brut = message.lower().strip()
+        self.tokens = tokeniser(self.brut)
+        self.ensemble = frozenset(self.tokens)
+        # Texte bordé d'espaces : une expression n'est trouvée que sur des frontières de mots
+        self.texte = f' {" ".join(self.tokens)} '
+
+    def contient(self, mot):
+        """Vrai si le mot (ou l'expression) apparaît dans le message"""
+        mots = tokeniser(mot)
+        if len(mots) == 1:
+            return mots[0] in self.ensemble
+        return bool(mots) and f' {" ".join(mots)} ' in self.texte
+
+    def contient_un(self, mots_cles):
+        """Vrai si au moins un mot d'une liste compilée (MotsCles) apparaît dans le message"""
+        if not mots_cles.simples.isdisjoint(self.ensemble):
+            return True
+        return any(expression in self.texte for expression in mots_cles.expressions)
+
+
+class MotsCles:
+    """Liste de mots-clés normalisée une seule fois : mots simples en ensemble, expressions à part"""
+
+    def __init__(self, mots):
+        self.formes = sorted({tokeniser(mot) for mot in mots} - {()})
+        self.simples = frozenset(forme[0] for forme in self.formes if len(forme) == 1)
+        self.expressions = tuple(f' {" ".join(forme)} ' for forme in self.formes if len(forme) > 1)
+
+    def __len__(self):
+        return len(self.formes)
+
+
+def normaliser_message(message):
+    """Point d'entrée unique du prétraitement d'un message"""
+    return message if isinstance(message, MessageNormalise) else MessageNormalise(message)
@@ -0,0 +1,159 @@
+# Paquets de cours versionnés pour les clients hors ligne (écoles à connexion intermittente)
+# Chaque cours a une empreinte de son contenu ; la version d'une base est l'empreinte de
+# la liste (niveau/sujet, empreinte) de tous ses cours. Un client garde la version de
+# son paquet et ne demande ensuite que les différences : cours ajoutés, modifiés et
+# supprimés depuis cette version (quelques kilo-octets au lieu du corpus entier).
+# Les versions publiées (empreintes de chaque cours) sont conservées dans
+# cours_versions.json, partagé par les workers et gardé d'un redémarrage à l'autre ; une
+# version inconnue (trop ancienne ou jamais publiée) reçoit le paquet complet.
+# Le fichier est écrit dans le dossier de données COURS_DONNEES (hors du code source),
+# seulement quand la version des cours change, par remplacement atomique.
+# Chaque cours est sérialisé une fois en fragment JSON : le paquet hors ligne et les
+# différences sont des assemblages de fragments, compressés en gzip et brotli
+# (preserialisation.py). Les fragments sont gardés compressés (magasin_compact.py) et
+# décompressés pour les seules différences demandées. Après un rechargement des cours,
+# seuls les cours modifiés sont sérialisés à nouveau.
+
+import json
+import os
+import threading
+import time
+
+from magasin_compact import MagasinCompact
+from preserialisation import CorpsPreserialise, empreinte, serialiser
+
+DOSSIER_DONNEES = os.getenv('COURS_DONNEES', os.path.join(os.path.expanduser('~'), '.local', 'share', 'ia-cours'))
+CHEMIN_VERSIONS = os.getenv('COURS_VERSIONS', os.path.join(DOSSIER_DONNEES, 'cours_versions.json'))
+MAX_VERSIONS = int(os.getenv('COURS_VERSIONS_MAX', '20'))
+
+
+def lire_versions(chemin):
+    """Versions publiées [{"version", "date", "lecons": {cle: empreinte}}], de la plus ancienne à la plus récente"""
+    try:
+        with open(chemin, encoding='utf-8') as fichier:
+            return json.load(fichier)['versions']
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def ecrire_versions(chemin, versions):
+    # Suffixe du processus et remplacement atomique : plusieurs workers peuvent publier en même temps
+    os.makedirs(os.path.dirname(os.path.abspath(chemin)), exist_ok=True)
+    temporaire = f'{chemin}.{os.getpid()}.tmp'
+    with open(temporaire, 'w', encoding='utf-8') as fichier:
+        json.dump({'versions': versions}, fichier, ensure_ascii=False)
+    os.replace(temporaire, chemin)
+
+
+class Lecon:
+    """Un cours du paquet et son empreinte"""
+
+    __slots__ = ('matiere', 'niveau', 'sujet', 'cle', 'cours', 'empreinte')
+
+    def __init__(self, matiere, niveau, sujet, cours):
+        self.matiere = matiere
+        self.niveau = niveau
+        self.sujet = sujet
+        self.cle = f'{niveau}/{sujet}'
+        self.cours = cours
+        self.empreinte = empreinte(serialiser(cours))
+
+    def fragment(self):
+        """Fragment JSON `"niveau/sujet":{...}` du cours dans un paquet"""
+        return (serialiser(self.cle) + b':' + serialiser({
+            'matiere': self.matiere, 'niveau': self.niveau, 'sujet': self.sujet, 'empreinte': self.empreinte,
+            'cours': self.cours})).decode('utf-8')
+
+
+class PaquetsCours:
+    """Version courante des bases de cours, paquet hors ligne et différences depuis les versions publiées"""
+
+    def __init__(self, bases, precedent=None, chemin=CHEMIN_VERSIONS, max_versions=MAX_VERSIONS):
+        # bases : {matiere: {niveau: {sujet: cours}}} ; precedent : paquets dont on reprend les cours inchangés
+        anciennes = precedent.lecons if precedent is not None else {}
+        self.lecons = {}
+        fragments = {}
+        self.reutilisees = 0
+        for matiere, base in bases.items():
+            for niveau, sujets in base.items():
+                for sujet, cours in sujets.items():
+                    ancienne = anciennes.get(f'{niveau}/{sujet}')
+                    if ancienne is not None and ancienne.cours == cours and ancienne.matiere == matiere:
+                        self.lecons[ancienne.cle] = ancienne
+                        fragments[ancienne.cle] = precedent.fragments.lire(ancienne.cle)
+                        self.reutilisees += 1
+                    else:
+                        lecon = Lecon(matiere, niveau, sujet, cours)
+                        self.lecons[lecon.cle] = lecon
+                        fragments[lecon.cle] = lecon.fragment()
+        self.fragments = MagasinCompact(fragments.items())
+        self.empreintes = {cle: lecon.empreinte for cle, lecon in self.lecons.items()}
+        self.version = empreinte(serialiser(sorted(self.empreintes.items())), taille=8)
+        self.versions = self.publier(chemin, max_versions)
+        self.paquet = self.assembler(fragments.values(), {'complet': True})
+        self.manifeste = CorpsPreserialise({
+            'version': self.version,
+            'lecons': self.empreintes,
+            'versions': list(self.versions),
+            'success': True
+        }).compacter()
+        self.deltas = {}
+        self.verrou = threading.Lock()
+
+    def publier(self, chemin, max_versions):
+        """Ajoute la version courante aux versions publiées ; retourne {version: {cle: empreinte}}"""
+        versions = lire_versions(chemin)
+        if versions and versions[-1]['version'] == self.version:
+            # Déjà publiée (autre worker, redémarrage sans modification des cours) : rien à écrire
+            return {v['version']: v['lecons'] for v in versions}
+        versions = [v for v in versions if v['version'] != self.version]
+        versions.append({'version': self.version, 'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                         'lecons': self.empreintes})
+        versions = versions[-max_versions:]
+        try:
+            ecrire_versions(chemin, versions)
+        except OSError as e:
+            # Dossier en lecture seule : les différences restent possibles depuis les versions connues de ce worker
+            print(f"⚠️ Versions des cours non enregistrées ({e})")
+        return {v['version']: v['lecons'] for v in versions}
+
+    def assembler(self, fragments, entete, supprimes=()):
+        """Corps JSON {"version", ..., "lecons": {cle: cours}, "supprimes": [...]} à partir des fragments"""
+        debut = serialiser({'version': self.version, **entete})[:-1]
+        octets = b''.join([
+            debut, b',"lecons":{', ','.join(fragments).encode('utf-8'),
+            b'},"supprimes":', serialiser(list(supprimes)), b',"success":true}'
+        ])
+        return CorpsPreserialise.depuis_octets(octets).compacter()
+
+    def delta(self, depuis):
+        """Corps des cours ajoutés ou modifiés et des cours supprimés depuis la version du client
+        (paquet complet si cette version est inconnue)"""
+        anciennes = self.versions.get(depuis)
+        if anciennes is None:
+            return self.paquet
+        corps = self.deltas.get(depuis)
+        if corps is None:
+            with self.verrou:
+                corps = self.deltas.get(depuis)
+                if corps is None:
+                    ajoutees = [cle for cle in self.lecons if cle not in anciennes]
+                    modifiees = [cle for cle, e in self.empreintes.items() if cle in anciennes and anciennes[cle] != e]
+                    supprimees = [cle for cle in anciennes if cle not in self.lecons]
+                    corps = self.assembler(
+                        [self.fragments.lire(cle) for cle in ajoutees + modifiees],
+                        {'depuis': depuis, 'complet': False, 'ajoutes': ajoutees, 'modifies': modifiees},
+                        supprimees)
+                    self.deltas[depuis] = corps
+        return corps
+
+    def __len__(self):
+        return len(self.lecons)
+
+    def rapport(self):
+        """Octets économisés : fragments compressés, paquet, manifeste et différences sans variante non compressée"""
+        rapport = self.fragments.rapport()
+        corps = [self.paquet, self.manifeste, *self.deltas.values()]
+        rapport['corps'] = len(corps)
+        rapport['octets_economises'] += sum(c.taille for c in corps)
+        return rapport
@@ -0,0 +1,215 @@
+# Corps de réponse pré-sérialisés et pré-compressés
+# Les réponses constantes sont encodées en JSON une seule fois (à leur première
+# utilisation), puis compressées en gzip et (si le module est installé) en brotli.
+# /chat renvoie ensuite ces octets tels quels : aucune sérialisation ni compression
+# par requête.
+# Chaque corps a une empreinte de son contenu, qui sert d'ETag fort (une variante par
+# encodage) : deux workers qui sérialisent les mêmes données donnent le même ETag.
+# Un corps compacté ne garde que ses variantes compressées : la version non compressée,
+# demandée par les rares clients sans gzip, est décompressée à la volée.
+# Les corps /chat se terminent par le session_id propre à chaque requête
+# (CorpsACompleter) : le début est compressé une fois et laissé ouvert (vidage sur une
+# frontière d'octet) ; seule la fin, quelques dizaines d'octets, est ajoutée par requête.
+
+import gzip
+import hashlib
+import json
+import struct
+import threading
+import zlib
+
+# brotli est optionnel : sans lui, seules les variantes gzip et non compressée existent
+try:
+    import brotli
+    BROTLI_DISPONIBLE = True
+except ImportError:
+    BROTLI_DISPONIBLE = False
+
+
+class CorpsPreserialise:
+    """Corps JSON encodé une fois, avec ses variantes compressées"""
+
+    __slots__ = ('identite', 'gzip', 'br', 'empreinte', 'taille')
+
+    def __init__(self, donnees):
+        self.compresser(serialiser(donnees))
+
+    @classmethod
+    def depuis_octets(cls, identite):
+        """Corps à partir d'octets JSON déjà sérialisés (serialiser())"""
+        corps = object.__new__(cls)
+        corps.compresser(identite)
+        return corps
+
+    def compresser(self, identite):
+        self.identite = identite
+        self.taille = len(identite)
+        self.gzip = gzip.compress(identite, compresslevel=9, mtime=0)
+        self.br = brotli.compress(identite, quality=11) if BROTLI_DISPONIBLE else None
+        self.empreinte = empreinte(identite)
+
+    def variante(self, accept_encoding):
+        """Retourne (encodage, octets) selon l'en-tête Accept-Encoding du client"""
+        encodage = choisir_encodage(accept_encoding, br=self.br is not None)
+        if encodage == 'br':
+            return 'br', self.br
+        if encodage == 'gzip':
+            return 'gzip', self.gzip
+        if self.identite is None:
+            return None, gzip.decompress(self.gzip)
+        return None, self.identite
+
+    def compacter(self):
+        """Libère la variante non compressée (gardée seulement en gzip et brotli) ; retourne le corps"""
+        self.identite = None
+        return self
+
+    def etag(self, encodage=None):
+        """ETag fort de la variante (le même contenu compressé autrement a un autre ETag)"""
+        if encodage:
+            return f'"{self.empreinte}-{encodage}"'
+        return f'"{self.empreinte}"'
+
+    def reconnait(self, if_none_match):
+        """Vrai si l'en-tête If-None-Match du client désigne ce contenu, quelle qu'en soit la variante"""
+        for etag in (if_none_match or '').split(','):
+            etag = etag.strip()
+            if etag == '*':
+                return True
+            if etag.startswith('W/'):
+                etag = etag[2:]
+            if etag.strip('"').split('-')[0] == self.empreinte:
+                return True
+        return False
+
+    def tailles(self):
+        """Tailles en octets de chaque variante"""
+        return {
+            'identite': self.taille,
+            'gzip': len(self.gzip),
+            'br': len(self.br) if self.br is not None else None,
+        }
+
+
+def empreinte(octets, taille=16):
+    """Empreinte hexadécimale (blake2b) d'octets"""
+    return hashlib.blake2b(octets, digest_size=taille).hexdigest()
+
+
+def serialiser(donnees):
+    """Octets JSON compacts (UTF-8) des données"""
+    return json.dumps(donnees, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def choisir_encodage(accept_encoding, br=True):
+    """Choisit le meilleur encodage accepté par le client : brotli, puis gzip, sinon aucun"""
+    acceptes = {}
+    for partie in (accept_encoding or '').split(','):
+        morceaux = partie.strip().split(';')
+        nom = morceaux[0].strip().lower()
+        if not nom:
+            continue
+        qualite = 1.0
+        for parametre in morceaux[1:]:
+            cle, _, valeur = parametre.strip().partition('=')
+            if cle == 'q':
+                try:
+                    qualite = float(valeur)
+                except ValueError:
+                    qualite = 0.0
+        acceptes[nom] = qualite
+
+    def accepte(nom):
+        return acceptes.get(nom, acceptes.get('*', 0.0)) > 0
+
+    if br and accepte('br'):
+        return 'br'
+    if accepte('gzip'):
+        return 'gzip'
+    return None
+
+
+# En-tête gzip fixe (RFC 1952) : deflate, sans nom ni date, compression maximale
+ENTETE_GZIP = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x02\xff'
+
+
+class CorpsACompleter:
+    """Corps JSON pré-compressé dont les dernières clés changent à chaque requête (session_id)"""
+
+    __slots__ = ('donnees', 'debut', 'gzip', 'crc', 'br')
+
+    def __init__(self, donnees):
+        # Le JSON est coupé avant son "}" final : la fin propre à la requête y est ajoutée
+        self.donnees = donnees
+        self.debut = serialiser(donnees)[:-1]
+        # gzip : blocs deflate du début, vidés sur une frontière d'octet, sans bloc final
+        compresseur = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self.gzip = ENTETE_GZIP + compresseur.compress(self.debut) + compresseur.flush(zlib.Z_SYNC_FLUSH)
+        self.crc = zlib.crc32(self.debut)
+        # brotli : méta-blocs du début, vidés sur une frontière d'octet, sans méta-bloc final
+        if BROTLI_DISPONIBLE:
+            compresseur = brotli.Compressor(quality=11)
+            self.br = compresseur.process(self.debut) + compresseur.flush()
+        else:
+            self.br = None
+
+    def variante(self, accept_encoding, **fin):
+        """Retourne (encodage, octets) du corps complété par les clés de fin (ex. session_id=...)"""
+        suite = b''.join(b',' + serialiser(cle) + b':' + serialiser(valeur) for cle, valeur in fin.items()) + b'}'
+        # Une fin plus longue qu'un méta-bloc brotli non compressé est envoyée en gzip (ou sans compression)
+        encodage = choisir_encodage(accept_encoding, br=self.br is not None and len(suite) <= META_BLOC_MAX)
+        if encodage == 'br':
+            return 'br', self.br + meta_bloc_brut(suite) + FIN_BROTLI
+        if encodage == 'gzip':
+            # Nouveaux blocs deflate (le dernier marqué final), puis CRC et taille de tout le JSON
+            compresseur = zlib.compressobj(1, zlib.DEFLATED, -zlib.MAX_WBITS)
+            taille = (len(self.debut) + len(suite)) & 0xFFFFFFFF
+            return 'gzip', b''.join([
+                self.gzip, compresseur.compress(suite), compresseur.flush(),
+                struct.pack('<II', zlib.crc32(suite, self.crc), taille)
+            ])
+        return None, self.debut + suite
+
+
+# Méta-bloc brotli final et vide (RFC 7932 §9.2 : ISLAST=1, ISLASTEMPTY=1)
+FIN_BROTLI = b'\x03'
+# Taille maximale d'un méta-bloc avec MNIBBLES=4 (MLEN-1 sur 16 bits)
+META_BLOC_MAX = 1 << 16
+
+
+def meta_bloc_brut(octets):
+    """Méta-bloc brotli non compressé (RFC 7932 §9.2) contenant les octets (64 Kio au plus)"""
+    if not 0 < len(octets) <= META_BLOC_MAX:
+        raise ValueError(f"Méta-bloc brotli de {len(octets)} octets (1 à {META_BLOC_MAX})")
+    # ISLAST=0, MNIBBLES=4 (code 0), MLEN-1 sur 16 bits, ISUNCOMPRESSED=1 : 20 bits complétés à 3 octets
+    entete = ((len(octets) - 1) << 3) | (1 << 19)
+    return entete.to_bytes(3, 'little') + octets
+
+
+class CorpsALaDemande:
+    """Corps /chat des réponses constantes, pré-sérialisés à la première utilisation de chaque intention"""
+
+    def __init__(self, donnees):
+        # donnees : fonction intention → dictionnaire JSON de la réponse constante, ou None
+        self.donnees = donnees
+        self.corps = {}
+        self.verrou = threading.Lock()
+
+    def get(self, intention):
+        """Retourne le CorpsACompleter de l'intention (None si sa réponse n'est pas constante)"""
+        if intention is None:
+            return None
+        corps = self.corps.get(intention)
+        if corps is None:
+            with self.verrou:
+                corps = self.corps.get(intention)
+                if corps is None:
+                    donnees = self.donnees(intention)
+                    if donnees is None:
+                        return None
+                    corps = CorpsACompleter(donnees)
+                    self.corps[intention] = corps
+        return corps
+
+    def __len__(self):
+        return len(self.corps)
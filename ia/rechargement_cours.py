@@ -0,0 +1,201 @@
+# Rechargement à chaud des cours (sans redémarrer les workers)
+# Les fichiers cours_francais.py et cours_mathematiques.py sont relus (le dictionnaire
+# COURS_* est évalué comme littéral, sans exécuter le module), comparés à la version en
+# mémoire par (niveau, sujet), puis le corpus normalisé et l'index sont reconstruits en
+# reprenant tels quels les cours inchangés. Les nouveaux objets remplacent les anciens
+# d'un seul coup : une requête en cours garde l'index qu'elle a déjà obtenu.
+# Le moteur de recherche configuré (SQLite, PostgreSQL, vecteurs) est ensuite mis à jour
+# (moteurs_cours.recharger), puis l'application invalide ses caches (apres_rechargement).
+#
+# Déclenchement : POST /admin/cours/recharger, ou surveillance des fichiers
+# (COURS_RECHARGEMENT_AUTO = intervalle en secondes). Chaque worker Gunicorn a sa propre
+# copie : le worker qui reçoit POST /admin/cours/recharger l'annonce aux autres en
+# remplaçant le fichier cours_rechargement du dossier de données COURS_DONNEES, que
+# chaque worker vérifie avant ses requêtes (au plus une fois par COURS_ANNONCE_INTERVALLE
+# secondes) ; la surveillance des fichiers, elle, les recharge tous.
+# Avec une source (COURS_MOTEUR=postgres : la table cours_ia), les cours sont relus dans
+# la source plutôt que dans les fichiers, et la surveillance suit sa version.
+
+import ast
+import importlib
+import os
+import threading
+import time
+
+import moteurs_cours
+from corpus_normalise import CorpusNormalise
+from index_cours import IndexCours, PartitionsNiveaux
+from paquets_cours import DOSSIER_DONNEES
+
+CHEMIN_ANNONCE = os.getenv('COURS_ANNONCE', os.path.join(DOSSIER_DONNEES, 'cours_rechargement'))
+INTERVALLE_ANNONCE = float(os.getenv('COURS_ANNONCE_INTERVALLE', '1'))
+
+# matière → (module, base, corpus normalisé, index, index par classe)
+MODULES_COURS = {
+    'francais': ('cours_francais', 'COURS_FRANCAIS', 'CORPUS_COURS', 'INDEX_COURS', 'PARTITIONS_COURS'),
+    'mathematiques': ('cours_mathematiques', 'COURS_MATHEMATIQUES', 'CORPUS_COURS_MATHS', 'INDEX_COURS_MATHS',
+                      'PARTITIONS_COURS_MATHS'),
+}
+
+
+def lire_base(chemin, nom):
+    """Évalue le dictionnaire `nom = {...}` d'un fichier de cours, sans exécuter le module"""
+    with open(chemin, encoding='utf-8') as fichier:
+        arbre = ast.parse(fichier.read(), chemin)
+    for noeud in arbre.body:
+        if isinstance(noeud, ast.Assign) and any(getattr(cible, 'id', None) == nom for cible in noeud.targets):
+            return ast.literal_eval(noeud.value)
+    raise ValueError(f"{nom} introuvable dans {chemin}")
+
+
+def comparer(ancienne, nouvelle):
+    """Différences entre deux bases, par clé "niveau/sujet" """
+    anciens = {(niveau, sujet): cours for niveau, sujets in ancienne.items() for sujet, cours in sujets.items()}
+    nouveaux = {(niveau, sujet): cours for niveau, sujets in nouvelle.items() for sujet, cours in sujets.items()}
+    return {
+        'ajoutes': [f'{n}/{s}' for (n, s) in nouveaux if (n, s) not in anciens],
+        'modifies': [f'{n}/{s}' for (n, s), cours in nouveaux.items() if (n, s) in anciens and anciens[(n, s)] != cours],
+        'supprimes': [f'{n}/{s}' for (n, s) in anciens if (n, s) not in nouveaux],
+    }
+
+
+class RechargementCours:
+    """Relit les fichiers de cours et remplace les bases, corpus et index des matières modifiées"""
+
+    def __init__(self, apres_rechargement=None, source=None, annonce=CHEMIN_ANNONCE,
+                 intervalle_annonce=INTERVALLE_ANNONCE):
+        # apres_rechargement(matiere, differences, base) : invalidation des caches de l'application
+        # source : cours lus ailleurs que dans les fichiers, avec version() et lire() → (version, bases)
+        # (cours_postgres.MoteurPostgres)
+        # annonce : fichier partagé par les workers du serveur, remplacé à chaque rechargement annoncé
+        self.apres_rechargement = apres_rechargement
+        self.source = source
+        self.version_source = None
+        self.annonce = annonce
+        self.intervalle_annonce = intervalle_annonce
+        self.annonce_vue = self.etat_annonce()
+        self.prochaine_verification = 0.0
+        self.verrou_annonce = threading.Lock()
+        self.verrou = threading.Lock()
+        self.modules = {matiere: importlib.import_module(noms[0]) for matiere, noms in MODULES_COURS.items()}
+        self.dates = {matiere: self.date(matiere) for matiere in MODULES_COURS}
+        self.rechargements = 0
+
+    def chemin(self, matiere):
+        return self.modules[matiere].__file__
+
+    def date(self, matiere):
+        return os.path.getmtime(self.chemin(matiere))
+
+    def bases(self):
+        """Bases de cours en mémoire {matière: base}"""
+        return {matiere: getattr(self.modules[matiere], noms[1]) for matiere, noms in MODULES_COURS.items()}
+
+    def recharger(self):
+        """Recharge toutes les matières ; retourne les différences de chacune"""
+        with self.verrou:
+            resultats = {}
+            rechargees = []
+            if self.source is not None:
+                self.version_source, nouvelles = self.source.lire()
+            for matiere, (_, nom_base, nom_corpus, nom_index, nom_partitions) in MODULES_COURS.items():
+                module = self.modules[matiere]
+                if self.source is not None:
+                    # Une matière absente de la source garde ses cours
+                    nouvelle = nouvelles.get(matiere, getattr(module, nom_base))
+                else:
+                    self.dates[matiere] = self.date(matiere)
+                    nouvelle = lire_base(self.chemin(matiere), nom_base)
+                differences = comparer(getattr(module, nom_base), nouvelle)
+                if not any(differences.values()):
+                    resultats[matiere] = differences
+                    continue
+                corpus = CorpusNormalise(nouvelle, precedent=getattr(module, nom_corpus))
+                index = IndexCours(corpus)
+                partitions = PartitionsNiveaux(
+                    matiere, list(nouvelle),
+                    lambda cle, base=nouvelle: list(base.get(cle, {})),
+                    lambda cle, sujet, base=nouvelle: base[cle][sujet],
+                    corpus)
+                # Les index d'abord : rechercher_cours() et les moteurs les lisent à chaque appel
+                setattr(module, nom_partitions, partitions)
+                setattr(module, nom_index, index)
+                setattr(module, nom_corpus, corpus)
+                setattr(module, nom_base, nouvelle)
+                differences['reutilises'] = corpus.reutilises
+                resultats[matiere] = differences
+                rechargees.append(matiere)
+            if rechargees:
+                # Un seul passage pour toutes les matières (fichier SQLite, table, vecteurs recompilés une fois)
+                moteurs_cours.recharger(self.bases())
+            if self.apres_rechargement is not None:
+                for matiere in rechargees:
+                    self.apres_rechargement(matiere, resultats[matiere], self.bases()[matiere])
+            self.rechargements += 1
+            return resultats
+
+    def etat_annonce(self):
+        """(inode, date) du fichier d'annonce : changent à chaque remplacement (None s'il n'existe pas)"""
+        try:
+            etat = os.stat(self.annonce)
+        except FileNotFoundError:
+            return None
+        return (etat.st_ino, etat.st_mtime_ns)
+
+    def annoncer(self):
+        """Annonce aux autres workers du serveur que les cours viennent d'être rechargés"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.annonce)), exist_ok=True)
+        # Suffixe du processus et remplacement atomique : nouvel inode à chaque annonce
+        temporaire = f'{self.annonce}.{os.getpid()}.tmp'
+        with open(temporaire, 'w', encoding='utf-8') as fichier:
+            fichier.write(f'{os.getpid()} {time.time():.6f}\n')
+        os.replace(temporaire, self.annonce)
+        self.annonce_vue = self.etat_annonce()
+
+    def verifier_annonce(self):
+        """Recharge les cours si un autre worker a annoncé un rechargement depuis la dernière vérification
+        (au plus une par intervalle_annonce) ; retourne les différences, ou None"""
+        maintenant = time.monotonic()
+        # Un seul thread du worker vérifie (et recharge) ; les autres continuent avec les cours actuels
+        if maintenant < self.prochaine_verification or not self.verrou_annonce.acquire(blocking=False):
+            return None
+        try:
+            self.prochaine_verification = maintenant + self.intervalle_annonce
+            etat = self.etat_annonce()
+            if etat == self.annonce_vue:
+                return None
+            self.annonce_vue = etat
+            return self.recharger()
+        finally:
+            self.verrou_annonce.release()
+
+    def modifies(self):
+        """Matières dont le fichier a changé depuis le dernier rechargement
+        (avec une source : toutes les matières si sa version a changé)"""
+        if self.source is not None:
+            return list(MODULES_COURS) if self.source.version() != self.version_source else []
+        return [matiere for matiere in MODULES_COURS if self.date(matiere) != self.dates[matiere]]
+
+    def surveiller(self, intervalle):
+        """Démarre un thread qui recharge les cours dès qu'un fichier de cours (ou la version de la source) change"""
+        def boucle():
+            while True:
+                time.sleep(intervalle)
+                try:
+                    if self.modifies():
+                        resultats = self.recharger()
+                        print(f"🔄 Cours rechargés : {resume(resultats)}")
+                except Exception as e:
+                    # Fichier en cours d'édition (erreur de syntaxe...) : l'ancienne version reste servie
+                    print(f"⚠️ Rechargement des cours impossible : {e}")
+
+        thread = threading.Thread(target=boucle, name='rechargement-cours', daemon=True)
+        thread.start()
+        return thread
+
+
+def resume(resultats):
+    return ', '.join(
+        f"{matiere} +{len(d['ajoutes'])} ~{len(d['modifies'])} -{len(d['supprimes'])}"
+        for matiere, d in resultats.items()
+    )
@@ -0,0 +1,92 @@
+# Variante « lite » des réponses, pour les connexions lentes (2G/3G)
+# /chat avec mode=lite renvoie une version condensée de la réponse : sans emoji ni
+# formules d'accueil et de conclusion répétées, sans exercices, astuces ni tableaux
+# récapitulatifs, avec au plus quelques exemples par liste d'exemples. Le cœur de
+# l'explication (règles, tableaux de formules, résumé) est conservé. Les réponses
+# OpenAI sont en plus limitées en longueur (LITE_MAX_TOKENS) puis condensées.
+
+import re
+import unicodedata
+
+# Plafond de longueur des réponses OpenAI en mode lite (au lieu de 4096 tokens)
+LITE_MAX_TOKENS = 600
+CONSIGNE_LITE = ("Réponds de façon concise (moins de 200 mots) : l'explication essentielle, "
+                 "une règle et deux ou trois exemples, sans emoji ni exercices.")
+
+# Formules répétées en tête et en fin de réponse
+FORMULES_OUVERTURE = re.compile(r'^(Excellente question !|Bonjour mon cher\(e\) élève !)\s*$')
+FORMULE_CONCLUSION = re.compile(r'^Continue\b.*$')
+
+# Sections retirées (titre en gras seul sur sa ligne)
+TITRE_SECTION = re.compile(r'^\*\*(.+?)\*\*\s*$')
+SECTIONS_RETIREES = re.compile(r'exercice|corrigé|astuce|mnémotechnique|récapitulatif', re.IGNORECASE)
+SECTIONS_EXEMPLES = re.compile(r'exemple', re.IGNORECASE)
+MAX_EXEMPLES = 3
+
+SEPARATEUR_TABLEAU = re.compile(r'^\|[-|\s]+\|$')
+PUCE = re.compile(r'^\s*(?:[-•]|\d+\.)\s')
+MENTION_COMPLET = re.compile(r'\s*\(100 ?% COMPLET\)', re.IGNORECASE)
+# "(7 exemples)" n'est plus exact une fois la liste raccourcie
+NOMBRE_EXEMPLES = re.compile(r'\s*\(\d+ exemples?\)', re.IGNORECASE)
+
+# Symboles conservés malgré leur catégorie Unicode (sens mathématique)
+SYMBOLES_CONSERVES = {'✓', '°'}
+
+
+def retirer_emoji(texte):
+    """Supprime les emoji et pictogrammes (catégorie Unicode So), sans toucher aux symboles mathématiques"""
+    return ''.join(
+        c for c in texte
+        if c in SYMBOLES_CONSERVES or (unicodedata.category(c) != 'So' and c != '️')
+    )
+
+
+def condenser(texte):
+    """Retourne la variante condensée d'une réponse Markdown"""
+    lignes = retirer_emoji(texte).split('\n')
+    resultat = []
+    section_retiree = False
+    section_exemples = False
+    exemples = 0
+    for ligne in lignes:
+        ligne = MENTION_COMPLET.sub('', ligne.rstrip())
+        if PUCE.match(ligne):
+            ligne = ligne.lstrip()
+        if FORMULES_OUVERTURE.match(ligne) or FORMULE_CONCLUSION.match(ligne):
+            continue
+        titre = TITRE_SECTION.match(ligne)
+        if titre:
+            section_retiree = bool(SECTIONS_RETIREES.search(titre.group(1)))
+            section_exemples = bool(SECTIONS_EXEMPLES.search(titre.group(1)))
+            exemples = 0
+            if section_retiree:
+                continue
+            if section_exemples:
+                ligne = NOMBRE_EXEMPLES.sub('', ligne)
+        elif section_retiree:
+            continue
+        elif section_exemples and PUCE.match(ligne):
+            exemples += 1
+            if exemples > MAX_EXEMPLES:
+                continue
+        if SEPARATEUR_TABLEAU.match(ligne):
+            ligne = '|' + '|'.join('-' for _ in ligne.strip('|').split('|')) + '|'
+        # Une seule ligne vide entre deux blocs
+        if not ligne.strip() and (not resultat or not resultat[-1].strip()):
+            continue
+        resultat.append(ligne)
+    while resultat and not resultat[-1].strip():
+        resultat.pop()
+    return '\n'.join(resultat)
+
+
+def economie(complet, lite):
+    """Octets économisés (UTF-8) par la variante lite"""
+    octets_complets = len(complet.encode('utf-8'))
+    octets_lite = len(lite.encode('utf-8'))
+    return {
+        'octets_complets': octets_complets,
+        'octets_lite': octets_lite,
+        'octets_economises': octets_complets - octets_lite,
+        'taux_economie': round(1 - octets_lite / octets_complets, 4) if octets_complets else 0.0,
+    }
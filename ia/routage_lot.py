@@ -0,0 +1,194 @@
+# Routage par lot des messages du mode démo
+# Les mots-clés de chaque message distinct sont cherchés un message à la fois, avec
+# l'automate du routeur (routeur_demo.py) : cette étape reste une boucle Python. Les
+# intentions touchées sont ensuite rangées dans une matrice booléenne (messages ×
+# intentions, colonnes dans l'ordre de priorité) et seule la résolution des priorités
+# se fait sur tout le lot avec NumPy (premier True de chaque ligne par argmax).
+# Le gain vient surtout des doublons : chaque texte distinct n'est routé qu'une fois.
+# Aucune réponse n'est construite : c'est l'outil pour rejouer l'historique
+# (tables conversations et messages) et mesurer la répartition des intentions.
+#
+# Rejouer l'historique :      python routage_lot.py
+# Router un fichier :         python routage_lot.py --fichier questions.txt   (un message par ligne)
+
+import argparse
+import sys
+import time
+from collections import Counter
+
+from psycopg2 import sql
+
+from normalisation import normaliser_message
+
+# NumPy est optionnel : sans lui, chaque message passe par le routeur un par un
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:
+    NUMPY_DISPONIBLE = False
+
+TAILLE_LOT = 5000
+# Tables d'historique qui contiennent une colonne user_message (créées par ensure_ia_tables dans app.py)
+TABLES_HISTORIQUE = ('conversations', 'messages')
+
+
+class RouteurLot:
+    """Résout par lot les intentions d'un RouteurIntentions (mêmes règles que choisir())"""
+
+    def __init__(self, routeur, classifieur=None, seuil=0.6):
+        self.routeur = routeur
+        self.classifieur = classifieur
+        self.seuil = seuil
+        self.intentions = [intention['id'] for intention in routeur.intentions]
+        self.colonnes = {identifiant: colonne for colonne, identifiant in enumerate(self.intentions)}
+        # Colonnes des intentions à regex, évaluées seulement pour les lignes où elles peuvent gagner
+        self.colonnes_motifs = [(rang, intention['motif']) for rang, intention in routeur.motifs]
+
+    def matrice(self, messages):
+        """Matrices booléennes (messages × intentions) des intentions touchées et des exclusions ("sauf"),
+        remplies message par message à partir des étiquettes trouvées par l'automate"""
+        touchees = np.zeros((len(messages), len(self.intentions)), dtype=bool)
+        exclues = np.zeros_like(touchees)
+        lignes, colonnes, lignes_sauf, colonnes_sauf = [], [], [], []
+        for ligne, message in enumerate(messages):
+            for etiquette in self.routeur.detecter(message):
+                colonne = self.colonnes.get(etiquette)
+                if colonne is not None:
+                    if not self.routeur.accepte(etiquette, message):
+                        continue
+                    lignes.append(ligne)
+                    colonnes.append(colonne)
+                elif etiquette.endswith(':sauf'):
+                    colonne = self.colonnes.get(etiquette[:-5])
+                    if colonne is not None:
+                        lignes_sauf.append(ligne)
+                        colonnes_sauf.append(colonne)
+        touchees[lignes, colonnes] = True
+        exclues[lignes_sauf, colonnes_sauf] = True
+        return touchees, exclues
+
+    def router(self, messages):
+        """Retourne l'intention choisie pour chaque message"""
+        if not messages:
+            return []
+        # L'historique contient beaucoup de doublons : chaque texte distinct n'est routé qu'une fois
+        distincts = {}
+        positions = []
+        for message in messages:
+            message = normaliser_message(message)
+            position = distincts.setdefault(message.brut, (len(distincts), message))[0]
+            positions.append(position)
+        intentions = self.router_distincts([message for _, message in distincts.values()])
+        return [intentions[position] for position in positions]
+
+    def router_distincts(self, messages):
+        """Route une liste de messages normalisés (sans doublons)"""
+        if not NUMPY_DISPONIBLE:
+            return [self.routeur.choisir(message) for message in messages]
+
+        touchees, exclues = self.matrice(messages)
+        touchees &= ~exclues    # intentions admises : touchées, sans "sauf", gardes acceptées
+        # Premier True de chaque ligne = intention de meilleure priorité ; aucune → len(intentions)
+        meilleurs = np.where(touchees.any(axis=1), touchees.argmax(axis=1), len(self.intentions))
+
+        # Les regex ne sont testées que sur les lignes où leur rang bat le meilleur rang des mots-clés
+        for rang, motif in self.colonnes_motifs:
+            for ligne in np.flatnonzero(meilleurs > rang):
+                if motif.search(messages[ligne].brut) and self.routeur.accepte(self.intentions[rang], messages[ligne]):
+                    meilleurs[ligne] = rang
+
+        noms = np.array(self.intentions + [self.routeur.intention_par_defaut], dtype=object)
+        resultats = noms[meilleurs].tolist()
+
+        if self.classifieur is not None:
+            # Même règle que router_demo : le classifieur ne s'applique qu'aux messages sans regex
+            # et ne départage que les intentions admises de chaque message
+            sans_motif = [i for i, message in enumerate(messages) if not self.routeur.correspond_motif(message)]
+            predictions = self.classifieur.predire_lot([messages[i] for i in sans_motif], self.seuil,
+                                                       parmi=[noms[:-1][touchees[i]] for i in sans_motif])
+            for i, (intention, _) in zip(sans_motif, predictions):
+                if intention is not None:
+                    resultats[i] = intention
+        return resultats
+
+    def repartition(self, messages, taille_lot=TAILLE_LOT):
+        """Compte les intentions d'un flux de messages, traité par lots de taille_lot"""
+        compteur = Counter()
+        lot = []
+        for message in messages:
+            lot.append(message)
+            if len(lot) >= taille_lot:
+                compteur.update(self.router(lot))
+                lot = []
+        if lot:
+            compteur.update(self.router(lot))
+        return compteur
+
+
+def lire_historique(connexion, tables=TABLES_HISTORIQUE, taille_lot=TAILLE_LOT):
+    """Parcourt les questions des tables d'historique avec un curseur serveur (sans tout charger en mémoire)"""
+    inconnues = [table for table in tables if table not in TABLES_HISTORIQUE]
+    if inconnues:
+        raise ValueError(f"Tables d'historique inconnues : {', '.join(inconnues)}")
+    for table in tables:
+        curseur = connexion.cursor(name=f'rejeu_{table}')
+        curseur.itersize = taille_lot
+        # Nom de table passé comme identifiant SQL (entre guillemets), jamais collé dans la requête
+        curseur.execute(sql.SQL("SELECT user_message FROM {}").format(sql.Identifier(table)))
+        for (message,) in curseur:
+            yield table, message
+        curseur.close()
+
+
+def afficher_repartition(compteur, titre):
+    total = sum(compteur.values())
+    print(f"\n📊 {titre} : {total} messages")
+    for intention, nombre in compteur.most_common():
+        print(f"   {intention:<22} {nombre:>9}  {100 * nombre / total:6.2f} %")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Routage par lot des messages du mode démo")
+    parser.add_argument('--fichier', help="fichier texte, un message par ligne (au lieu de la base)")
+    parser.add_argument('--tables', nargs='+', default=list(TABLES_HISTORIQUE), choices=TABLES_HISTORIQUE,
+                        help="tables d'historique à rejouer (défaut : conversations messages)")
+    parser.add_argument('--taille-lot', type=int, default=TAILLE_LOT)
+    arguments = parser.parse_args()
+
+    from app import ROUTEUR_DEMO, CLASSIFIEUR_DEMO, CLASSIFIEUR_SEUIL, get_db_connection
+    routeur_lot = RouteurLot(ROUTEUR_DEMO, CLASSIFIEUR_DEMO, CLASSIFIEUR_SEUIL)
+    debut = time.perf_counter()
+
+    if arguments.fichier:
+        with open(arguments.fichier, encoding='utf-8') as fichier:
+            lignes = (ligne.rstrip('\n') for ligne in fichier)
+            compteur = routeur_lot.repartition((ligne for ligne in lignes if ligne.strip()), arguments.taille_lot)
+        afficher_repartition(compteur, arguments.fichier)
+    else:
+        connexion = get_db_connection()
+        if connexion is None:
+            print("❌ Base de données indisponible")
+            sys.exit(1)
+        par_table = {table: Counter() for table in arguments.tables}
+        lot = []
+
+        def vider(lot):
+            for (table, _), intention in zip(lot, routeur_lot.router([message for _, message in lot])):
+                par_table[table][intention] += 1
+
+        for table, message in lire_historique(connexion, arguments.tables, arguments.taille_lot):
+            lot.append((table, message))
+            if len(lot) >= arguments.taille_lot:
+                vider(lot)
+                lot = []
+        if lot:
+            vider(lot)
+        connexion.close()
+        for table, compteur in par_table.items():
+            afficher_repartition(compteur, f"Table {table}")
+        compteur = sum(par_table.values(), Counter())
+        afficher_repartition(compteur, "Total")
+
+    duree = time.perf_counter() - debut
+    total = sum(compteur.values())
+    print(f"\n✅ {total} messages routés en {duree:.2f} s ({total / duree if duree else 0:.0f} messages/s)")
@@ -0,0 +1,195 @@
+# Routeur des intentions du mode démo
+# Toutes les listes de mots-clés de get_response_demo sont compilées une seule fois
+# (au démarrage) en un automate d'Aho-Corasick : un seul passage sur le message
+# trouve toutes les intentions touchées, puis l'ordre de priorité des branches
+# décide de l'intention gagnante.
+# L'automate travaille sur les mots normalisés (voir normalisation.py) : les motifs
+# sont des suites de mots, ce qui évite que "sin" soit trouvé dans "dessin".
+# Les mots inconnus du vocabulaire des motifs peuvent être corrigés au préalable
+# (voir correction_orthographique.py).
+
+from collections import deque
+
+from correction_orthographique import IndexSymSpell
+from normalisation import normaliser_message, tokeniser
+
+
+class AutomateMotsCles:
+    """Automate d'Aho-Corasick : trouve tous les motifs présents dans une séquence en un seul passage"""
+
+    def __init__(self, motifs):
+        # motifs : dictionnaire {motif: ensemble d'étiquettes}, un motif étant une séquence
+        # (chaîne de caractères ou tuple de mots)
+        self.transitions = [{}]
+        self.echecs = [0]
+        self.sorties = [frozenset()]
+
+        sorties = [set()]
+        for motif, etiquettes in motifs.items():
+            if not motif:
+                continue
+            etat = 0
+            for symbole in motif:
+                suivant = self.transitions[etat].get(symbole)
+                if suivant is None:
+                    suivant = len(self.transitions)
+                    self.transitions[etat][symbole] = suivant
+                    self.transitions.append({})
+                    self.echecs.append(0)
+                    sorties.append(set())
+                etat = suivant
+            sorties[etat].update(etiquettes)
+
+        # Liens d'échec calculés en largeur ; chaque état hérite des sorties de son lien d'échec
+        file_attente = deque(self.transitions[0].values())
+        while file_attente:
+            etat = file_attente.popleft()
+            for symbole, suivant in self.transitions[etat].items():
+                file_attente.append(suivant)
+                repli = self.echecs[etat]
+                while repli and symbole not in self.transitions[repli]:
+                    repli = self.echecs[repli]
+                cible = self.transitions[repli].get(symbole, 0)
+                self.echecs[suivant] = cible if cible != suivant else 0
+                sorties[suivant].update(sorties[self.echecs[suivant]])
+
+        self.sorties = [frozenset(s) for s in sorties]
+
+    def rechercher(self, sequence):
+        """Retourne l'ensemble des étiquettes dont au moins un motif apparaît dans la séquence"""
+        transitions = self.transitions
+        echecs = self.echecs
+        sorties = self.sorties
+        trouvees = set()
+        etat = 0
+        for symbole in sequence:
+            while etat and symbole not in transitions[etat]:
+                etat = echecs[etat]
+            etat = transitions[etat].get(symbole, 0)
+            if sorties[etat]:
+                trouvees |= sorties[etat]
+        return trouvees
+
+    def rechercher_compte(self, sequence):
+        """Comme rechercher(), et compte aussi les transitions suivies (instrumentation)"""
+        transitions = self.transitions
+        echecs = self.echecs
+        sorties = self.sorties
+        trouvees = set()
+        comparaisons = 0
+        etat = 0
+        for symbole in sequence:
+            while etat and symbole not in transitions[etat]:
+                etat = echecs[etat]
+                comparaisons += 1
+            etat = transitions[etat].get(symbole, 0)
+            comparaisons += 1
+            if sorties[etat]:
+                trouvees |= sorties[etat]
+        return trouvees, comparaisons
+
+
+class RouteurIntentions:
+    """Compile les intentions (dans l'ordre de priorité) et choisit l'intention gagnante d'un message"""
+
+    def __init__(self, intentions, listes_secondaires=None, intention_par_defaut='defaut', correction=True,
+                 mots_connus=()):
+        # intentions : liste ordonnée de dictionnaires
+        #   {"id": ..., "mots": [...], "sauf": [...]}  → touchée si un mot apparaît et aucun mot de "sauf"
+        #   {"id": ..., "motif": regex compilée}       → touchée si la regex trouve une correspondance
+        #                                                 dans le message brut (minuscules, accents conservés)
+        #   "garde": fonction(message normalisé) → bool  → l'intention touchée (par ses mots ou sa regex)
+        #                                                 n'est retenue que si la fonction l'accepte
+        #                                                 (lexique pondéré des maths...)
+        # listes_secondaires : {étiquette: [mots]} utilisées à l'intérieur des branches
+        # correction : corrige les mots inconnus vers le vocabulaire des motifs avant la recherche
+        # mots_connus : mots corrects hors motifs (vocabulaire des cours), jamais corrigés
+        self.intentions = intentions
+        self.intention_par_defaut = intention_par_defaut
+        self.rangs = {intention['id']: rang for rang, intention in enumerate(intentions)}
+        self.motifs = [(rang, intention) for rang, intention in enumerate(intentions) if 'motif' in intention]
+        self.gardes = {intention['id']: intention['garde'] for intention in intentions if 'garde' in intention}
+
+        motifs = {}
+
+        def ajouter(mots, etiquette):
+            for mot in mots:
+                motifs.setdefault(tokeniser(mot), set()).add(etiquette)
+
+        for intention in intentions:
+            ajouter(intention.get('mots', []), intention['id'])
+            ajouter(intention.get('sauf', []), intention['id'] + ':sauf')
+        for etiquette, mots in (listes_secondaires or {}).items():
+            ajouter(mots, etiquette)
+
+        self.automate = AutomateMotsCles(motifs)
+
+        self.correcteur = None
+        if correction:
+            frequences = {}
+            for motif in motifs:
+                for mot in motif:
+                    frequences[mot] = frequences.get(mot, 0) + 1
+            self.correcteur = IndexSymSpell(frequences, mots_connus)
+
+    def tokens(self, message):
+        """Mots normalisés du message, corrigés vers le vocabulaire des motifs si la correction est active"""
+        tokens = normaliser_message(message).tokens
+        if self.correcteur is not None:
+            return self.correcteur.corriger_tokens(tokens)
+        return tokens
+
+    def detecter(self, message):
+        """Retourne toutes les étiquettes touchées par le message (un seul passage sur ses mots)"""
+        return self.automate.rechercher(self.tokens(message))
+
+    def detecter_compte(self, message):
+        """Comme detecter(), et retourne aussi le nombre de transitions de l'automate (instrumentation)"""
+        return self.automate.rechercher_compte(self.tokens(message))
+
+    def accepte(self, etiquette, message):
+        """Vrai si l'intention touchée n'a pas de garde ou si sa garde accepte le message"""
+        garde = self.gardes.get(etiquette)
+        return garde is None or garde(normaliser_message(message))
+
+    def admissibles(self, message, touches=None):
+        """Intentions à mots-clés touchées, non exclues par leur "sauf" et acceptées par leur garde"""
+        message = normaliser_message(message)
+        if touches is None:
+            touches = self.detecter(message)
+        return {etiquette for etiquette in touches
+                if etiquette in self.rangs and etiquette + ':sauf' not in touches and self.accepte(etiquette, message)}
+
+    def correspond_motif(self, message):
+        """Vrai si une intention à regex correspond au message brut (le routage ne dépend alors plus seulement des mots)"""
+        message = normaliser_message(message)
+        return any(intention['motif'].search(message.brut) for _, intention in self.motifs)
+
+    def choisir(self, message, touches=None, trace=None):
+        """Retourne l'identifiant de la première intention touchée dans l'ordre de priorité"""
+        message = normaliser_message(message)
+        if touches is None:
+            touches = self.detecter(message)
+        # Meilleur rang parmi les intentions à mots-clés touchées (sans comparer les autres)
+        meilleur = len(self.intentions)
+        for etiquette in touches:
+            rang = self.rangs.get(etiquette)
+            if (rang is not None and rang < meilleur and etiquette + ':sauf' not in touches
+                    and self.accepte(etiquette, message)):
+                meilleur = rang
+        # Les intentions à regex ne sont évaluées que si elles passent avant ce rang
+        choisie = None
+        regex_evaluees = 0
+        for rang, intention in self.motifs:
+            if rang >= meilleur:
+                break
+            regex_evaluees += 1
+            if intention['motif'].search(message.brut) and self.accepte(intention['id'], message):
+                choisie = intention['id']
+                break
+        if choisie is None:
+            choisie = self.intentions[meilleur]['id'] if meilleur < len(self.intentions) else self.intention_par_defaut
+        if trace is not None:
+            # trace (instrumentation) : étiquettes examinées + regex évaluées
+            trace['comparaisons'] = trace.get('comparaisons', 0) + len(touches) + regex_evaluees
+        return choisie
@@ -0,0 +1,88 @@
+# Sections des cours
+# Le contenu d'un cours est une longue chaîne Markdown. Il est découpé ici en sections
+# aux lignes qui commencent par un intertitre en gras ("**Dérivées des fonctions de
+# base :**", "**1. Le Sujet :**"...). Chaque section a un identifiant stable
+# (niveau/sujet#numéro), ses mots normalisés, son nombre de mots et sa taille en octets.
+# Une section ne copie pas son texte : elle garde les positions (début, fin) de son
+# passage dans le contenu du cours, lu à la demande.
+# Les sections sont calculées une fois avec le corpus normalisé (corpus_normalise.py) ;
+# une recherche peut alors répondre par la section qui correspond à la question, avec
+# le lien du cours complet, au lieu de recopier toute la leçon.
+
+import re
+from collections import Counter
+
+from normalisation import tokeniser
+
+# Ligne qui commence par un passage en gras : début d'une nouvelle section
+MOTIF_INTERTITRE = re.compile(r'^\*\*(.+?)\*\*', re.M)
+
+URL_COURS = '/courses/{niveau}/{sujet}'
+
+# Une section très courte (un intertitre et deux lignes) est complétée par les suivantes
+OCTETS_MIN_PASSAGE = 400
+
+
+class Section:
+    """Une section d'un cours, délimitée par son intertitre"""
+
+    __slots__ = ('id', 'niveau', 'sujet', 'numero', 'titre', 'contenu', 'debut', 'fin', 'mots', 'tokens', 'octets')
+
+    def __init__(self, niveau, sujet, numero, titre, contenu, debut, fin):
+        self.id = f'{niveau}/{sujet}#{numero}'
+        self.niveau = niveau
+        self.sujet = sujet
+        self.numero = numero
+        self.titre = titre
+        # Contenu du cours (partagé, non copié) et positions de la section, espaces de bord exclus
+        while debut < fin and contenu[debut].isspace():
+            debut += 1
+        while fin > debut and contenu[fin - 1].isspace():
+            fin -= 1
+        self.contenu = contenu
+        self.debut = debut
+        self.fin = fin
+        texte = self.texte
+        mots = tokeniser(f'{titre}\n{texte}')
+        self.mots = Counter(mots)
+        self.tokens = len(mots)
+        self.octets = len(texte.encode('utf-8'))
+
+    @property
+    def texte(self):
+        return self.contenu[self.debut:self.fin]
+
+    def resume(self):
+        """Description de la section sans son texte (liste des sections d'un cours)"""
+        return {'id': self.id, 'numero': self.numero, 'titre': self.titre,
+                'tokens': self.tokens, 'octets': self.octets}
+
+
+def lien_cours(niveau, sujet):
+    """Lien du cours complet"""
+    return URL_COURS.format(niveau=niveau, sujet=sujet)
+
+
+def decouper(niveau, sujet, cours):
+    """Sections d'un cours ; le texte placé avant le premier intertitre forme la section 0"""
+    contenu = cours['contenu']
+    debuts = [correspondance.start() for correspondance in MOTIF_INTERTITRE.finditer(contenu)]
+    sections = []
+    if contenu[:debuts[0] if debuts else len(contenu)].strip():
+        sections.append(Section(niveau, sujet, 0, cours['titre'], contenu, 0, debuts[0] if debuts else len(contenu)))
+    for numero, (debut, fin) in enumerate(zip(debuts, debuts[1:] + [len(contenu)]), 1):
+        titre = MOTIF_INTERTITRE.match(contenu, debut).group(1).strip().rstrip(':').strip()
+        sections.append(Section(niveau, sujet, numero, titre, contenu, debut, fin))
+    return sections
+
+
+def passage(sections, section, octets_min=OCTETS_MIN_PASSAGE):
+    """Texte de la section, suivi des sections suivantes du cours tant qu'il fait moins de octets_min"""
+    textes = [section.texte]
+    octets = section.octets
+    for suivante in sections[sections.index(section) + 1:]:
+        if octets >= octets_min:
+            break
+        textes.append(suivante.texte)
+        octets += suivante.octets
+    return '\n\n'.join(textes)
@@ -0,0 +1,36 @@
+# Configuration commune des tests du service IA
+# Les modules du service sont à la racine de ia/ (ce n'est pas un paquet) : le dossier est
+# ajouté au chemin d'import. Les tests tournent en mode démo (sans clé d'API), avec un jeton
+# administrateur connu, et les fichiers générés par le service vont dans un dossier temporaire.
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+DOSSIER_IA = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DOSSIER_IA)
+
+os.environ['OPENAI_API_KEY'] = ''
+os.environ['HUGGINGFACE_API_KEY'] = ''
+os.environ['IA_ADMIN_TOKEN'] = 'jeton-des-tests'
+os.environ.setdefault('COURS_DONNEES', tempfile.mkdtemp(prefix='ia-tests-'))
+
+
+@pytest.fixture(scope='session')
+def app_ia():
+    """Module app.py importé une seule fois (routeur, index et API des cours construits au démarrage)"""
+    import app
+    return app
+
+
+@pytest.fixture
+def client(app_ia):
+    return app_ia.app.test_client()
+
+
+@pytest.fixture
+def admin():
+    """En-têtes des routes d'administration et de diagnostic"""
+    return {'X-Admin-Token': os.environ['IA_ADMIN_TOKEN']}
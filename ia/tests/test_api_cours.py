@@ -0,0 +1,78 @@
+# API REST des cours : corps pré-compressés, ETag fort par variante, réponses 304, corps repris après rechargement
+
+import gzip
+import json
+
+import pytest
+
+from catalogue_cours import CatalogueCours
+from corpus_normalise import CorpusNormalise
+from index_cours import IndexCours
+
+
+def test_liste_des_niveaux(client):
+    reponse = client.get('/courses')
+    assert reponse.status_code == 200
+    donnees = reponse.get_json()
+    assert donnees['success'] is True
+    assert {'niveau': 'seconde', 'cours': 6, 'lien': '/courses/seconde'} in donnees['matieres']['mathematiques']
+
+
+def test_variantes_compressees_identiques(client):
+    brut = client.get('/courses/seconde/nombres_et_calculs')
+    compresse = client.get('/courses/seconde/nombres_et_calculs', headers={'Accept-Encoding': 'gzip'})
+    assert brut.headers.get('Content-Encoding') is None
+    assert compresse.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compresse.data) == brut.data
+    assert json.loads(brut.data)['cours']['titre']
+    # Un ETag par variante, tiré du même contenu
+    assert brut.headers['ETag'] != compresse.headers['ETag']
+    assert compresse.headers['ETag'].startswith(brut.headers['ETag'][:-1])
+    assert compresse.headers['Vary'] == 'Accept-Encoding'
+    assert 'max-age' in compresse.headers['Cache-Control']
+
+
+@pytest.mark.parametrize('encodage', ['', 'gzip', 'br, gzip'])
+def test_304_si_le_client_a_deja_le_contenu(client, encodage):
+    premiere = client.get('/courses/seconde', headers={'Accept-Encoding': encodage})
+    etag = premiere.headers['ETag']
+    for if_none_match in (etag, f'W/{etag}', f'"autre", {etag}', '*'):
+        reponse = client.get('/courses/seconde', headers={'Accept-Encoding': encodage, 'If-None-Match': if_none_match})
+        assert reponse.status_code == 304
+        assert reponse.data == b''
+        assert reponse.headers['ETag'] == etag
+    # Une autre variante du même contenu est aussi reconnue
+    reponse = client.get('/courses/seconde', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert reponse.status_code == 304
+
+
+def test_200_si_le_contenu_a_change(client):
+    reponse = client.get('/courses/seconde', headers={'If-None-Match': '"0123456789abcdef0123456789abcdef"'})
+    assert reponse.status_code == 200 and reponse.data
+
+
+def test_cours_ou_niveau_inconnu(client):
+    assert client.get('/courses/seconde/inconnu').status_code == 404
+    assert client.get('/courses/inconnu').status_code == 404
+    assert client.get('/courses/seconde/nombres_et_calculs?section=999').status_code == 404
+
+
+def catalogue(base, precedent=None):
+    return CatalogueCours({'mathematiques': IndexCours(CorpusNormalise(base), voisins=0)}, precedent)
+
+
+def test_corps_inchanges_repris_apres_rechargement():
+    base = {
+        'seconde': {'vecteurs': {'titre': 'Vecteurs', 'contenu': 'Coordonnées d’un vecteur.', 'exemples': []}},
+        'premiere_stpl': {'derivees': {'titre': 'Dérivées', 'contenu': 'Nombre dérivé.', 'exemples': []}},
+    }
+    precedent = catalogue(base)
+    assert catalogue(base, precedent).reutilises == len(precedent)
+
+    modifiee = {**base, 'seconde': {'vecteurs': dict(base['seconde']['vecteurs'], titre='Les vecteurs')}}
+    nouveau = catalogue(modifiee, precedent)
+    # Seuls le cours modifié et la liste de son niveau (titres) sont recompressés
+    assert nouveau.reutilises == len(precedent) - 2
+    assert nouveau.get() is precedent.get()
+    assert nouveau.get('premiere_stpl', 'derivees') is precedent.get('premiere_stpl', 'derivees')
+    assert nouveau.get('seconde', 'vecteurs').etag('') != precedent.get('seconde', 'vecteurs').etag('')
@@ -0,0 +1,25 @@
+# Cache LRU des réponses du mode démo : limites en entrées et en octets, réponses servies depuis le cache
+
+from cache_reponses import CacheLRU
+
+
+def test_reponse_mise_en_cache(app_ia):
+    app_ia.CACHE_DEMO.vider()
+    premiere = app_ia.router_demo("les jours de la semaine")
+    succes = app_ia.CACHE_DEMO.succes
+    assert app_ia.router_demo("Les jours de la semaine !") == premiere
+    assert app_ia.CACHE_DEMO.succes == succes + 1
+
+
+def test_cache_lru_borne_en_entrees_et_en_octets():
+    cache = CacheLRU(max_entrees=2, max_octets=20)
+    cache.stocker('a', 'x')
+    cache.stocker('b', 'y')
+    assert cache.obtenir('a') == 'x'
+    cache.stocker('c', 'z')                     # 'b' est le moins récent : évincé
+    assert cache.obtenir('b') is None
+    assert cache.obtenir('a') == 'x'
+    cache.stocker('d', 'w' * 18)                # 19 octets : tout le reste est évincé
+    assert cache.obtenir('a') is None and cache.obtenir('d') == 'w' * 18
+    cache.stocker('e', 'v' * 30)                # plus grand que le cache : ignoré
+    assert cache.obtenir('e') is None
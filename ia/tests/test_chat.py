@@ -0,0 +1,77 @@
+# /chat : un seul schéma JSON, que la réponse soit pré-sérialisée ou construite à la requête
+
+import gzip
+import json
+import uuid
+
+import pytest
+
+from preserialisation import BROTLI_DISPONIBLE, CorpsACompleter
+
+CONSTANTE = 'bonjour'                        # salutation : corps pré-sérialisé
+DYNAMIQUE = 'quelle est la dérivée de x²'    # maths : réponse construite à la requête
+SESSION = '0b8f6c1e-4a57-4f43-9d47-2f1c3e5a7b90'
+
+
+def poster(client, message, encodage='', **donnees):
+    reponse = client.post('/chat', json={'message': message, 'session_id': SESSION, **donnees},
+                          headers={'Accept-Encoding': encodage})
+    assert reponse.status_code == 200
+    return decoder(reponse)
+
+
+def decoder(reponse):
+    """Données JSON d'une réponse, décompressée selon son Content-Encoding"""
+    octets = reponse.data
+    if reponse.headers.get('Content-Encoding') == 'gzip':
+        octets = gzip.decompress(octets)
+    elif reponse.headers.get('Content-Encoding') == 'br':
+        import brotli
+        octets = brotli.decompress(octets)
+    return json.loads(octets)
+
+
+@pytest.mark.parametrize('mode', [None, 'lite'])
+def test_meme_schema_constante_et_dynamique(client, mode):
+    constante = poster(client, CONSTANTE, mode=mode)
+    dynamique = poster(client, DYNAMIQUE, mode=mode)
+    assert set(constante) == set(dynamique)
+    assert constante['session_id'] == dynamique['session_id'] == SESSION
+
+
+@pytest.mark.parametrize('encodage', ['', 'gzip', 'br'])
+def test_session_id_dans_chaque_variante(client, encodage):
+    if encodage == 'br' and not BROTLI_DISPONIBLE:
+        pytest.skip('brotli non installé')
+    donnees = poster(client, CONSTANTE, encodage, mode='lite')
+    assert donnees['session_id'] == SESSION
+    assert donnees['mode'] == 'lite'
+    assert donnees['success'] is True
+
+
+@pytest.mark.parametrize('session_id', ['a"b\\c', 'x' * 70000, 42, None])
+def test_session_id_invalide_remplace(client, session_id):
+    reponse = client.post('/chat', json={'message': CONSTANTE, 'session_id': session_id},
+                          headers={'Accept-Encoding': 'br, gzip'})
+    assert reponse.status_code == 200
+    assert str(uuid.UUID(decoder(reponse)['session_id'])) != session_id
+
+
+def test_fin_trop_longue_pour_un_meta_bloc_brotli():
+    corps = CorpsACompleter({'response': 'Bonjour !', 'success': True})
+    encodage, octets = corps.variante('br, gzip', session_id='x' * 70000)
+    assert encodage == 'gzip'
+    assert json.loads(gzip.decompress(octets))['session_id'] == 'x' * 70000
+    assert corps.variante('br', session_id='x' * 70000)[0] is None
+
+
+def test_lite_condense_une_seule_fois(client, monkeypatch):
+    import app
+    appels = []
+    condenser = app.condenser
+    monkeypatch.setattr(app, 'condenser', lambda texte: appels.append(texte) or condenser(texte))
+    poster(client, CONSTANTE, mode='lite')
+    avant = len(appels)
+    for _ in range(3):
+        poster(client, CONSTANTE, mode='lite')
+    assert len(appels) == avant
@@ -0,0 +1,76 @@
+# Classement des cours (BM25F) : mêmes scores qu'un calcul naïf, document par document, sur tous les cours
+
+import math
+
+import pytest
+
+import cours_francais
+import cours_mathematiques
+from index_cours import B, K1, MOTS_VIDES, POIDS_CHAMPS, IndexCours
+from normalisation import tokeniser
+
+QUESTIONS = [
+    "comment calculer la dérivée d'un produit",
+    "loi normale centrée réduite",
+    "suite géométrique de raison q",
+    "accord du participe passé avec avoir",
+    "les figures de style",
+    "conjugaison du subjonctif",
+    "matrice inverse déterminant",
+    "zzz inconnu",
+]
+
+
+def index_des_bases():
+    return [IndexCours(cours_francais.CORPUS_COURS), IndexCours(cours_mathematiques.CORPUS_COURS_MATHS)]
+
+
+def classer_naif(corpus, question, k, seuil):
+    """BM25F recalculé document par document, sans index"""
+    documents = corpus.documents
+    nombre = len(documents)
+    longueurs = [{'titre': d.longueurs['sujet'] + d.longueurs['titre'], 'exemples': d.longueurs['exemples'],
+                  'contenu': d.longueurs['contenu']} for d in documents]
+    moyennes = {champ: (sum(l[champ] for l in longueurs) / nombre) or 1.0 for champ in POIDS_CHAMPS}
+    mots = set(tokeniser(question)) - MOTS_VIDES
+    scores = []
+    for numero, document in enumerate(documents):
+        score = 0.0
+        for mot in mots:
+            presents = sum(1 for autre in documents if any(mot in f for f in autre.frequences.values()))
+            frequences = {
+                'titre': document.frequences['sujet'][mot] + document.frequences['titre'][mot],
+                'exemples': document.frequences['exemples'][mot],
+                'contenu': document.frequences['contenu'][mot],
+            }
+            if not any(frequences.values()):
+                continue
+            idf = math.log(1 + (nombre - presents + 0.5) / (presents + 0.5))
+            tf = sum(POIDS_CHAMPS[champ] * n / (1 - B + B * longueurs[numero][champ] / moyennes[champ])
+                     for champ, n in frequences.items() if n)
+            score += idf * tf / (K1 + tf)
+        if score:
+            scores.append((score, numero))
+    scores.sort(key=lambda element: (-element[0], element[1]))
+    return [(documents[numero].cle, round(score, 3)) for score, numero in scores[:k] if score >= seuil]
+
+
+@pytest.mark.parametrize('question', QUESTIONS)
+def test_classement_identique_au_calcul_naif(question):
+    for index in index_des_bases():
+        resultats = index.classer(question, k=5, seuil=0.5)
+        obtenus = [((r['niveau'], r['sujet']), r['score']) for r in resultats]
+        assert obtenus == classer_naif(index.corpus, question, 5, 0.5)
+
+
+def test_les_questions_trouvent_des_cours():
+    francais, maths = index_des_bases()
+    assert maths.classer(QUESTIONS[1], k=1)[0]['sujet'] == 'loi_normale'
+    assert francais.classer(QUESTIONS[3], k=1)
+
+
+def test_le_cours_le_mieux_classe_est_servi(app_ia):
+    meilleur = cours_mathematiques.classer_cours_maths('loi normale', k=1)[0]
+    assert meilleur['sujet'] == 'loi_normale'
+    intention, reponse = app_ia.router_demo('loi normale')
+    assert intention == 'maths' and meilleur['cours']['titre'] in reponse
@@ -0,0 +1,83 @@
+# Backend classifieur du routeur démo : il ne départage que les intentions admises par la chaîne
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from classifieur_intentions import ClassifieurIntentions, charger_ou_entrainer, documents_entrainement, signature_documents
+from routage_lot import RouteurLot
+
+# La chaîne a raison ; le classifieur seul se trompait avec assurance (adverbe 0,91, maths 0,97...)
+CAS = [
+    ("merci beaucoup", "remerciement"),
+    ("quelle est la couleur du ciel", "couleurs"),
+    ("la raison de mon retard", "defaut"),
+    ("bonjour", "salutation"),
+    ("le pluriel de cheval", "pluriel"),
+    ("quelle est la dérivée de x²", "maths"),
+]
+
+
+def sources(app_ia):
+    return {'routeur': app_ia.ROUTEUR_DEMO, 'cours_francais': app_ia.cours_francais.COURS_FRANCAIS,
+            'cours_maths': app_ia.cours_mathematiques.COURS_MATHEMATIQUES,
+            'mots_cles_maths': app_ia.cours_mathematiques.MOTS_CLES_MATHS}
+
+
+def intentions(app_ia):
+    return [i for i in app_ia.INTENTIONS_DEMO if 'mots' in i]
+
+
+@pytest.fixture(scope='module')
+def classifieur(app_ia, tmp_path_factory):
+    return charger_ou_entrainer(intentions(app_ia), chemin=str(tmp_path_factory.mktemp('modele') / 'absent.npz'),
+                                **sources(app_ia))
+
+
+@pytest.fixture
+def avec_classifieur(app_ia, classifieur, monkeypatch):
+    monkeypatch.setattr(app_ia, 'CLASSIFIEUR_DEMO', classifieur)
+    app_ia.CACHE_DEMO.vider()
+    yield
+    app_ia.CACHE_DEMO.vider()
+
+
+@pytest.mark.parametrize('message, intention', CAS)
+def test_le_classifieur_ne_contredit_pas_la_chaine(app_ia, avec_classifieur, message, intention):
+    assert app_ia.router_demo(message)[0] == intention
+
+
+def test_routage_par_lot_avec_classifieur(app_ia, classifieur, avec_classifieur):
+    messages = [message for message, _ in CAS]
+    lot = RouteurLot(app_ia.ROUTEUR_DEMO, classifieur, app_ia.CLASSIFIEUR_SEUIL).router(messages)
+    assert lot == [app_ia.router_demo(message)[0] for message in messages]
+
+
+def test_prediction_limitee_aux_intentions_admises(classifieur):
+    intention, confiance = classifieur.predire("merci beaucoup", parmi={'remerciement'})
+    assert (intention, confiance) == ('remerciement', pytest.approx(1.0))
+    assert classifieur.predire("la raison de mon retard", parmi=set()) == (None, 0.0)
+
+
+def test_confiances_calibrees_sur_documents_ecartes(classifieur, app_ia):
+    # Sans restriction, une phrase hors sujet ne passe pas le seuil
+    intention, confiance = classifieur.predire("la raison de mon retard", app_ia.CLASSIFIEUR_SEUIL)
+    assert intention is None and confiance < app_ia.CLASSIFIEUR_SEUIL
+
+
+def test_modele_perime_reentraine(app_ia, classifieur, tmp_path, monkeypatch):
+    chemin = str(tmp_path / 'modele.npz')
+    classifieur.sauvegarder(chemin, signature='ancienne')
+    entraine = []
+    original = ClassifieurIntentions.entrainer
+    monkeypatch.setattr(ClassifieurIntentions, 'entrainer',
+                        classmethod(lambda cls, documents: entraine.append(len(documents)) or original(documents)))
+    charger_ou_entrainer(intentions(app_ia), chemin=chemin, **sources(app_ia))
+    assert len(entraine) == 1
+
+    # Signature à jour : le modèle enregistré est repris sans entraînement
+    classifieur.sauvegarder(chemin, signature=signature_documents(documents_entrainement(intentions(app_ia),
+                                                                                        **sources(app_ia))))
+    charge = charger_ou_entrainer(intentions(app_ia), chemin=chemin, **sources(app_ia))
+    assert len(entraine) == 1
+    assert charge.intentions == classifieur.intentions
@@ -0,0 +1,69 @@
+# Contexte des prompts OpenAI : extraits des leçons pertinentes au lieu du programme complet
+
+from contexte_rag import (estimer_tokens, estimer_tokens_messages, extraits_pertinents, formater_contexte,
+                          meilleurs_paragraphes)
+
+CONTENU = ("**Définition :** une suite géométrique de raison q.\n\n"
+           "**Somme :** somme de termes arithmétiques consécutifs.\n\n"
+           "**Limite :** limite d'une suite géométrique selon q.")
+
+
+class MoteurFactice:
+    """Moteur de cours aux résultats fixés par matière"""
+
+    def __init__(self, resultats):
+        self.resultats = resultats
+        self.appels = []
+
+    def classer(self, matiere, question, k=3, seuil=None, niveau=None):
+        self.appels.append((matiere, niveau))
+        return self.resultats.get(matiere, [])[:k]
+
+
+def resultat(sujet, score, titre='Suites', contenu=CONTENU):
+    return {'niveau': 'premiere_stpl', 'sujet': sujet, 'score': score,
+            'cours': {'titre': titre, 'contenu': contenu, 'exemples': []}}
+
+
+def test_estimation_des_tokens():
+    assert estimer_tokens('') == 0
+    assert estimer_tokens('abcde') == 2
+    assert estimer_tokens_messages([{'content': 'abcd'}, {'content': ''}]) == 1 + 4 + 4
+
+
+def test_paragraphes_de_la_question_dans_l_ordre_du_cours():
+    mots = {'suite', 'geometrique'}
+    texte = meilleurs_paragraphes(CONTENU, mots)
+    assert texte.startswith('**Définition') and texte.endswith('selon q.')
+    assert 'arithmétique' not in texte
+    # Au moins un paragraphe, même trop long ou sans mot de la question
+    assert meilleurs_paragraphes(CONTENU, {'integrale'}, taille=20) == CONTENU[:20]
+
+
+def test_meilleurs_extraits_toutes_matieres():
+    moteur = MoteurFactice({
+        'mathematiques': [resultat('suites', 4.0), resultat('limites', 1.0, 'Limites')],
+        'francais': [resultat('conjugaison', 2.5, 'Conjugaison', 'Le présent.')],
+    })
+    extraits = extraits_pertinents('limite d\'une suite géométrique', moteur, k=2, niveau='terminale')
+    assert [(e['matiere'], e['sujet']) for e in extraits] == [('mathematiques', 'suites'), ('francais', 'conjugaison')]
+    assert moteur.appels == [('francais', 'terminale'), ('mathematiques', 'terminale')]
+    assert 'arithmétique' not in extraits[0]['texte']
+    # Question sans mot significatif : aucune recherche
+    assert extraits_pertinents('le la les', moteur) == [] and len(moteur.appels) == 2
+
+
+def test_bloc_de_contexte():
+    contexte = formater_contexte([{'titre': 'Suites', 'texte': 'Raison q.'}, {'titre': 'Limites', 'texte': 'Infini.'}])
+    assert contexte.startswith('EXTRAITS DES COURS')
+    assert '### Suites\nRaison q.\n\n### Limites\nInfini.' in contexte
+
+
+def test_prompt_court_avec_les_extraits(app_ia, monkeypatch):
+    systeme, nombre = app_ia.prompt_systeme("la dérivée d'un produit de fonctions")
+    assert nombre > 0
+    assert systeme.startswith(app_ia.PROMPT_ESSENTIEL) and '### ' in systeme
+    assert estimer_tokens(systeme) < estimer_tokens(app_ia.PROFESSEUR_PROMPT)
+    assert app_ia.prompt_systeme('le la les') == (app_ia.PROMPT_ESSENTIEL, 0)
+    monkeypatch.setattr(app_ia, 'OPENAI_RAG', False)
+    assert app_ia.prompt_systeme("la dérivée d'un produit de fonctions") == (app_ia.PROFESSEUR_PROMPT, 0)
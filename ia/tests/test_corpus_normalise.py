@@ -0,0 +1,44 @@
+# Corpus normalisé des cours : champs repliés, mots et fréquences calculés une fois, documents inchangés repris
+
+from corpus_normalise import CorpusNormalise
+from normalisation import replier_accents, tokeniser
+
+BASE = {
+    'premiere': {
+        'derivees': {'titre': 'Dérivées', 'contenu': 'La dérivée du produit.\n\nDérivées usuelles.',
+                     'exemples': ['(x²)′ = 2x']},
+        'suites': {'titre': 'Suites', 'contenu': 'Suite géométrique de raison q.', 'exemples': []},
+    },
+}
+
+
+def test_champs_replies_et_frequences():
+    document = CorpusNormalise(BASE).documents[0]
+    assert document.cle == ('premiere', 'derivees')
+    assert document.replie['titre'] == 'derivees'
+    assert document.replie['contenu'] == replier_accents(BASE['premiere']['derivees']['contenu'])
+    mots = tokeniser(document.replie['contenu'])
+    assert document.longueurs['contenu'] == len(mots)
+    assert document.frequences['contenu'] == {mot: mots.count(mot) for mot in mots}
+    assert 'produit' in document.mots_recherche
+
+
+def test_nombre_de_documents_par_mot():
+    corpus = CorpusNormalise(BASE)
+    assert len(corpus) == 2
+    assert corpus.documents_par_mot['suite'] == 1
+    assert all(0 < n <= len(corpus) for n in corpus.documents_par_mot.values())
+
+
+def test_documents_inchanges_repris():
+    precedent = CorpusNormalise(BASE)
+    base = {'premiere': {'nouveau': {'titre': 'Nouveau', 'contenu': 'Texte.', 'exemples': []},
+                         **BASE['premiere'],
+                         'suites': dict(BASE['premiere']['suites'], contenu='Suite arithmétique.')}}
+    corpus = CorpusNormalise(base, precedent=precedent)
+    assert corpus.reutilises == 1
+    derivees = corpus.documents[1]
+    # Même document normalisé, à une autre position du corpus
+    assert derivees.numero == 1 and precedent.documents[0].numero == 0
+    assert derivees.frequences is precedent.documents[0].frequences
+    assert corpus.documents[2].replie['contenu'] == 'suite arithmetique.'
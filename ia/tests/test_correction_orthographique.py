@@ -0,0 +1,25 @@
+# Correction des fautes avant le routage : index de suppressions SymSpell, mots courts et mots connus jamais réécrits
+
+import pytest
+
+from correction_orthographique import IndexSymSpell
+
+
+@pytest.mark.parametrize('faute, correction', [
+    ("conjuguaison", "conjugaison"), ("pluriele", "pluriel"), ("bonjur", "bonjour"), ("adverb", "adverbe"),
+])
+def test_correction_des_fautes(app_ia, faute, correction):
+    assert app_ia.ROUTEUR_DEMO.correcteur.corriger(faute) == correction
+
+
+@pytest.mark.parametrize('mot', ["vent", "rose", "mari", "fils"])
+def test_mots_courts_corrects_jamais_corriges(app_ia, mot):
+    assert app_ia.ROUTEUR_DEMO.correcteur.corriger(mot) == mot
+
+
+def test_mots_connus_jamais_corriges():
+    correcteur = IndexSymSpell({'contraire': 1, 'vert': 1}, mots_connus={'construire'})
+    assert correcteur.corriger('construire') == 'construire'
+    assert correcteur.corriger('contraires') == 'contraire'
+    # 4 lettres : pas de correction, même à une lettre d'un mot du vocabulaire
+    assert correcteur.corriger('vent') == 'vent'
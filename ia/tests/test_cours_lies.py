@@ -0,0 +1,69 @@
+# Graphe des cours liés : voisins les plus proches (cosinus TF-IDF) calculés avec l'index
+
+import pytest
+
+import cours_lies
+from corpus_normalise import CorpusNormalise
+from cours_lies import graphe_cours_lies
+from index_cours import IndexCours, MOTS_VIDES
+
+
+def cours(titre, contenu):
+    return {'titre': titre, 'contenu': contenu, 'exemples': []}
+
+
+BASE = {
+    'seconde': {
+        'second_degre': cours('Second degré', 'Trinôme, discriminant et racines du trinôme.'),
+        'factorisation': cours('Factorisation', 'Factoriser un trinôme à partir de ses racines.'),
+        'vecteurs': cours('Vecteurs', 'Coordonnées d’un vecteur dans un repère.'),
+    },
+    'premiere_stpl': {
+        'repere': cours('Repère', 'Coordonnées d’un point dans un repère orthonormé.'),
+    },
+}
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def calcul(request, monkeypatch):
+    # Même graphe avec ou sans NumPy
+    monkeypatch.setattr(cours_lies, 'NUMPY_DISPONIBLE', request.param and cours_lies.NUMPY_DISPONIBLE)
+
+
+def test_voisins_les_plus_proches(calcul):
+    graphe = graphe_cours_lies(CorpusNormalise(BASE), mots_vides=MOTS_VIDES)
+    assert set(graphe) == {('seconde', 'second_degre'), ('seconde', 'factorisation'), ('seconde', 'vecteurs'),
+                           ('premiere_stpl', 'repere')}
+    assert graphe[('seconde', 'second_degre')][0][:2] == ('seconde', 'factorisation')
+    assert graphe[('seconde', 'vecteurs')][0][:2] == ('premiere_stpl', 'repere')
+    for cle, lies in graphe.items():
+        scores = [score for _, _, score in lies]
+        assert scores == sorted(scores, reverse=True)
+        assert all(score >= cours_lies.SEUIL_SIMILARITE_LIEN for score in scores)
+        assert cle not in [(niveau, sujet) for niveau, sujet, _ in lies]
+
+
+def test_nombre_de_voisins_et_seuil():
+    corpus = CorpusNormalise(BASE)
+    assert all(len(lies) <= 1 for lies in graphe_cours_lies(corpus, voisins=1).values())
+    assert all(lies == () for lies in graphe_cours_lies(corpus, seuil=1.01).values())
+    seul = CorpusNormalise({'seconde': {'vecteurs': BASE['seconde']['vecteurs']}})
+    assert graphe_cours_lies(seul) == {('seconde', 'vecteurs'): ()}
+
+
+def test_cours_lies_de_l_index():
+    index = IndexCours(CorpusNormalise(BASE))
+    lies = index.cours_lies('seconde', 'second_degre')
+    assert lies[0]['sujet'] == 'factorisation'
+    assert lies[0]['cours'] == BASE['seconde']['factorisation']
+    assert index.cours_lies('seconde', 'inconnu') == []
+    # Index sans graphe (partitions par classe)
+    assert IndexCours(CorpusNormalise(BASE), voisins=0).cours_lies('seconde', 'second_degre') == []
+
+
+def test_api_propose_les_cours_lies(client, app_ia):
+    donnees = client.get('/courses/premiere_stpl/derivees').get_json()
+    attendus = app_ia.COURS_MEMOIRE.index('mathematiques').cours_lies('premiere_stpl', 'derivees')
+    assert donnees['cours_lies']
+    assert [lie['sujet'] for lie in donnees['cours_lies']] == [lie['sujet'] for lie in attendus]
+    assert all(lie['lien'] == f"/courses/{lie['niveau']}/{lie['sujet']}" for lie in donnees['cours_lies'])
@@ -0,0 +1,72 @@
+# Moteur par vecteurs de n-grammes : une matrice par version des cours, désignée par les métadonnées
+
+import json
+import os
+
+import numpy as np
+
+import cours_vecteurs
+from cours_vecteurs import MoteurVecteurs, construire
+from moteurs_cours import signature
+
+
+def cours(titre, contenu):
+    return {'titre': titre, 'contenu': contenu, 'exemples': []}
+
+
+VECTEURS = {'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs', 'Coordonnées d’un vecteur.')}}}
+PROBABILITES = {'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs', 'Coordonnées d’un vecteur.'),
+                                              'probabilites': cours('Probabilités', 'Loi de probabilité.')}}}
+
+
+def test_signature_des_cours():
+    assert signature(VECTEURS) == signature(json.loads(json.dumps(VECTEURS)))
+    assert signature(PROBABILITES) != signature(VECTEURS)
+
+
+def test_metadonnees_et_matrice_de_la_meme_version(tmp_path):
+    chemin = str(tmp_path / 'cours_vecteurs.npy')
+    premiere = construire(VECTEURS, chemin)
+    seconde = construire(PROBABILITES, chemin)
+    assert premiere['matrice'] != seconde['matrice']
+    # Un seul fichier de métadonnées, qui désigne la dernière matrice
+    assert MoteurVecteurs.lire_meta(chemin) == json.loads(json.dumps(seconde))
+    matrice = np.load(tmp_path / seconde['matrice'])
+    assert matrice.shape == (len(seconde['lignes']), cours_vecteurs.DIMENSION)
+    # L'ancienne matrice reste le temps que les workers qui l'ont lue la projettent en mémoire
+    assert os.path.exists(tmp_path / premiere['matrice'])
+    assert not list(tmp_path.glob('*.tmp*'))
+
+
+def test_anciennes_matrices_effacees(tmp_path):
+    chemin = str(tmp_path / 'cours_vecteurs.npy')
+    ancienne = tmp_path / construire(VECTEURS, chemin)['matrice']
+    os.utime(ancienne, (0, 0))
+    courante = tmp_path / construire(PROBABILITES, chemin)['matrice']
+    assert not ancienne.exists() and courante.exists()
+    # Une reconstruction de la même version garde sa matrice
+    construire(PROBABILITES, chemin)
+    assert courante.exists()
+
+
+def test_metadonnees_sans_matrice_ignorees(tmp_path):
+    chemin = str(tmp_path / 'cours_vecteurs.npy')
+    meta = construire(VECTEURS, chemin)
+    os.remove(tmp_path / meta['matrice'])
+    assert MoteurVecteurs.lire_meta(chemin) is None
+    # Ancien format : matrice à côté des métadonnées, sans leur nom
+    del meta['matrice']
+    (tmp_path / 'cours_vecteurs.npy.json').write_text(json.dumps(meta), encoding='utf-8')
+    assert MoteurVecteurs.lire_meta(chemin) is None
+
+
+def test_moteur_construit_les_vecteurs_des_cours(tmp_path):
+    chemin = str(tmp_path / 'cours_vecteurs.npy')
+    moteur = MoteurVecteurs(chemin)
+    assert MoteurVecteurs.lire_meta(chemin)['signature'] == signature(
+        {matiere: moteur.base(matiere) for matiere in moteur.modules})
+    resultats = moteur.classer('mathematiques', 'pente de la tangente', k=3, seuil=0.0)
+    assert resultats and all(r['cours'] is moteur.base('mathematiques')[r['niveau']][r['sujet']] for r in resultats)
+    # Vecteurs à jour : un second moteur ne reconstruit rien
+    assert len(list(tmp_path.glob('cours_vecteurs-*.npy'))) == 1
+    assert MoteurVecteurs(chemin).lignes == moteur.lignes
@@ -0,0 +1,52 @@
+# Registre des domaines du mode démo : déclarations par domaine, corps des réponses lus à la demande
+
+import os
+import sys
+import types
+
+import pytest
+
+from domaines_demo import RegistreDomaines, general, grammaire
+from domaines_demo.corps import CorpsReponses
+
+
+def test_corps_lus_a_la_premiere_utilisation(tmp_path):
+    (tmp_path / 'essai').mkdir()
+    (tmp_path / 'essai' / 'bonjour.md').write_text('Bonjour ${prenom} !\n', encoding='utf-8')
+    corps = CorpsReponses('essai', dossier=str(tmp_path))
+    assert corps.charges() == []
+    assert corps.remplir('bonjour', prenom='Awa') == 'Bonjour Awa !'
+    assert corps.charges() == ['bonjour']
+    # Gardé en mémoire : le fichier n'est plus relu
+    os.remove(tmp_path / 'essai' / 'bonjour.md')
+    assert corps.texte('bonjour') == 'Bonjour ${prenom} !'
+
+
+def test_intentions_dans_l_ordre_des_priorites():
+    registre = RegistreDomaines()
+    priorites = [intention['priorite'] for intention in registre.intentions()]
+    assert priorites == sorted(priorites)
+    assert all('mots' in i or 'motif' in i for i in registre.intentions())
+
+
+def test_chaque_reponse_constante_a_son_corps():
+    registre = RegistreDomaines()
+    for intention, (module, _) in registre.declarations.items():
+        if registre.est_constante(intention):
+            assert os.path.exists(module.CORPS.chemin(intention)), intention
+        else:
+            assert registre.reponse_constante(intention) is None
+    assert 'defaut' in registre.personnalisees()
+
+
+def test_intention_declaree_deux_fois(monkeypatch):
+    for nom in ('essai_a', 'essai_b'):
+        module = types.ModuleType(f'domaines_demo.{nom}')
+        module.INTENTIONS = [{'id': 'doublon', 'priorite': 1, 'mots': ['doublon']}]
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+    with pytest.raises(ValueError):
+        RegistreDomaines(('essai_a', 'essai_b'))
+
+
+def test_une_seule_liste_de_mots_du_francais():
+    assert grammaire.LISTES_SECONDAIRES['definition:francais'] is general.LISTES_SECONDAIRES['defaut:francais']
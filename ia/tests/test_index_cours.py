@@ -0,0 +1,48 @@
+# Index inversé des cours : la recherche par sous-chaîne doit donner les mêmes résultats
+# qu'un parcours complet de tous les cours
+
+import pytest
+
+import cours_francais
+import cours_mathematiques
+from index_cours import IndexCours
+from normalisation import replier_accents
+
+MOTS_CLES = ["dérivée", "participe", "ERIV", "loi normale", "é", "verbe du", "xyzzy", "a"]
+
+
+def index_des_bases():
+    return [IndexCours(cours_francais.CORPUS_COURS), IndexCours(cours_mathematiques.CORPUS_COURS_MATHS)]
+
+
+@pytest.mark.parametrize('mot_cle', MOTS_CLES)
+def test_recherche_identique_au_parcours_complet(mot_cle):
+    requete = replier_accents(mot_cle)
+    for index in index_des_bases():
+        attendus = [document.cle for document in index.documents
+                    if any(requete in replier_accents(texte) for texte in
+                           (document.sujet, document.cours['titre'], document.cours['contenu']))]
+        assert [(r['niveau'], r['sujet']) for r in index.rechercher(mot_cle)] == attendus
+
+
+def test_listes_des_mots_croissantes_et_completes():
+    for index in index_des_bases():
+        for mot, numeros in index.postings.items():
+            assert numeros == sorted(set(numeros))
+            assert all(mot in index.documents[numero].mots_recherche for numero in numeros)
+        for document in index.documents:
+            assert all(document.numero in index.postings[mot] for mot in document.mots_recherche)
+
+
+def test_morceaux_de_mots_resolus_une_fois():
+    index = IndexCours(cours_mathematiques.CORPUS_COURS_MATHS)
+    assert 'derivee' in index.mots_pour('eriv', True, True)
+    assert index.mots_pour('deriv', False, True) == tuple(m for m in index.vocabulaire if m.startswith('deriv'))
+    assert index.mots_pour('deriv', False, False) == ()
+    assert ('eriv', True, True) in index.fragments
+
+
+def test_fonctions_de_recherche_des_modules():
+    assert [r['sujet'] for r in cours_mathematiques.rechercher_cours_maths('loi normale')] == \
+        [r['sujet'] for r in cours_mathematiques.INDEX_COURS_MATHS.rechercher('loi normale')]
+    assert cours_francais.rechercher_cours('xyzzy') == []
@@ -0,0 +1,66 @@
+# Traces de routage échantillonnées : agrégats par intention et route /debug/routage réservée à l'administration
+
+import pytest
+
+from instrumentation_routage import InstrumentationRoutage
+
+
+def test_agregats_par_intention():
+    instrumentation = InstrumentationRoutage(1.0)
+    assert instrumentation.echantillonner()
+    instrumentation.enregistrer('salutation', 10, 300, 700, 'chaine')
+    instrumentation.enregistrer('salutation', 4, 100, 0, 'cache')
+    instrumentation.enregistrer('maths', 30, 5000, 3000, 'chaine')
+    statistiques = instrumentation.statistiques()
+    assert statistiques['requetes_mesurees'] == 3
+    assert statistiques['classement'] == ['maths', 'salutation']
+    salutation = statistiques['intentions']['salutation']
+    assert salutation['comparaisons_moyennes'] == 7
+    assert salutation['ns_max'] == 1000
+    # 1000 ns < 2^10, 100 ns < 2^7
+    assert salutation['histogramme_ns'] == {'<128': 1, '<1024': 1}
+    assert salutation['sources'] == {'chaine': 1, 'cache': 1}
+    instrumentation.reinitialiser()
+    assert instrumentation.statistiques()['requetes_mesurees'] == 0
+
+
+def test_taux_nul_jamais_echantillonne():
+    instrumentation = InstrumentationRoutage(0.0)
+    assert not instrumentation.active
+    assert not any(instrumentation.echantillonner() for _ in range(100))
+
+
+@pytest.fixture
+def instrumentation(app_ia, monkeypatch):
+    instrumentation = InstrumentationRoutage(1.0)
+    monkeypatch.setattr(app_ia, 'INSTRUMENTATION_DEMO', instrumentation)
+    return instrumentation
+
+
+def test_routage_mesure(app_ia, instrumentation):
+    app_ia.CACHE_DEMO.vider()
+    app_ia.router_demo("un adverbe")
+    app_ia.router_demo("un adverbe")
+    adverbe = instrumentation.statistiques()['intentions']['adverbe']
+    assert adverbe['requetes'] == 2
+    assert adverbe['sources'] == {'chaine': 1, 'cache': 1}
+
+
+@pytest.mark.parametrize('entetes', [{}, {'X-Admin-Token': 'mauvais'}, {'X-Admin-Token': 'é'}])
+def test_debug_routage_reserve_a_l_administration(client, instrumentation, entetes):
+    reponse = client.get('/debug/routage', headers=entetes)
+    assert reponse.status_code == 403
+    assert 'routage' not in reponse.get_json()
+
+
+def test_debug_routage_avec_le_jeton(client, instrumentation, admin):
+    client.post('/chat', json={'message': 'bonjour'})
+    donnees = client.get('/debug/routage', headers=admin).get_json()
+    assert donnees['routage']['requetes_mesurees'] >= 1
+    assert client.delete('/debug/routage', headers=admin).status_code == 200
+    assert instrumentation.statistiques()['requetes_mesurees'] == 0
+
+
+def test_debug_routage_sans_jeton_configure(client, app_ia, instrumentation, admin, monkeypatch):
+    monkeypatch.setattr(app_ia, 'IA_ADMIN_TOKEN', None)
+    assert client.get('/debug/routage', headers=admin).status_code == 404
@@ -0,0 +1,30 @@
+# Lexique des maths pondéré par IDF : un mot courant des cours ne suffit pas seul à choisir l'intention maths
+
+import pytest
+
+from domaines_demo.mathematiques import LEXIQUE_MATHS
+from normalisation import normaliser_message
+
+# Phrases courantes qui contiennent un mot des cours de maths
+PAS_MATHS = [
+    "le terme de l'année",
+    "je prends le sin",
+    "tout de suite",
+    "à long terme",
+    "j'ai tant de travail",
+    "il a raison",
+    "la raison de mon retard",
+    "rendez-vous le 12/05",
+]
+
+
+@pytest.mark.parametrize('message', PAS_MATHS)
+def test_phrases_courantes_hors_maths(app_ia, message):
+    assert app_ia.ROUTEUR_DEMO.choisir(message) != 'maths'
+
+
+def test_aucun_mot_court_du_lexique_ne_suffit_seul():
+    for mot in ('terme', 'suite', 'raison', 'sin', 'tan', 'ln', 'loi'):
+        assert not LEXIQUE_MATHS.accepte(normaliser_message(mot)), mot
+    assert LEXIQUE_MATHS.accepte(normaliser_message('dérivée'))
+    assert LEXIQUE_MATHS.accepte(normaliser_message('raison de la suite'))
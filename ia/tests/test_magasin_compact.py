@@ -0,0 +1,52 @@
+# Magasin compact : textes compressés bout à bout, décompressés à la demande derrière un cache LRU
+
+import gc
+import weakref
+
+from magasin_compact import MagasinCompact
+from paquets_cours import PaquetsCours
+
+TEXTES = [('terminale/derivees', '**Définition :**\nf′(a) = lim (f(a+h) − f(a)) / h\n' * 20),
+          ('terminale/suites', 'Suite géométrique de raison q.\n' * 20)]
+
+
+def test_textes_relus_a_l_identique():
+    magasin = MagasinCompact(TEXTES)
+    assert len(magasin) == 2
+    assert [magasin.lire(cle) for cle, _ in TEXTES] == [texte for _, texte in TEXTES]
+    rapport = magasin.rapport()
+    assert rapport['octets_compresses'] < rapport['octets_bruts'] / 2
+
+
+def test_lecture_derriere_le_cache_lru():
+    magasin = MagasinCompact(TEXTES, lru_entrees=1)
+    magasin.lire('terminale/derivees')
+    magasin.lire('terminale/derivees')
+    assert magasin.chauds.succes == 1
+    magasin.lire('terminale/suites')
+    assert magasin.chauds.evictions == 1
+    # Les copies décompressées gardées par le cache ne comptent pas comme économisées
+    rapport = magasin.rapport()
+    assert rapport['octets_economises'] == rapport['octets_bruts'] - rapport['octets_compresses'] - rapport['lru']['octets']
+
+
+def test_magasin_des_paquets_libere_apres_une_nouvelle_version(tmp_path):
+    chemin = str(tmp_path / 'versions.json')
+    cours = {'titre': 'Suites', 'contenu': 'Raison q.', 'exemples': []}
+    ancien = PaquetsCours({'mathematiques': {'terminale': {'suites': cours}}}, chemin=chemin)
+    magasin = weakref.ref(ancien.fragments)
+    nouveau = PaquetsCours({'mathematiques': {'terminale': {'suites': cours, 'limites': dict(cours, titre='Limites')}}},
+                           precedent=ancien, chemin=chemin)
+    assert nouveau.reutilisees == 1
+    del ancien
+    gc.collect()
+    # Chaque version a son propre magasin : celui de l'ancienne disparaît avec elle
+    assert magasin() is None
+
+
+def test_rapport_par_worker(client, admin):
+    assert client.get('/debug/memoire').status_code == 403
+    memoire = client.get('/debug/memoire', headers=admin).get_json()['memoire']
+    assert set(memoire) == {'sections', 'api_cours', 'paquets', 'total_octets_economises'}
+    assert memoire['total_octets_economises'] == sum(
+        partie['octets_economises'] for nom, partie in memoire.items() if nom != 'total_octets_economises')
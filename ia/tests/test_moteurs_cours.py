@@ -0,0 +1,129 @@
+# Moteurs de recherche des cours autres que l'index en mémoire
+
+import os
+
+import pytest
+
+import cours_postgres
+from cours_postgres import MoteurPostgres, charger
+from cours_sqlite import MoteurSQLite, construire, construire_version, signature_fichier
+
+
+def cours(titre, contenu):
+    return {'titre': titre, 'contenu': contenu, 'exemples': []}
+
+
+def test_sqlite_rouvert_apres_reconstruction(tmp_path):
+    chemin = str(tmp_path / 'cours.sqlite')
+    construire({'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs', 'Coordonnées d’un vecteur.')}}}, chemin)
+    moteur = MoteurSQLite(chemin)
+    assert [r['sujet'] for r in moteur.rechercher('mathematiques', 'vecteur')] == ['vecteurs']
+    assert moteur.rechercher('mathematiques', 'probabilit') == []
+
+    construire({'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs', 'Coordonnées d’un vecteur.'),
+                                              'probabilites': cours('Probabilités', 'Loi de probabilité.')}}},
+               chemin)
+    assert [r['sujet'] for r in moteur.rechercher('mathematiques', 'probabilit')] == ['probabilites']
+    assert [r['sujet'] for r in moteur.classer('mathematiques', 'loi de probabilité', seuil=0.0)] == ['probabilites']
+
+
+def test_rechargement_recompile_le_moteur_configure(tmp_path, monkeypatch):
+    import moteurs_cours
+    chemin = str(tmp_path / 'cours.sqlite')
+    construire({'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs', 'Coordonnées d’un vecteur.')}}}, chemin)
+    moteur = MoteurSQLite(chemin)
+    monkeypatch.setattr(moteurs_cours, '_moteur', moteur)
+
+    bases = {'mathematiques': {'seconde': {'probabilites': cours('Probabilités', 'Loi de probabilité.')}}}
+    assert moteurs_cours.recharger(bases) is moteur
+    assert [r['sujet'] for r in moteur.rechercher('mathematiques', 'probabilit')] == ['probabilites']
+    assert moteur.rechercher('mathematiques', 'vecteur') == []
+
+
+def test_sqlite_compile_une_fois_par_version(tmp_path):
+    chemin = str(tmp_path / 'cours.sqlite')
+    bases = {'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs', 'Coordonnées d’un vecteur.')}}}
+    assert signature_fichier(chemin) is None
+    assert construire_version(bases, chemin)
+    inode = os.stat(chemin).st_ino
+    # Les autres workers trouvent le fichier à jour : rien à recompiler
+    assert not construire_version(bases, chemin)
+    MoteurSQLite(chemin).recharger(bases)
+    assert os.stat(chemin).st_ino == inode
+    bases['mathematiques']['seconde']['probabilites'] = cours('Probabilités', 'Loi de probabilité.')
+    assert construire_version(bases, chemin)
+    assert os.stat(chemin).st_ino != inode
+
+
+def test_moteur_non_mis_a_jour_remplace_par_la_memoire(monkeypatch):
+    import moteurs_cours
+
+    class MoteurEnPanne:
+        def recharger(self, bases):
+            raise ConnectionError('base injoignable')
+
+    monkeypatch.setattr(moteurs_cours, '_moteur', MoteurEnPanne())
+    assert isinstance(moteurs_cours.recharger({}), moteurs_cours.MoteurMemoire)
+
+
+class CurseurNote:
+    """Curseur psycopg2 qui note les requêtes exécutées"""
+
+    def __init__(self, requetes):
+        self.requetes = requetes
+
+    def execute(self, sql, parametres=None):
+        self.requetes.append(sql)
+
+    def close(self):
+        pass
+
+
+class ConnexionNotee:
+    def __init__(self):
+        self.requetes = []
+        self.validee = False
+
+    def cursor(self):
+        return CurseurNote(self.requetes)
+
+    def commit(self):
+        self.validee = True
+
+
+def test_chargement_postgres_incremente_la_version():
+    connexion = ConnexionNotee()
+    assert charger(connexion, {'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs', 'Coordonnées.')}}}) == 1
+    assert connexion.validee
+    # Un seul écrivain à la fois, et la version dans la même transaction que les cours
+    assert 'LOCK TABLE cours_ia_version' in connexion.requetes[1]
+    assert connexion.requetes[-1] is cours_postgres.VERSION_SQL
+
+
+def moteur_postgres(monkeypatch, lignes):
+    moteur = MoteurPostgres.__new__(MoteurPostgres)
+    monkeypatch.setattr(moteur, 'executer', lambda sql, parametres: lignes)
+    return moteur
+
+
+def test_rechargement_postgres_n_ecrit_pas_la_table(monkeypatch):
+    def connecter(url):
+        raise AssertionError('un worker ne doit pas écrire cours_ia')
+
+    monkeypatch.setattr(cours_postgres.psycopg2, 'connect', connecter)
+    moteur = moteur_postgres(monkeypatch, [])
+    assert moteur.recharger({'mathematiques': {}}) is moteur
+
+
+def test_cours_lus_dans_postgres(monkeypatch):
+    moteur = moteur_postgres(monkeypatch, [
+        (7, 'mathematiques', 'seconde', 'vecteurs', 'Vecteurs', 'Coordonnées.', []),
+        (7, 'mathematiques', 'seconde', 'probabilites', 'Probabilités', 'Loi.', ['P(A)']),
+    ])
+    version, bases = moteur.lire()
+    assert version == 7
+    assert list(bases['mathematiques']['seconde']) == ['vecteurs', 'probabilites']
+    assert bases['mathematiques']['seconde']['probabilites'] == {
+        'titre': 'Probabilités', 'contenu': 'Loi.', 'exemples': ['P(A)']}
+    with pytest.raises(RuntimeError):
+        moteur_postgres(monkeypatch, []).lire()
@@ -0,0 +1,58 @@
+# Taxonomie des niveaux (CP → Terminale) et index des cours par classe
+
+import pytest
+
+import cours_francais
+import cours_mathematiques
+from moteurs_cours import MoteurMemoire
+from niveaux import NIVEAUX, cles_exclues, cles_pour, classes_du_cours, normaliser_niveau, voisins
+
+
+@pytest.mark.parametrize('saisie, classe', [
+    ('2nde', 'seconde'), ('Première STPL', 'premiere'), ('6ème', '6e'), ('CM 1', 'cm1'),
+    ('Tle', 'terminale'), ('niveau_seconde', None), ('licence', None), ('', None), (None, None),
+])
+def test_normaliser_niveau(saisie, classe):
+    assert normaliser_niveau(saisie) == classe
+
+
+def test_voisins_aux_bords():
+    assert voisins('cp') == ('cp', 'ce1')
+    assert voisins('terminale') == ('premiere', 'terminale')
+    assert voisins('3e', ecart=2) == ('5e', '4e', '3e', 'seconde', 'premiere')
+
+
+def test_cles_de_la_classe_et_de_ses_voisines():
+    cles = list(cours_mathematiques.COURS_MATHEMATIQUES)
+    assert cles_pour('mathematiques', 'seconde', cles) == ['seconde', 'premiere_stpl']
+    assert cles_pour('mathematiques', '6e', cles) == []
+    assert cles_pour('francais', '6e', list(cours_francais.COURS_FRANCAIS)) == ['niveau_intermediaire']
+    # Une clé non rattachée couvre toutes les classes
+    assert classes_du_cours('francais', 'niveau_inconnu') == NIVEAUX
+    assert cles_pour('francais', 'cp', ['niveau_inconnu']) == ['niveau_inconnu']
+
+
+def test_cles_exclues_des_moteurs_sql():
+    assert cles_exclues('mathematiques', '2nde') == ['terminale_stpl']
+    assert cles_exclues('mathematiques', None) == []
+    assert cles_exclues('mathematiques', 'licence') == []
+
+
+def test_partitions_partagees_entre_classes_aux_memes_cours():
+    partitions = cours_mathematiques.PARTITIONS_COURS_MATHS
+    seconde = partitions.get('seconde')
+    assert {document.niveau for document in seconde.corpus} == {'seconde', 'premiere_stpl'}
+    assert partitions.get('cp') is partitions.get('6e')
+    assert len(partitions.get('cp')) == 0
+    assert partitions.get('licence') is None
+    # Documents normalisés repris du corpus complet
+    complet = {document.cle: document for document in cours_mathematiques.CORPUS_COURS_MATHS}
+    assert all(document.frequences is complet[document.cle].frequences for document in seconde.corpus)
+
+
+def test_classement_limite_a_la_classe():
+    moteur = MoteurMemoire()
+    tous = moteur.classer('mathematiques', 'limite de fonction', k=20, seuil=0.0)
+    assert any(r['niveau'] == 'terminale_stpl' for r in tous)
+    seconde = moteur.classer('mathematiques', 'limite de fonction', k=20, seuil=0.0, niveau='2nde')
+    assert seconde and all(r['niveau'] != 'terminale_stpl' for r in seconde)
@@ -0,0 +1,90 @@
+# Paquets hors ligne versionnés : différences entre versions (ajouts, modifications, suppressions)
+
+import json
+import os
+
+from paquets_cours import PaquetsCours
+
+
+def cours(titre, contenu='Contenu.'):
+    return {'titre': titre, 'contenu': contenu, 'exemples': []}
+
+
+def lire(corps):
+    """Données JSON d'un corps pré-sérialisé (variante non compressée)"""
+    return json.loads(corps.variante('')[1])
+
+
+BASE_1 = {'francais': {'niveau_debutant': {'alphabet': cours('Alphabet'), 'accents': cours('Accents')}},
+          'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs')}}}
+BASE_2 = {'francais': {'niveau_debutant': {'alphabet': cours('Alphabet', 'Les 26 lettres.'),
+                                           'articles': cours('Articles')}},
+          'mathematiques': {'seconde': {'vecteurs': cours('Vecteurs')}}}
+
+
+def test_delta_depuis_une_version_publiee(tmp_path):
+    chemin = str(tmp_path / 'versions.json')
+    v1 = PaquetsCours(BASE_1, chemin=chemin)
+    v2 = PaquetsCours(BASE_2, precedent=v1, chemin=chemin)
+    assert v1.version != v2.version
+    assert v2.reutilisees == 1
+
+    delta = lire(v2.delta(v1.version))
+    assert delta['complet'] is False
+    assert delta['depuis'] == v1.version and delta['version'] == v2.version
+    assert delta['ajoutes'] == ['niveau_debutant/articles']
+    assert delta['modifies'] == ['niveau_debutant/alphabet']
+    assert delta['supprimes'] == ['niveau_debutant/accents']
+    assert set(delta['lecons']) == {'niveau_debutant/articles', 'niveau_debutant/alphabet'}
+    assert delta['lecons']['niveau_debutant/alphabet']['cours']['contenu'] == 'Les 26 lettres.'
+    assert delta['lecons']['niveau_debutant/alphabet']['empreinte'] == v2.empreintes['niveau_debutant/alphabet']
+
+
+def test_delta_vide_depuis_la_version_courante(tmp_path):
+    paquets = PaquetsCours(BASE_1, chemin=str(tmp_path / 'versions.json'))
+    delta = lire(paquets.delta(paquets.version))
+    assert (delta['lecons'], delta['ajoutes'], delta['modifies'], delta['supprimes']) == ({}, [], [], [])
+
+
+def test_version_inconnue_recoit_le_paquet_complet(tmp_path):
+    paquets = PaquetsCours(BASE_2, chemin=str(tmp_path / 'versions.json'))
+    complet = lire(paquets.delta('inconnue'))
+    assert complet['complet'] is True
+    assert set(complet['lecons']) == {'niveau_debutant/alphabet', 'niveau_debutant/articles', 'seconde/vecteurs'}
+    assert complet == lire(paquets.paquet)
+
+
+def test_versions_gardees_apres_redemarrage(tmp_path):
+    chemin = str(tmp_path / 'versions.json')
+    v1 = PaquetsCours(BASE_1, chemin=chemin)
+    PaquetsCours(BASE_2, chemin=chemin)
+    # Nouveau worker : les versions publiées sont relues, le delta depuis v1 reste possible
+    redemarre = PaquetsCours(BASE_2, chemin=chemin)
+    assert lire(redemarre.delta(v1.version))['complet'] is False
+
+
+def test_endpoints_du_paquet(client, app_ia):
+    manifeste = client.get('/courses/paquet').get_json()
+    assert manifeste['version'] == app_ia.PAQUETS_COURS.version
+    assert len(manifeste['lecons']) == len(app_ia.PAQUETS_COURS)
+    delta = client.get(f"/courses/paquet/delta?depuis={manifeste['version']}").get_json()
+    assert delta['lecons'] == {} and delta['complet'] is False
+    hors_ligne = client.get('/courses/paquet/hors-ligne', headers={'Accept-Encoding': 'gzip'})
+    assert hors_ligne.headers['Content-Encoding'] == 'gzip'
+    assert 'attachment' in hors_ligne.headers['Content-Disposition']
+
+
+def test_version_deja_publiee_non_reecrite(tmp_path, monkeypatch):
+    import paquets_cours
+    chemin = str(tmp_path / 'donnees' / 'versions.json')
+    PaquetsCours(BASE_1, chemin=chemin)
+    # Le dossier de données est créé à la première publication
+    assert os.path.exists(chemin)
+    ecritures = []
+    monkeypatch.setattr(paquets_cours, 'ecrire_versions', lambda *args: ecritures.append(args))
+    # Autre worker ou redémarrage sans modification des cours : le fichier n'est pas réécrit
+    assert PaquetsCours(BASE_1, chemin=chemin).versions
+    assert ecritures == []
+    PaquetsCours(BASE_2, chemin=chemin)
+    assert len(ecritures) == 1
+
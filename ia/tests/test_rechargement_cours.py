@@ -0,0 +1,128 @@
+# Rechargement à chaud des cours : moteur de recherche, lexique des maths et routeur mis à jour
+
+import cours_mathematiques
+from rechargement_cours import MODULES_COURS, RechargementCours
+
+QUESTION = "c'est quoi un hyperboloïde"
+
+
+def cours(titre, contenu):
+    return {'titre': titre, 'contenu': contenu, 'exemples': []}
+
+
+def ecrire_base(chemin, base):
+    chemin.write_text(f'COURS_MATHEMATIQUES = {base!r}\n', encoding='utf-8')
+    return str(chemin)
+
+
+def test_nouveau_cours_de_maths_route_et_trouve(app_ia, tmp_path, monkeypatch):
+    originale = {niveau: {sujet: dict(contenu) for sujet, contenu in sujets.items()}
+                 for niveau, sujets in cours_mathematiques.COURS_MATHEMATIQUES.items()}
+    nouvelle = {niveau: dict(sujets) for niveau, sujets in originale.items()}
+    nouvelle['terminale_stpl']['hyperboloides'] = cours(
+        'Hyperboloïdes', "Un hyperboloïde est une surface du second degré. Équation d'un hyperboloïde.")
+    nouvelle['terminale_stpl']['quadriques'] = cours(
+        'Quadriques', "Ellipsoïde, paraboloïde et hyperboloïde sont des quadriques.")
+    fichiers = {'mathematiques': ecrire_base(tmp_path / 'nouvelle.py', nouvelle)}
+
+    rechargement = RechargementCours(app_ia.apres_rechargement_cours)
+    monkeypatch.setattr(rechargement, 'chemin',
+                        lambda matiere: fichiers.get(matiere) or rechargement.modules[matiere].__file__)
+    assert app_ia.router_demo(QUESTION)[0] != 'maths'
+    try:
+        resultats = rechargement.recharger()
+        assert resultats['mathematiques']['ajoutes'] == ['terminale_stpl/hyperboloides', 'terminale_stpl/quadriques']
+        assert 'hyperboloide' in app_ia.domaine_maths.LEXIQUE_MATHS.poids
+        intention, reponse = app_ia.router_demo(QUESTION)
+        assert intention == 'maths' and 'Hyperboloïdes' in reponse
+        assert app_ia.ROUTEUR_LOT_DEMO.router([QUESTION]) == ['maths']
+    finally:
+        # Retour aux cours d'origine pour les autres tests
+        fichiers['mathematiques'] = ecrire_base(tmp_path / 'originale.py', originale)
+        rechargement.recharger()
+    assert cours_mathematiques.COURS_MATHEMATIQUES == originale
+    assert app_ia.router_demo(QUESTION)[0] != 'maths'
+
+
+def test_bases_en_memoire():
+    bases = RechargementCours().bases()
+    assert set(bases) == set(MODULES_COURS)
+    assert bases['mathematiques'] is cours_mathematiques.COURS_MATHEMATIQUES
+
+
+class SourceCours:
+    """Source des cours comme la table cours_ia : une version et les bases de cette version"""
+
+    def __init__(self, version, bases):
+        self.numero = version
+        self.bases = bases
+
+    def version(self):
+        return self.numero
+
+    def lire(self):
+        return self.numero, self.bases
+
+
+def test_cours_relus_dans_la_source_quand_sa_version_change():
+    import cours_francais
+    originale = {niveau: {sujet: dict(contenu) for sujet, contenu in sujets.items()}
+                 for niveau, sujets in cours_francais.COURS_FRANCAIS.items()}
+    niveau, sujets = next(iter(originale.items()))
+    sujet = next(iter(sujets))
+    source = SourceCours(1, {'francais': originale})
+    rechargement = RechargementCours(source=source)
+    assert rechargement.modifies() == list(MODULES_COURS)
+    try:
+        # Mêmes cours que les fichiers ; les maths, absentes de la source, sont gardées
+        resultats = rechargement.recharger()
+        assert not any(resultats['francais'].values()) and not any(resultats['mathematiques'].values())
+        assert rechargement.modifies() == []
+
+        modifiee = {n: dict(s) for n, s in originale.items()}
+        modifiee[niveau][sujet] = dict(originale[niveau][sujet], contenu='Contenu publié dans la table.')
+        source.numero, source.bases = 2, {'francais': modifiee}
+        assert rechargement.modifies() == list(MODULES_COURS)
+        assert rechargement.recharger()['francais']['modifies'] == [f'{niveau}/{sujet}']
+        assert cours_francais.COURS_FRANCAIS[niveau][sujet]['contenu'] == 'Contenu publié dans la table.'
+    finally:
+        source.numero, source.bases = 3, {'francais': originale}
+        rechargement.recharger()
+    assert cours_francais.COURS_FRANCAIS == originale
+
+
+def test_rechargement_annonce_aux_autres_workers(tmp_path, monkeypatch):
+    annonce = str(tmp_path / 'cours_rechargement')
+    worker_admin = RechargementCours(annonce=annonce, intervalle_annonce=0)
+    autre_worker = RechargementCours(annonce=annonce, intervalle_annonce=0)
+    recharges = []
+    monkeypatch.setattr(autre_worker, 'recharger', lambda: recharges.append('autre') or {})
+    assert autre_worker.verifier_annonce() is None
+
+    worker_admin.annoncer()
+    assert autre_worker.verifier_annonce() == {}
+    # Une annonce ne recharge qu'une fois, et pas le worker qui l'a faite
+    assert autre_worker.verifier_annonce() is None
+    assert worker_admin.verifier_annonce() is None
+    assert recharges == ['autre']
+    worker_admin.annoncer()
+    assert autre_worker.verifier_annonce() == {} and recharges == ['autre', 'autre']
+
+
+def test_annonce_verifiee_au_plus_une_fois_par_intervalle(tmp_path, monkeypatch):
+    annonce = str(tmp_path / 'cours_rechargement')
+    worker = RechargementCours(annonce=annonce, intervalle_annonce=3600)
+    monkeypatch.setattr(worker, 'recharger', lambda: {})
+    assert worker.verifier_annonce() is None
+    RechargementCours(annonce=annonce).annoncer()
+    assert worker.verifier_annonce() is None
+
+
+def test_route_d_administration_annonce_le_rechargement(app_ia, client, admin):
+    rechargement = app_ia.RECHARGEMENT_COURS
+    avant = rechargement.etat_annonce()
+    reponse = client.post('/admin/cours/recharger', headers=admin)
+    assert reponse.status_code == 200
+    assert rechargement.etat_annonce() not in (None, avant)
+    # Le worker qui a annoncé ne recharge pas une seconde fois
+    assert rechargement.annonce_vue == rechargement.etat_annonce()
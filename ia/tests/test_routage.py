@@ -0,0 +1,57 @@
+# Routage du mode démo : automate d'Aho-Corasick et priorités des intentions
+
+import pytest
+
+from routeur_demo import AutomateMotsCles
+
+CAS = [
+    ("bonjour", "salutation"),
+    ("salut, ça va ?", "salutation"),
+    ("merci beaucoup", "remerciement"),
+    ("c'est quoi un verbe", "verbe"),
+    ("le pluriel de cheval", "pluriel"),
+    ("un adverbe", "adverbe"),
+    ("les jours de la semaine", "jours"),
+    ("quelle est la dérivée de x²", "maths"),
+    ("calcule l'intégrale de 0 à 1", "maths"),
+    ("loi normale", "maths"),
+    ("combien fait 12 × 7", "maths"),
+    ("y' = ay", "maths"),
+    ("la suite arithmétique de raison 3", "maths"),
+    ("c'est quoi une intégrale", "maths"),
+    # Faute d'orthographe corrigée avant le routage
+    ("conjuguaison du verbe etre", "verbe"),
+]
+
+
+@pytest.mark.parametrize('message, intention', CAS)
+def test_intention_choisie(app_ia, message, intention):
+    assert app_ia.ROUTEUR_DEMO.choisir(message) == intention
+
+
+# Plusieurs intentions trouvées dans le même message : la première dans l'ordre des priorités l'emporte
+PLUSIEURS = [
+    ("bonjour, c'est quoi un verbe", "salutation"),
+    ("merci, le pluriel de cheval", "remerciement"),
+    ("un adverbe et un verbe", "verbe"),
+    ("le pluriel du verbe", "verbe"),
+]
+
+
+@pytest.mark.parametrize('message, intention', PLUSIEURS)
+def test_priorite_entre_intentions_trouvees(app_ia, message, intention):
+    assert app_ia.ROUTEUR_DEMO.choisir(message) == intention
+
+
+def test_automate_trouve_les_memes_motifs_qu_une_recherche_naive():
+    motifs = {('a', 'b'): {'ab'}, ('b',): {'b'}, ('b', 'c', 'd'): {'bcd'}, ('c',): {'c'}, ('a', 'b', 'c', 'e'): {'abce'}}
+    automate = AutomateMotsCles(motifs)
+    for sequence in (['a', 'b', 'c', 'd'], ['a', 'b', 'c', 'e'], ['x', 'a', 'a', 'b'], ['c'], [], ['b', 'c', 'x', 'd']):
+        attendues = {
+            etiquette
+            for motif, etiquettes in motifs.items()
+            for debut in range(len(sequence) - len(motif) + 1)
+            if tuple(sequence[debut:debut + len(motif)]) == motif
+            for etiquette in etiquettes
+        }
+        assert automate.rechercher(sequence) == attendues
@@ -0,0 +1,71 @@
+# Routage par lot du mode démo : mêmes intentions que le routage message par message, lecture de l'historique,
+# route /demo/lot réservée à l'administration
+
+import pytest
+
+from routage_lot import RouteurLot, lire_historique
+
+MESSAGES = [
+    "bonjour", "merci beaucoup", "c'est quoi un verbe", "le pluriel de cheval", "les jours de la semaine",
+    "quelle est la dérivée de x²", "combien fait 12 × 7", "y' = ay", "conjugue le verbe finir au futur",
+    "conjuguaison du verbe etre", "il a raison", "tout de suite", "je prends le sin",
+]
+
+
+def test_routage_par_lot_identique_au_routage_unitaire(app_ia):
+    messages = MESSAGES + ["bonjour", "", "combien de jours dans une semaine ?"]
+    lot = RouteurLot(app_ia.ROUTEUR_DEMO).router(messages)
+    assert lot == [app_ia.ROUTEUR_DEMO.choisir(message) for message in messages]
+
+
+def test_lot_reserve_a_l_administration(client):
+    assert client.post('/demo/lot', json={'messages': ['bonjour']}).status_code == 403
+
+
+def test_lot_avec_le_jeton(client, admin):
+    reponse = client.post('/demo/lot', json={'messages': ['bonjour', 'bonjour', 'merci']}, headers=admin)
+    donnees = reponse.get_json()
+    assert donnees['intentions'] == ['salutation', 'salutation', 'remerciement']
+    assert donnees['repartition'] == {'salutation': 2, 'remerciement': 1}
+
+
+def test_lot_trop_grand(client, app_ia, admin):
+    messages = ['bonjour'] * (app_ia.DEMO_LOT_MAX + 1)
+    assert app_ia.DEMO_LOT_MAX <= 100
+    assert client.post('/demo/lot', json={'messages': messages}, headers=admin).status_code == 413
+
+
+class CurseurEnregistreur:
+    def __init__(self, requetes):
+        self.requetes = requetes
+
+    def execute(self, requete):
+        self.requetes.append(requete)
+
+    def __iter__(self):
+        return iter([("bonjour",)])
+
+    def close(self):
+        pass
+
+
+class ConnexionEnregistreuse:
+    def __init__(self):
+        self.requetes = []
+
+    def cursor(self, name=None):
+        return CurseurEnregistreur(self.requetes)
+
+
+def test_historique_nom_de_table_en_identifiant():
+    from psycopg2 import sql
+    connexion = ConnexionEnregistreuse()
+    assert list(lire_historique(connexion, ('messages',))) == [('messages', 'bonjour')]
+    assert sql.Identifier('messages') in connexion.requetes[0].seq
+
+
+def test_historique_refuse_une_table_inconnue():
+    connexion = ConnexionEnregistreuse()
+    with pytest.raises(ValueError):
+        list(lire_historique(connexion, ('messages; DROP TABLE sessions',)))
+    assert connexion.requetes == []
@@ -0,0 +1,58 @@
+# Sections des cours : découpage aux intertitres en gras, section qui répond à la question
+
+from corpus_normalise import CorpusNormalise
+from index_cours import IndexCours
+from sections_cours import decouper, lien_cours, passage
+
+COURS = {
+    'titre': 'Dérivées',
+    'contenu': ("Introduction aux dérivées.\n\n"
+                "**Dérivées usuelles :**\n(x²)′ = 2x et (√x)′ = 1/(2√x).\n\n"
+                "**Dérivée d'un produit :**\n(uv)′ = u′v + uv′.\n"),
+    'exemples': [],
+}
+
+
+def test_sections_aux_intertitres():
+    sections = decouper('premiere_stpl', 'derivees', COURS)
+    assert [(s.id, s.titre) for s in sections] == [
+        ('premiere_stpl/derivees#0', 'Dérivées'),
+        ('premiere_stpl/derivees#1', 'Dérivées usuelles'),
+        ('premiere_stpl/derivees#2', "Dérivée d'un produit"),
+    ]
+    # Positions dans le contenu, espaces de bord exclus : pas de copie du texte
+    assert sections[0].texte == 'Introduction aux dérivées.'
+    assert sections[2].texte == "**Dérivée d'un produit :**\n(uv)′ = u′v + uv′."
+    assert sections[2].octets == len(sections[2].texte.encode('utf-8'))
+    assert sections[2].mots['produit'] == 2
+    assert set(sections[1].resume()) == {'id', 'numero', 'titre', 'tokens', 'octets'}
+
+
+def test_contenu_sans_intertitre():
+    sections = decouper('seconde', 'vecteurs', {'titre': 'Vecteurs', 'contenu': 'Coordonnées.', 'exemples': []})
+    assert [(s.numero, s.texte) for s in sections] == [(0, 'Coordonnées.')]
+    assert decouper('seconde', 'vide', {'titre': 'Vide', 'contenu': '', 'exemples': []}) == []
+
+
+def test_passage_complete_les_sections_courtes():
+    sections = decouper('premiere_stpl', 'derivees', COURS)
+    assert passage(sections, sections[1], octets_min=0) == sections[1].texte
+    assert passage(sections, sections[1]) == sections[1].texte + '\n\n' + sections[2].texte
+
+
+def test_section_qui_repond_a_la_question():
+    index = IndexCours(CorpusNormalise({'premiere_stpl': {'derivees': COURS}}))
+    assert index.section("dérivée d'un produit", 'premiere_stpl', 'derivees').numero == 2
+    assert index.section('racine carrée usuelle', 'premiere_stpl', 'derivees').numero == 1
+    # Aucun mot en commun : première section ; cours inconnu : None
+    assert index.section('conjugaison', 'premiere_stpl', 'derivees').numero == 0
+    assert index.section('produit', 'seconde', 'inconnu') is None
+
+
+def test_api_d_une_section(client, app_ia):
+    document = app_ia.COURS_MEMOIRE.index('mathematiques').document('seconde', 'nombres_et_calculs')
+    section = document.sections[-1]
+    donnees = client.get(f'/courses/seconde/nombres_et_calculs?section={section.numero}').get_json()
+    assert donnees['matiere'] == 'mathematiques'
+    assert donnees['section']['id'] == section.id and donnees['section']['texte'] == section.texte
+    assert donnees['cours'] == lien_cours('seconde', 'nombres_et_calculs') == '/courses/seconde/nombres_et_calculs'